@@ -0,0 +1,69 @@
+import sys
+import os
+import json
+import argparse
+
+from stock_data_cli.src.benchmark.suite import BenchmarkSuite, FORMATS
+from stock_data_cli.src.returns.parallel_adjusted import MODES
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'baseline.json')
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark loaders, savers and adjustments on synthetic data')
+    parser.add_argument('--tickers', type=int, default=200, help='Number of synthetic tickers (default: 200)')
+    parser.add_argument('--years', type=int, default=5, help='Years of daily bars per ticker (default: 5)')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed of the generator (default: 0)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per case; the fastest is kept (default: 3)')
+    parser.add_argument('--formats', type=str, help=f'Comma-separated formats to benchmark (default: all of {",".join(FORMATS.values())})')
+    parser.add_argument('--modes', type=str, help=f'Comma-separated adjustment modes (default: all of {",".join(MODES)})')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE, help='Baseline JSON to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='Write the results to --baseline instead of comparing')
+    parser.add_argument('--tolerance', type=float, default=0.4, help='Allowed relative regression before failing (default: 0.4)')
+
+    args = parser.parse_args()
+
+    extensions = {name: extension for extension, name in FORMATS.items()}
+    formats = args.formats.split(',') if args.formats else list(extensions)
+    modes = args.modes.split(',') if args.modes else list(MODES)
+    unknown = [f for f in formats if f not in extensions] + [m for m in modes if m not in MODES]
+    if unknown:
+        print(f"Error: Unknown format or mode: {', '.join(unknown)}")
+        sys.exit(1)
+
+    suite = BenchmarkSuite(args.tickers, args.years, args.seed, args.repeat,
+                           formats=[extensions[f] for f in formats], modes=modes)
+    results = suite.run()
+
+    print(f"{'case':<18}{'rows':>10}{'seconds':>10}{'rows/sec':>14}{'peak MB':>10}")
+    for r in results:
+        print(f"{r.case:<18}{r.rows:>10,}{r.seconds:>10.3f}{r.rows_per_sec:>14,.0f}{r.peak_mb:>10.1f}")
+    print()
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(suite.baseline(results), f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one.")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    try:
+        regressions = suite.compare(results, baseline, tolerance=args.tolerance)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if regressions:
+        print("Error: Regressions against the baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -1,59 +1,339 @@
 import sys
 import os
 import argparse
+from datetime import date
 
-from stock_data_cli.src.loader.base_loader import BaseLoader
-from stock_data_cli.src.loader.base_saver import BaseSaver
-from stock_data_cli.src.returns.forward_adjusted import ForwardAdjusted
-from stock_data_cli.src.returns.backward_adjusted import BackwardAdjusted
+# pandas, pyarrow and the format modules are imported inside the functions that
+# need them, so --help and argument errors return without loading them
+
+def parse_date(value):
+    """argparse type for YYYY-MM-DD dates"""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', expected YYYY-MM-DD")
 
 def main():
     parser = argparse.ArgumentParser(description='Stock return calculator (script version)')
-    parser.add_argument('--input', type=str, required=True, help='Input data file (Parquet, JSON, or CSV)')
-    parser.add_argument('--output', type=str, help='Output file path to save the results (Parquet, JSON, or CSV)')
-    parser.add_argument('--mode', type=str, choices=['forward', 'backward'], default='forward', help='Calculation mode: forward or backward')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--input', type=str, help='Input data file (Parquet, Arrow/Feather, JSON, or CSV)')
+    source.add_argument('--manifest', type=str, help='CSV file with input,output[,mode] rows to process in one run')
+    parser.add_argument('--output', type=str, help='Output file path to save the results (Parquet, Arrow/Feather, JSON, or CSV)')
+    parser.add_argument('--mode', type=str, choices=['forward', 'backward', 'both'], default='forward', help='Calculation mode: forward, backward, or both in a single pass')
+    parser.add_argument('--workers', type=int, default=1, help='Number of worker processes; tickers are sharded across them (default: 1)')
+    parser.add_argument('--append', type=str, metavar='EXISTING', help='Previously adjusted file to extend with the new rows from --input (written back to it unless --output is given)')
+    parser.add_argument('--tickers', type=str, help='Comma-separated ticker symbols to load (default: all)')
+    parser.add_argument('--start', type=parse_date, help='First date to load, inclusive (YYYY-MM-DD)')
+    parser.add_argument('--end', type=parse_date, help='Last date to load, inclusive (YYYY-MM-DD)')
+    parser.add_argument('--engine', type=str, choices=['pandas', 'arrow'], default='pandas', help='Processing engine: pandas DataFrames or Arrow tables end to end (default: pandas)')
+    parser.add_argument('--print', action='store_true', help='Also print the results (first and last rows) when --output is given')
+    parser.add_argument('--compact-json', action='store_true', help='Write .json output without indentation')
+    parser.add_argument('--float32', action='store_true', help='Load CSV prices as float32 to halve their memory')
+    parser.add_argument('--cache-dir', type=str, help='Keep parsed CSV/JSON inputs as Arrow files in this directory and reuse them while the input is unchanged (default: $STOCK_DATA_CACHE_DIR, no cache when unset)')
+    parser.add_argument('--cache-max-mb', type=int, default=4096, help='Size limit of the input cache; least recently used files are removed beyond it (default: 4096)')
+    parser.add_argument('--no-cache', action='store_true', help='Parse the input again without reading or writing the input cache')
+    parser.add_argument('--sort-memory-mb', type=int, help='Stream the input and sort it on disk within this memory budget, for inputs larger than RAM')
+    parser.add_argument('--sort-temp-dir', type=str, help='Directory for the sorted runs of --sort-memory-mb (default: the system temp directory)')
+    parser.add_argument('--io-workers', type=int, default=4, help='Threads reading and writing files in --manifest mode (default: 4)')
+    parser.add_argument('--serve', action='store_true', help='Keep --input loaded and serve adjusted series over HTTP')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Address to listen on with --serve (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on with --serve (default: 8765)')
+    parser.add_argument('--socket', type=str, help='Unix socket path to listen on with --serve instead of a TCP port')
+    parser.add_argument('--cache-size', type=int, default=256, help='Number of results kept in the --serve LRU cache (default: 256)')
+    parser.add_argument('--profile', action='store_true', help='Print wall/CPU time, peak RSS and rows per stage and per ticker')
+    parser.add_argument('--profile-report', type=str, metavar='PATH', help='Write the profile as JSON to PATH (implies --profile)')
 
     args = parser.parse_args()
 
-    if not os.path.isfile(args.input):
+    if args.manifest:
+        run_manifest(args)
+        return
+
+    if not os.path.exists(args.input):
         print(f"Error: The file {args.input} does not exist.")
         sys.exit(1)
 
+    if args.serve:
+        run_server(args)
+        return
+
+    if args.workers < 1:
+        print("Error: --workers must be at least 1.")
+        sys.exit(1)
+
+    if args.engine == 'arrow' and (args.append or args.workers > 1):
+        print("Error: --engine arrow cannot be combined with --append or --workers.")
+        sys.exit(1)
+
+    if args.mode == 'both' and args.append:
+        print("Error: --append needs --mode forward or --mode backward.")
+        sys.exit(1)
+
+    if args.sort_memory_mb is not None:
+        if args.sort_memory_mb < 1:
+            print("Error: --sort-memory-mb must be at least 1.")
+            sys.exit(1)
+        if args.engine == 'arrow' or args.append or args.workers > 1:
+            print("Error: --sort-memory-mb cannot be combined with --engine arrow, --append or --workers.")
+            sys.exit(1)
+
+    cache = get_input_cache(args)
+
+    from stock_data_cli.src.loader.base_loader import BaseLoader
+    from stock_data_cli.src.profiling.profiler import Profiler
+
     # Use Strategy pattern with factory method to get appropriate loader
     try:
-        loader = BaseLoader.get_loader_for_file(args.input)
+        tickers = parse_tickers(args.tickers)
+        loader = BaseLoader.get_loader_for_file(args.input, tickers=tickers, start=args.start, end=args.end,
+                                                float32=args.float32)
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
 
-    data = loader.load_data()
+    profiler = Profiler(enabled=args.profile or bool(args.profile_report))
+
+    if args.sort_memory_mb is not None:
+        run_external_sort(loader, args, profiler)
+        print_profile(profiler, args)
+        return
+
+    with profiler.stage('load') as stage:
+        if args.engine == 'arrow':
+            data = cache.load_table(loader) if cache else loader.load_table()
+        else:
+            data = cache.load_data(loader) if cache else loader.load_data()
+        stage.rows = None if data is None else len(data)
+    if data is None:
+        print(f"Error: could not load data from {args.input}.")
+        sys.exit(1)
 
     # print("Loaded Data:")
     # print(data)
     # print()
 
+    if args.output and args.engine == 'pandas' and not args.append and args.workers == 1:
+        run_pipelined(data, args, profiler)
+    else:
+        if profiler.enabled and args.engine == 'pandas' and not args.append and args.workers == 1:
+            # per-ticker breakdown with separate sort and adjust stages
+            from stock_data_cli.src.profiling.ticker_profile import adjust_by_ticker
+            result = adjust_by_ticker(data, args.mode, profiler)
+        else:
+            with profiler.stage('adjust', rows=len(data)):
+                result = adjust(data, args)
+
+        run_output(result, args, profiler)
+
+    print_profile(profiler, args)
+
+def print_profile(profiler, args):
+    if profiler.enabled:
+        print()
+        print(profiler.summary())
+        if args.profile_report:
+            profiler.write_report(args.profile_report)
+            print(f"Profile report saved to {args.profile_report}")
+
+def adjust(data, args):
+    """Run the adjuster selected by the command-line options"""
+    if args.engine == 'arrow':
+        from stock_data_cli.src.returns.arrow_adjusted import ArrowAdjusted
+        adj = ArrowAdjusted(data, mode=args.mode)
+        return adj.adjust()
+    if args.append:
+        result = append_to_existing(args.append, data, args.mode)
+        args.output = args.output or args.append
+        return result
+    if args.workers > 1:
+        from stock_data_cli.src.returns.parallel_adjusted import ParallelAdjusted
+        adj = ParallelAdjusted(data, mode=args.mode, workers=args.workers)
+        return adj.adjust()
+    # the loaded frame is not used again, so the column is added to it in place
+    if args.mode == 'both':
+        from stock_data_cli.src.returns.combined_adjusted import CombinedAdjusted
+        adj = CombinedAdjusted(data, inplace=True)
+        return adj.adjust()
     if args.mode == 'forward':
-        adj = ForwardAdjusted(data)
-        result = adj.forward_adj()
+        from stock_data_cli.src.returns.forward_adjusted import ForwardAdjusted
+        adj = ForwardAdjusted(data, inplace=True)
+        return adj.forward_adj()
+    from stock_data_cli.src.returns.backward_adjusted import BackwardAdjusted
+    adj = BackwardAdjusted(data, inplace=True)
+    return adj.backward_adj()
+
+def get_input_cache(args):
+    """ParseCache for the input files, or None with --no-cache or without a cache directory"""
+    if args.cache_max_mb < 1:
+        print("Error: --cache-max-mb must be at least 1.")
+        sys.exit(1)
+    if args.no_cache:
+        return None
+
+    from stock_data_cli.src.loader.parse_cache import ParseCache
+
+    max_bytes = args.cache_max_mb * 1024 * 1024
+    if args.cache_dir:
+        return ParseCache(args.cache_dir, max_bytes)
+    return ParseCache.from_environment(max_bytes)
+
+def get_saver(args):
+    """Saver for --output, configured by the output options"""
+    from stock_data_cli.src.loader.base_saver import BaseSaver
+    from stock_data_cli.src.loader.json_saver import JsonSaver
+
+    # Use Strategy pattern with factory method to get appropriate saver
+    try:
+        saver = BaseSaver.get_saver_for_file(args.output)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if args.compact_json and isinstance(saver, JsonSaver):
+        saver.indent = None
+    return saver
+
+def run_pipelined(data, args, profiler):
+    """Adjust and save a few tickers at a time, so the full result frame is never built"""
+    from stock_data_cli.src.output.pipeline import adjusted_blocks, write_pipelined, ResultPreview
+
+    saver = get_saver(args)
+    preview = ResultPreview() if args.print else None
+    with profiler.stage('adjust+save', rows=len(data)):
+        write_pipelined(adjusted_blocks(data, args.mode, profiler=profiler), saver, preview)
+    print(f"Results saved to {args.output}")
+    if preview is not None:
+        print("\n_____\n")
+        print("Results:")
+        print(preview)
+
+def run_external_sort(loader, args, profiler):
+    """Sort the streamed input on disk, then adjust and save (or preview) the merged stream block by block"""
+    from stock_data_cli.src.returns.external_sort import ExternalSort
+    from stock_data_cli.src.output.pipeline import write_pipelined, ResultPreview
+
+    saver = get_saver(args) if args.output else None
+    preview = ResultPreview() if args.print or not args.output else None
+    with ExternalSort.from_loader(loader, memory_budget=args.sort_memory_mb * 1024 * 1024,
+                                  temp_dir=args.sort_temp_dir) as sorter:
+        with profiler.stage('load+spill') as stage:
+            sorter.spill()
+            stage.rows = sorter.num_rows
+        with profiler.stage('merge+adj+save', rows=sorter.num_rows):
+            blocks = sorter.adjusted_batches(args.mode)
+            if saver is not None:
+                write_pipelined(blocks, saver, preview)
+            else:
+                for block in blocks:
+                    preview.add(block)
+
+    if saver is not None:
+        print(f"Results saved to {args.output}")
+        if preview is None:
+            return
+        print("\n_____\n")
+        print("Results:")
     else:
-        adj = BackwardAdjusted(data)
-        result = adj.backward_adj()
+        print("No output file specified. Displaying results:\n")
+    print(preview)
 
+def run_output(result, args, profiler):
+    """Save the results and print them unless they were saved without --print"""
     if args.output:
-        # Use Strategy pattern with factory method to get appropriate saver
-        try:
-            saver = BaseSaver.get_saver_for_file(args.output)
-        except ValueError as e:
-            print(f"Error: {e}")
-            sys.exit(1)
-            
-        saver.save(result)
-        print(f"Results saved to {args.output}\n\n_____\n")
+        saver = get_saver(args)
+        with profiler.stage('save', rows=len(result)):
+            if args.engine == 'arrow':
+                saver.save_table(result)
+            else:
+                saver.save(result)
+        print(f"Results saved to {args.output}")
+        if not args.print:
+            return
+        print("\n_____\n")
         print("Results:")
-        print(result)
     else:
         print("No output file specified. Displaying results:\n")
+    with profiler.stage('print', rows=len(result)):
         print(result)
 
+def parse_tickers(value):
+    return [t.strip() for t in value.split(',') if t.strip()] if value else None
+
+def run_manifest(args):
+    """Process every input/output pair of a manifest in this process and print a per-file summary"""
+    if args.output or args.append or args.engine == 'arrow':
+        print("Error: --manifest cannot be combined with --output, --append or --engine arrow.")
+        sys.exit(1)
+    if args.workers < 1 or args.io_workers < 1:
+        print("Error: --workers and --io-workers must be at least 1.")
+        sys.exit(1)
+    if not os.path.exists(args.manifest):
+        print(f"Error: The file {args.manifest} does not exist.")
+        sys.exit(1)
+
+    from stock_data_cli.src.batch.manifest import read_manifest
+    from stock_data_cli.src.batch.batch_adjuster import BatchAdjuster
+
+    try:
+        entries = read_manifest(args.manifest, default_mode=args.mode)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    loader_options = dict(tickers=parse_tickers(args.tickers), start=args.start, end=args.end, float32=args.float32)
+    batch = BatchAdjuster(entries, io_workers=args.io_workers, workers=args.workers,
+                          loader_options=loader_options, compact_json=args.compact_json,
+                          cache=get_input_cache(args))
+    results = batch.run()
+
+    print("Summary:")
+    print(BatchAdjuster.summary(results).to_string(index=False))
+
+    failed = sum(result.error is not None for result in results)
+    if failed:
+        print(f"Error: {failed} of {len(results)} files failed.")
+        sys.exit(1)
+
+def run_server(args):
+    """Load --input once and answer adjustment requests until interrupted"""
+    if args.cache_size < 1:
+        print("Error: --cache-size must be at least 1.")
+        sys.exit(1)
+
+    from stock_data_cli.src.service.adjustment_service import AdjustmentService
+    from stock_data_cli.src.service.http_server import serve
+
+    try:
+        service = AdjustmentService(args.input, cache_size=args.cache_size)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    where = f"unix:{args.socket}" if args.socket else f"http://{args.host}:{args.port}"
+    print(f"Serving {len(service.tickers)} tickers from {args.input} on {where}")
+    try:
+        serve(service, host=args.host, port=args.port, socket_path=args.socket)
+    except KeyboardInterrupt:
+        pass
+
+def append_to_existing(existing_path, new_rows, mode):
+    """Extend a previously adjusted file with new rows (incremental update)"""
+    if not os.path.exists(existing_path):
+        print(f"Error: The file {existing_path} does not exist.")
+        sys.exit(1)
+
+    from stock_data_cli.src.loader.base_loader import BaseLoader, REQUIRED_COLUMNS
+    from stock_data_cli.src.returns.incremental_adjusted import IncrementalAdjusted, ADJUSTED_COLUMNS
+
+    column = ADJUSTED_COLUMNS[mode]
+    try:
+        existing_loader = BaseLoader.get_loader_for_file(existing_path, columns=REQUIRED_COLUMNS + [column])
+        existing = existing_loader.load_data()
+        if existing is None:
+            raise ValueError(f"Could not load {existing_path}")
+        return IncrementalAdjusted(existing, new_rows, mode=mode).adjust()
+    except (KeyError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,9 @@
+from .manifest import ManifestEntry, read_manifest
+from .batch_adjuster import BatchAdjuster, FileResult
+
+__all__ = [
+    'ManifestEntry',
+    'read_manifest',
+    'BatchAdjuster',
+    'FileResult'
+]
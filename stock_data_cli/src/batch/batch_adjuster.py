@@ -0,0 +1,112 @@
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional
+import pandas as pd
+
+from ..loader.base_loader import BaseLoader
+from ..loader.base_saver import BaseSaver
+from ..loader.json_saver import JsonSaver
+from ..loader.parse_cache import ParseCache
+from ..returns.parallel_adjusted import ParallelAdjusted
+from .manifest import ManifestEntry
+
+
+class FileResult(NamedTuple):
+    input: str
+    output: Optional[str]
+    mode: str
+    rows: int
+    load_seconds: float
+    adjust_seconds: float
+    save_seconds: float
+    error: Optional[str]
+
+
+class BatchAdjuster:
+    """Adjust many files in one process, overlapping file I/O with computation.
+
+    Loads run ahead on a thread pool (at most ``io_workers`` files in flight)
+    and saves are handed to the same pool, while the calling thread adjusts
+    one file at a time in manifest order. A failing file is recorded in its
+    ``FileResult`` and does not stop the batch.
+    """
+
+    def __init__(self, entries: Iterable[ManifestEntry], io_workers: int = 4, workers: int = 1,
+                 loader_options: Optional[dict] = None, compact_json: bool = False,
+                 cache: Optional[ParseCache] = None):
+        self.entries = list(entries)
+        self.io_workers = max(1, io_workers)
+        self.workers = workers
+        self.loader_options = loader_options or {}
+        self.compact_json = compact_json
+        # parsed-input cache shared by the loading threads (entries are written atomically)
+        self.cache = cache
+
+    def run(self) -> List[FileResult]:
+        results = []
+        with ThreadPoolExecutor(max_workers=self.io_workers) as pool:
+            pending = iter(self.entries)
+            loads = deque()
+            for entry in pending:
+                loads.append((entry, pool.submit(self._load, entry)))
+                if len(loads) >= self.io_workers:
+                    break
+
+            saves = []
+            while loads:
+                entry, load = loads.popleft()
+                following = next(pending, None)
+                if following is not None:
+                    loads.append((following, pool.submit(self._load, following)))
+                saves.append((entry, self._adjust(entry, load, pool)))
+
+            for entry, (rows, load_seconds, adjust_seconds, save, error) in saves:
+                save_seconds = 0.0
+                if save is not None and error is None:
+                    try:
+                        save_seconds = save.result()
+                    except Exception as e:
+                        error = str(e)
+                results.append(FileResult(entry.input, entry.output, entry.mode, rows,
+                                          load_seconds, adjust_seconds, save_seconds, error))
+        return results
+
+    @staticmethod
+    def summary(results: List[FileResult]) -> pd.DataFrame:
+        """Per-file summary table with the status of every file"""
+        frame = pd.DataFrame(results, columns=FileResult._fields)
+        frame['status'] = ['ok' if result.error is None else f'error: {result.error}' for result in results]
+        return frame.drop(columns=['error']).round({'load_seconds': 3, 'adjust_seconds': 3, 'save_seconds': 3})
+
+    def _load(self, entry: ManifestEntry):
+        start = time.perf_counter()
+        loader = BaseLoader.get_loader_for_file(entry.input, **self.loader_options)
+        data = self.cache.load_data(loader) if self.cache else loader.load_data()
+        if data is None:
+            raise ValueError(f"Could not load {entry.input}")
+        return data, time.perf_counter() - start
+
+    def _adjust(self, entry: ManifestEntry, load, pool):
+        try:
+            data, load_seconds = load.result()
+        except Exception as e:
+            return 0, 0.0, 0.0, None, str(e)
+
+        start = time.perf_counter()
+        try:
+            result = ParallelAdjusted(data, mode=entry.mode, workers=self.workers).adjust()
+        except Exception as e:
+            return len(data), load_seconds, time.perf_counter() - start, None, str(e)
+        adjust_seconds = time.perf_counter() - start
+
+        save = pool.submit(self._save, entry, result) if entry.output else None
+        return len(result), load_seconds, adjust_seconds, save, None
+
+    def _save(self, entry: ManifestEntry, result: pd.DataFrame) -> float:
+        start = time.perf_counter()
+        saver = BaseSaver.get_saver_for_file(entry.output)
+        if self.compact_json and isinstance(saver, JsonSaver):
+            saver.indent = None
+        saver.save(result)
+        return time.perf_counter() - start
@@ -0,0 +1,39 @@
+import csv
+import os
+from typing import List, NamedTuple, Optional
+
+MODES = ('forward', 'backward', 'both')
+
+
+class ManifestEntry(NamedTuple):
+    input: str
+    output: Optional[str]
+    mode: str
+
+
+def read_manifest(filepath: str, default_mode: str = 'forward') -> List[ManifestEntry]:
+    """Read a CSV manifest with an ``input`` column and optional ``output`` and ``mode`` columns.
+
+    Relative paths are resolved against the manifest's directory. An empty
+    output means the file is adjusted but not saved; an empty mode falls
+    back to ``default_mode``.
+    """
+    base_dir = os.path.dirname(os.path.abspath(filepath))
+
+    def resolve(path):
+        return os.path.join(base_dir, path) if path else None
+
+    entries = []
+    with open(filepath, newline='') as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or 'input' not in reader.fieldnames:
+            raise ValueError(f"Manifest {filepath} needs a header with an 'input' column")
+        for line, row in enumerate(reader, start=2):
+            input_path = (row.get('input') or '').strip()
+            if not input_path:
+                raise ValueError(f"Manifest {filepath}, line {line}: missing input")
+            mode = (row.get('mode') or '').strip() or default_mode
+            if mode not in MODES:
+                raise ValueError(f"Manifest {filepath}, line {line}: unknown mode {mode}. Expected one of {MODES}")
+            entries.append(ManifestEntry(resolve(input_path), resolve((row.get('output') or '').strip()), mode))
+    return entries
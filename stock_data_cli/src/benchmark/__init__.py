@@ -0,0 +1,8 @@
+from .synthetic import generate_market_data
+from .suite import BenchmarkSuite, BenchmarkResult
+
+__all__ = [
+    'generate_market_data',
+    'BenchmarkSuite',
+    'BenchmarkResult'
+]
@@ -0,0 +1,154 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple
+
+from ..loader.base_loader import BaseLoader
+from ..loader.base_saver import BaseSaver
+from ..returns.parallel_adjusted import MODES
+from .synthetic import generate_market_data
+
+# file extension -> benchmark name; '' is a partitioned Parquet dataset directory
+FORMATS = {
+    '.csv': 'csv',
+    '.json': 'json',
+    '.jsonl': 'jsonl',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '': 'dataset',
+}
+
+
+class BenchmarkResult(NamedTuple):
+    case: str
+    rows: int
+    seconds: float
+    rows_per_sec: float
+    peak_mb: float
+
+
+class _ArrowMemorySampler:
+    """Peak growth of Arrow's allocated bytes, sampled on a background thread.
+
+    Arrow buffers live outside the Python heap, so tracemalloc does not see them.
+    """
+
+    INTERVAL = 0.001
+
+    def __enter__(self):
+        import pyarrow as pa
+        self._allocated = pa.total_allocated_bytes
+        self._start = self._allocated()
+        self.peak = 0
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._done.set()
+        self._thread.join()
+        self.peak = max(self.peak, self._allocated() - self._start)
+
+    def _sample(self):
+        while not self._done.is_set():
+            self.peak = max(self.peak, self._allocated() - self._start)
+            self._done.wait(self.INTERVAL)
+
+
+# absolute allowance on top of the relative tolerance, so near-zero peaks don't flag noise
+MEMORY_SLACK_MB = 1.0
+
+
+class BenchmarkSuite:
+    """Throughput and peak memory of every saver, loader and adjustment mode.
+
+    The input is ``generate_market_data(num_tickers, years, seed)``. Each
+    case is timed ``repeat`` times and the fastest run is kept; peak memory
+    is measured in one extra run as the ``tracemalloc`` peak (Python, NumPy
+    and pandas allocations) plus the sampled peak of Arrow's memory pool.
+    """
+
+    def __init__(self, num_tickers: int = 200, years: int = 5, seed: int = 0, repeat: int = 3,
+                 formats: List[str] = None, modes: List[str] = None):
+        self.num_tickers = num_tickers
+        self.years = years
+        self.seed = seed
+        self.repeat = max(1, repeat)
+        self.formats = list(FORMATS) if formats is None else formats
+        self.modes = list(MODES) if modes is None else modes
+
+    @property
+    def config(self) -> Dict[str, int]:
+        return {'tickers': self.num_tickers, 'years': self.years, 'seed': self.seed}
+
+    def run(self) -> List[BenchmarkResult]:
+        data = generate_market_data(self.num_tickers, self.years, self.seed)
+        rows = len(data)
+        results = []
+
+        temp_dir = tempfile.mkdtemp(prefix='benchmark_')
+        try:
+            for extension in self.formats:
+                name = FORMATS[extension]
+                path = os.path.join(temp_dir, f'data{extension}' if extension else 'dataset')
+
+                results.append(self.measure(f'save/{name}', rows,
+                                            lambda path=path: BaseSaver.get_saver_for_file(path).save(data)))
+                results.append(self.measure(f'load/{name}', rows,
+                                            lambda path=path: BaseLoader.get_loader_for_file(path).load_data()))
+
+            for mode in self.modes:
+                adjuster_class, method, _ = MODES[mode]
+                results.append(self.measure(f'adjust/{mode}', rows,
+                                            lambda: getattr(adjuster_class(data), method)()))
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        return results
+
+    def measure(self, case: str, rows: int, function: Callable[[], object]) -> BenchmarkResult:
+        best = float('inf')
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            function()
+            best = min(best, time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            with _ArrowMemorySampler() as arrow:
+                function()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        peak_mb = (peak + arrow.peak) / 2 ** 20
+        return BenchmarkResult(case, rows, best, rows / best if best > 0 else float('inf'), peak_mb)
+
+    def baseline(self, results: List[BenchmarkResult]) -> dict:
+        """Results in the stored baseline format"""
+        return {
+            'config': self.config,
+            'results': {r.case: {'rows_per_sec': round(r.rows_per_sec), 'peak_mb': round(r.peak_mb, 1)}
+                        for r in results},
+        }
+
+    def compare(self, results: List[BenchmarkResult], baseline: dict, tolerance: float = 0.4) -> List[str]:
+        """Regressions against a baseline: throughput below, or peak memory above, it by more than tolerance"""
+        if baseline.get('config') != self.config:
+            raise ValueError(f"Baseline was recorded with {baseline.get('config')}, not {self.config}")
+
+        regressions = []
+        for result in results:
+            expected = baseline['results'].get(result.case)
+            if expected is None:
+                continue
+            if result.rows_per_sec < expected['rows_per_sec'] * (1 - tolerance):
+                regressions.append(f"{result.case}: {result.rows_per_sec:,.0f} rows/sec, "
+                                   f"baseline {expected['rows_per_sec']:,.0f}")
+            if result.peak_mb > expected['peak_mb'] * (1 + tolerance) + MEMORY_SLACK_MB:
+                regressions.append(f"{result.case}: peak {result.peak_mb:.1f} MB, "
+                                   f"baseline {expected['peak_mb']:.1f} MB")
+        return regressions
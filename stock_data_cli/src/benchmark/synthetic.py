@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS_PER_YEAR = 252
+# split ratios and their relative frequency: forward splits dominate, reverse splits are rare
+SPLIT_RATIOS = np.array([2.0, 3.0, 4.0, 1.5, 0.5, 0.1])
+SPLIT_WEIGHTS = np.array([0.55, 0.15, 0.1, 0.1, 0.07, 0.03])
+
+
+def generate_market_data(num_tickers: int = 100, years: int = 5, seed: int = 0,
+                         start: str = '2015-01-01') -> pd.DataFrame:
+    """Deterministic synthetic daily bars for ``num_tickers`` tickers over ``years`` years.
+
+    Prices follow a geometric random walk. About 3% of ticker-years have a
+    split (mostly 2:1, sometimes 3:1, 4:1, 3:2 or reverse splits) and the
+    unadjusted price drops by the ratio on the split day. About 60% of
+    tickers pay a quarterly dividend of 0.5%-4% a year. The same arguments
+    always give the same frame, sorted by ticker and date.
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(start, periods=years * TRADING_DAYS_PER_YEAR)
+    num_days = len(dates)
+
+    # daily log returns with per-ticker drift and volatility
+    drift = rng.normal(0.0003, 0.0004, num_tickers)[:, None]
+    volatility = rng.uniform(0.01, 0.035, num_tickers)[:, None]
+    log_returns = drift + volatility * rng.standard_normal((num_tickers, num_days))
+    log_returns[:, 0] = 0.0
+
+    # splits: event days and ratios per ticker
+    split = np.ones((num_tickers, num_days))
+    num_splits = rng.binomial(years, 0.03, num_tickers)
+    for ticker in np.flatnonzero(num_splits):
+        days = rng.choice(np.arange(1, num_days), size=num_splits[ticker], replace=False)
+        split[ticker, days] = rng.choice(SPLIT_RATIOS, size=len(days), p=SPLIT_WEIGHTS)
+
+    # unadjusted prices drop by the split ratio on the split day
+    start_price = rng.uniform(10.0, 500.0, num_tickers)[:, None]
+    price = start_price * np.exp(np.cumsum(log_returns, axis=1)) / np.cumprod(split, axis=1)
+    price = np.maximum(np.round(price, 2), 0.01)
+
+    # quarterly dividends for a subset of tickers
+    dividend = np.zeros((num_tickers, num_days))
+    payers = rng.random(num_tickers) < 0.6
+    annual_yield = rng.uniform(0.005, 0.04, num_tickers)
+    offsets = rng.integers(0, TRADING_DAYS_PER_YEAR // 4, num_tickers)
+    for ticker in np.flatnonzero(payers):
+        days = np.arange(offsets[ticker] + 1, num_days, TRADING_DAYS_PER_YEAR // 4)
+        dividend[ticker, days] = np.round(price[ticker, days] * annual_yield[ticker] / 4, 2)
+
+    tickers = np.array([f'T{i:05d}' for i in range(num_tickers)], dtype=object)
+    return pd.DataFrame({
+        'unadjusted_close': price.ravel(),
+        'ticker_symbol': np.repeat(tickers, num_days),
+        'datetime': np.tile(dates.to_numpy(), num_tickers),
+        'split': split.ravel(),
+        'dividend': dividend.ravel(),
+    })
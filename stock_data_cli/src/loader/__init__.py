@@ -1,11 +1,32 @@
-from .base_loader import BaseLoader
-from .base_saver import BaseSaver
-from .csv_loader import CsvLoader
-from .csv_saver import CsvSaver
-from .json_loader import JsonLoader
-from .json_saver import JsonSaver
-from .parquet_loader import ParquetLoader
-from .parquet_saver import ParquetSaver
+from importlib import import_module
+
+# name -> submodule; each format module (and pandas/pyarrow) is imported on first use
+_EXPORTS = {
+    'BaseLoader': 'base_loader',
+    'BaseSaver': 'base_saver',
+    'CsvLoader': 'csv_loader',
+    'CsvSaver': 'csv_saver',
+    'JsonLoader': 'json_loader',
+    'JsonSaver': 'json_saver',
+    'JsonLinesSaver': 'jsonl_saver',
+    'ParquetLoader': 'parquet_loader',
+    'ParquetSaver': 'parquet_saver',
+    'ArrowLoader': 'arrow_loader',
+    'ArrowSaver': 'arrow_saver',
+    'DatasetLoader': 'dataset_loader',
+    'DatasetSaver': 'dataset_saver',
+    'ParseCache': 'parse_cache',
+    'FormatRegistry': 'registry',
+    'register_loader': 'registry',
+    'register_saver': 'registry',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'BaseLoader',
@@ -14,6 +35,15 @@ __all__ = [
     'CsvSaver', 
     'JsonLoader',
     'JsonSaver',
+    'JsonLinesSaver',
     'ParquetLoader',
-    'ParquetSaver'
+    'ParquetSaver',
+    'ArrowLoader',
+    'ArrowSaver',
+    'DatasetLoader',
+    'DatasetSaver',
+    'ParseCache',
+    'FormatRegistry',
+    'register_loader',
+    'register_saver'
 ]
\ No newline at end of file
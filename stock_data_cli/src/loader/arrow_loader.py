@@ -0,0 +1,50 @@
+import pandas as pd
+from typing import Iterator, List
+from .base_loader import BaseLoader
+
+class ArrowLoader(BaseLoader):
+    """Loader for Arrow IPC files (.arrow, .feather V2).
+
+    The file is memory-mapped instead of read: uncompressed buffers (as
+    written by ``ArrowSaver``) are used where they lie, so opening a
+    multi-GB file only reads its footer, pages are loaded on first access
+    and the OS page cache is shared by every process mapping the same file.
+    Column projection is free; ticker/date filters are applied to the
+    mapped table with Arrow compute.
+    """
+
+    @property
+    def supported_extensions(self) -> List[str]:
+        """Arrow loader supports .arrow and .feather files"""
+        return ['.arrow', '.feather']
+
+    def load_data(self) -> pd.DataFrame:
+        return self.to_pandas(self.load_table())
+
+    def load_table(self):
+        return self.filter_table(self.mapped_table())
+
+    def iter_batches(self, batch_size: int = BaseLoader.DEFAULT_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+        """Yield the file's record batches (sliced to batch_size rows) without reading the rest"""
+        import pyarrow as pa
+        reader = self.open_reader()
+        for i in range(reader.num_record_batches):
+            table = self.filter_table(pa.Table.from_batches([reader.get_batch(i)]))
+            for start in range(0, table.num_rows, batch_size):
+                yield self.to_pandas(table.slice(start, batch_size))
+
+    def open_reader(self):
+        """IPC file reader over a read-only memory map of the file"""
+        import pyarrow as pa
+        return pa.ipc.open_file(pa.memory_map(self.filepath, 'r'))
+
+    def mapped_table(self):
+        """The whole file as a Table whose buffers point into the memory map"""
+        return self.open_reader().read_all()
+
+    def filter_table(self, table):
+        expression = self.arrow_filter(table.schema)
+        if expression is None:
+            return table.select(self.columns)
+        import pyarrow.dataset as ds
+        return ds.dataset(table).to_table(columns=self.columns, filter=expression)
\ No newline at end of file
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List, Optional
+import numpy as np
 import pandas as pd
 
 REQUIRED_COLUMNS = ['unadjusted_close', 'ticker_symbol', 'datetime', 'split', 'dividend']
@@ -7,8 +8,21 @@ REQUIRED_COLUMNS = ['unadjusted_close', 'ticker_symbol', 'datetime', 'split', 'd
 class BaseLoader(ABC):
     """Abstract base class for data loaders implementing Strategy pattern"""
     
-    def __init__(self, filepath: str):
+    DEFAULT_BATCH_SIZE = 100_000
+    # text formats whose parsed frame is worth keeping in a ParseCache
+    CACHEABLE = False
+    
+    def __init__(self, filepath: str, columns: Optional[List[str]] = None,
+                 tickers: Optional[List[str]] = None, start=None, end=None, float32: bool = False):
         self.filepath = filepath
+        # columns to load; defaults to the columns the adjusters need
+        self.columns = list(columns) if columns else list(REQUIRED_COLUMNS)
+        # row filters: ticker symbols and an inclusive date range
+        self.tickers = list(tickers) if tickers else None
+        self.start = start
+        self.end = end
+        # store prices as float32 where the loader applies a schema (halves their memory)
+        self.float32 = float32
     
     @property
     @abstractmethod
@@ -21,26 +35,116 @@ class BaseLoader(ABC):
         """Load data from file and return DataFrame with required columns"""
         pass
     
+    def load_table(self):
+        """Load data as a pyarrow Table; formats readable by Arrow override this to skip pandas"""
+        import pyarrow as pa
+        return pa.Table.from_pandas(self.load_data(), preserve_index=False)
+    
+    def iter_batches(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+        """Yield the data as DataFrames of at most batch_size rows with required columns.
+        
+        Loaders that can read incrementally override this; the default loads
+        the whole file and slices it.
+        """
+        data = self.load_data()
+        for start in range(0, len(data), batch_size):
+            yield data.iloc[start:start + batch_size]
+    
+    @property
+    def has_filters(self) -> bool:
+        return self.tickers is not None or self.start is not None or self.end is not None
+    
+    @property
+    def read_columns(self) -> List[str]:
+        """Columns to read: the projected columns plus any needed to apply the filters"""
+        extra = []
+        if self.tickers is not None:
+            extra.append('ticker_symbol')
+        if self.start is not None or self.end is not None:
+            extra.append('datetime')
+        return self.columns + [c for c in extra if c not in self.columns]
+    
+    def filter_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Apply the ticker/date filters in pandas, for readers that cannot push them down"""
+        if not self.has_filters:
+            return data[self.columns]
+        
+        mask = np.ones(len(data), dtype=bool)
+        if self.tickers is not None:
+            mask &= data['ticker_symbol'].isin(self.tickers).to_numpy()
+        if self.start is not None:
+            mask &= (data['datetime'] >= self.date_bound(self.start, data['datetime'])).to_numpy()
+        if self.end is not None:
+            mask &= (data['datetime'] <= self.date_bound(self.end, data['datetime'])).to_numpy()
+        return data.loc[mask, self.columns]
+    
+    def arrow_filter(self, schema):
+        """Ticker/date filters as a pyarrow expression (None when unfiltered)"""
+        conditions = self.arrow_conditions(schema)
+        if not conditions:
+            return None
+        expression = conditions[0]
+        for condition in conditions[1:]:
+            expression = expression & condition
+        return expression
+    
+    def arrow_conditions(self, schema) -> list:
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        
+        conditions = []
+        if self.tickers is not None:
+            conditions.append(ds.field('ticker_symbol').isin(self.tickers))
+        if self.start is not None or self.end is not None:
+            date_type = schema.field('datetime').type
+            
+            def bound(value):
+                if pa.types.is_timestamp(date_type) or pa.types.is_date(date_type):
+                    return pa.scalar(pd.Timestamp(value).to_pydatetime()).cast(date_type)
+                return str(pd.Timestamp(value).date())  # ISO text dates compare lexically
+            
+            if self.start is not None:
+                conditions.append(ds.field('datetime') >= bound(self.start))
+            if self.end is not None:
+                conditions.append(ds.field('datetime') <= bound(self.end))
+        return conditions
+    
+    @staticmethod
+    def to_pandas(table) -> pd.DataFrame:
+        """Convert a pyarrow Table; dictionary-encoded tickers become categoricals with sorted categories"""
+        data = table.to_pandas()
+        if 'ticker_symbol' in data and isinstance(data['ticker_symbol'].dtype, pd.CategoricalDtype):
+            # dictionary order is first appearance; sort the categories so ticker sorts stay alphabetical
+            tickers = data['ticker_symbol'].cat
+            data['ticker_symbol'] = tickers.reorder_categories(tickers.categories.sort_values())
+        return data
+    
+    @staticmethod
+    def date_bound(value, dates: pd.Series):
+        """Convert a date filter to something comparable with the loaded datetime column"""
+        if pd.api.types.is_datetime64_any_dtype(dates):
+            return pd.Timestamp(value)
+        # dates kept as text compare lexically, which is correct for ISO YYYY-MM-DD
+        return str(pd.Timestamp(value).date())
+    
     def can_handle(self, file_extension: str) -> bool:
         """Check if this loader can handle the given file extension"""
         return file_extension.lower() in [ext.lower() for ext in self.supported_extensions]
     
     @classmethod
-    def get_loader_for_file(cls, filepath: str) -> 'BaseLoader':
-        """Factory method to get appropriate loader for file extension"""
-        import os
-        file_extension = os.path.splitext(filepath)[1]
+    def get_loader_for_file(cls, filepath: str, **options) -> 'BaseLoader':
+        """Factory method to get appropriate loader for file extension; options go to the loader
         
-        # Import here to avoid circular imports
-        from .csv_loader import CsvLoader
-        from .json_loader import JsonLoader  
-        from .parquet_loader import ParquetLoader
-        
-        loaders = [CsvLoader, JsonLoader, ParquetLoader]
+        The class is looked up in the format registry, so only the selected
+        loader's module is imported.
+        """
+        import os
+        from .registry import LOADERS
         
-        for loader_class in loaders:
-            loader_instance = loader_class(filepath)
-            if loader_instance.can_handle(file_extension):
-                return loader_instance
+        # directories are partitioned datasets whatever their name looks like
+        file_extension = '' if os.path.isdir(filepath) else os.path.splitext(filepath)[1]
         
-        raise ValueError(f"No loader found for file extension: {file_extension}")
+        loader_class = LOADERS.get(file_extension)
+        if loader_class is None:
+            raise ValueError(f"No loader found for file extension: {file_extension}")
+        return loader_class(filepath, **options)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterable, List
 import pandas as pd
 
 class BaseSaver(ABC):
@@ -19,26 +19,37 @@ class BaseSaver(ABC):
         """Save DataFrame to file"""
         pass
     
+    def save_table(self, table) -> None:
+        """Save a pyarrow Table; formats writable by Arrow override this to skip pandas"""
+        self.save(table.to_pandas())
+    
+    def save_batches(self, batches: Iterable[pd.DataFrame]) -> None:
+        """Save frames that arrive one after another, e.g. the blocks of a pipelined run
+        
+        Formats that can be written incrementally override this so only one
+        batch is held at a time; the default collects them and calls ``save``.
+        """
+        batches = list(batches)
+        self.save(pd.concat(batches) if batches else pd.DataFrame())
+    
     def can_handle(self, file_extension: str) -> bool:
         """Check if this saver can handle the given file extension"""
         return file_extension.lower() in [ext.lower() for ext in self.supported_extensions]
     
     @classmethod
     def get_saver_for_file(cls, filepath: str) -> 'BaseSaver':
-        """Factory method to get appropriate saver for file extension"""
-        import os
-        file_extension = os.path.splitext(filepath)[1]
-        
-        # Import here to avoid circular imports
-        from .csv_saver import CsvSaver
-        from .json_saver import JsonSaver
-        from .parquet_saver import ParquetSaver
+        """Factory method to get appropriate saver for file extension
         
-        savers = [CsvSaver, JsonSaver, ParquetSaver]
+        The class is looked up in the format registry, so only the selected
+        saver's module is imported.
+        """
+        import os
+        from .registry import SAVERS
         
-        for saver_class in savers:
-            saver_instance = saver_class(filepath)
-            if saver_instance.can_handle(file_extension):
-                return saver_instance
+        # directories are partitioned datasets whatever their name looks like
+        file_extension = '' if os.path.isdir(filepath) else os.path.splitext(filepath)[1]
         
-        raise ValueError(f"No saver found for file extension: {file_extension}")
+        saver_class = SAVERS.get(file_extension)
+        if saver_class is None:
+            raise ValueError(f"No saver found for file extension: {file_extension}")
+        return saver_class(filepath)
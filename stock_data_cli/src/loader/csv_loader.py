@@ -1,8 +1,19 @@
 import pandas as pd
-from typing import List
+from typing import Iterator, List
 from .base_loader import BaseLoader
 
 class CsvLoader(BaseLoader):
+    """CSV loader parsing with the multithreaded pyarrow CSV reader.
+
+    The required columns get an explicit schema instead of type inference:
+    tickers are dictionary-encoded (a pandas categorical with sorted
+    categories), dates are parsed to timestamps and prices are float64, or
+    float32 with ``float32=True``. Dates pyarrow cannot parse (e.g.
+    ``01/02/2023``) are read again as text and parsed by ``pd.to_datetime``.
+    """
+
+    CACHEABLE = True
+
     @property
     def supported_extensions(self) -> List[str]:
         """CSV loader supports .csv files"""
@@ -10,9 +21,77 @@ class CsvLoader(BaseLoader):
 
     def load_data(self) -> pd.DataFrame:
         try:
-            from .base_loader import REQUIRED_COLUMNS
-            data = pd.read_csv(self.filepath, usecols=REQUIRED_COLUMNS)
-            return data
+            return self.to_pandas(self.load_table())
         except Exception as e:
             print(f"Error loading CSV data: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def load_table(self):
+        import pyarrow as pa
+        try:
+            return self.read_table(text_dates=False)
+        except pa.ArrowInvalid:
+            return self.read_table(text_dates=True)
+
+    def read_table(self, text_dates: bool):
+        import pyarrow as pa
+        import pyarrow.csv as csv
+
+        options = self.convert_options(text_dates)
+        if self.has_filters:
+            # filter block by block so rows outside the filters are never all held at once
+            with csv.open_csv(self.filepath, convert_options=options) as reader:
+                tables = [self.filter_table(pa.Table.from_batches([batch])) for batch in reader]
+                schema = reader.schema
+            return pa.concat_tables(tables) if tables else self.filter_table(pa.Table.from_batches([], schema))
+
+        return self.parse_dates(csv.read_csv(self.filepath, convert_options=options)).select(self.columns)
+
+    def iter_batches(self, batch_size: int = BaseLoader.DEFAULT_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+        """Stream the CSV block by block, dropping rows outside the filters"""
+        import pyarrow as pa
+        import pyarrow.csv as csv
+
+        # the first block is parsed on open, so unparseable dates are detected there
+        try:
+            reader = csv.open_csv(self.filepath, convert_options=self.convert_options())
+        except pa.ArrowInvalid:
+            reader = csv.open_csv(self.filepath, convert_options=self.convert_options(text_dates=True))
+        with reader:
+            for batch in reader:
+                table = self.filter_table(pa.Table.from_batches([batch]))
+                for start in range(0, table.num_rows, batch_size):
+                    yield self.to_pandas(table.slice(start, batch_size))
+
+    def convert_options(self, text_dates: bool = False):
+        """Explicit column types for the required columns; any other column is inferred"""
+        import pyarrow as pa
+        import pyarrow.csv as csv
+
+        price = pa.float32() if self.float32 else pa.float64()
+        column_types = {
+            'unadjusted_close': price,
+            'ticker_symbol': pa.dictionary(pa.int32(), pa.string()),
+            'datetime': pa.string() if text_dates else pa.timestamp('ns'),
+            'split': pa.float64(),
+            'dividend': price,
+        }
+        return csv.ConvertOptions(column_types=column_types, include_columns=self.read_columns)
+
+    @staticmethod
+    def parse_dates(table):
+        """Convert dates read as text to timestamps, with pandas' format inference"""
+        import pyarrow as pa
+
+        i = table.schema.get_field_index('datetime')
+        if i < 0 or not pa.types.is_string(table.schema.field(i).type):
+            return table
+        dates = pd.to_datetime(table.column(i).to_pandas())
+        return table.set_column(i, 'datetime', pa.array(dates, type=pa.timestamp('ns')))
+
+    def filter_table(self, table):
+        table = self.parse_dates(table)
+        expression = self.arrow_filter(table.schema)
+        if expression is not None:
+            table = table.filter(expression)
+        return table.select(self.columns)
\ No newline at end of file
@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import List
+from typing import Iterable, List
 from .base_saver import BaseSaver
 
 class CsvSaver(BaseSaver):
@@ -9,4 +9,13 @@ class CsvSaver(BaseSaver):
         return ['.csv']
 
     def save(self, data: pd.DataFrame) -> None:
-        data.to_csv(self.filepath, index=False)
\ No newline at end of file
+        data.to_csv(self.filepath, index=False)
+
+    def save_batches(self, batches: Iterable[pd.DataFrame]) -> None:
+        """Append each batch as a chunk of rows; the header is written with the first one"""
+        with open(self.filepath, 'w', newline='') as f:
+            header = True
+            for batch in batches:
+                batch.to_csv(f, index=False, header=header)
+                header = False
+                f.flush()
\ No newline at end of file
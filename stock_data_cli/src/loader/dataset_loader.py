@@ -0,0 +1,37 @@
+import os
+import pandas as pd
+from typing import List
+from .parquet_loader import ParquetLoader
+
+class DatasetLoader(ParquetLoader):
+    """Loader for a hive-partitioned Parquet dataset: <root>/ticker=<symbol>/year=<yyyy>/*.parquet
+
+    Ticker and date filters also prune whole partition directories, and the
+    remaining partitions are read in parallel by the pyarrow scanner.
+    """
+
+    @property
+    def supported_extensions(self) -> List[str]:
+        """Dataset loader handles directories (paths without an extension)"""
+        return ['']
+
+    def can_handle(self, file_extension: str) -> bool:
+        return file_extension == '' or os.path.isdir(self.filepath)
+
+    def dataset(self):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        partitioning = ds.partitioning(pa.schema([('ticker', pa.string()), ('year', pa.int32())]), flavor='hive')
+        return ds.dataset(self.filepath, format='parquet', partitioning=partitioning)
+
+    def arrow_conditions(self, schema) -> list:
+        import pyarrow.dataset as ds
+
+        conditions = super().arrow_conditions(schema)
+        if self.tickers is not None:
+            conditions.append(ds.field('ticker').isin(self.tickers))
+        if self.start is not None:
+            conditions.append(ds.field('year') >= pd.Timestamp(self.start).year)
+        if self.end is not None:
+            conditions.append(ds.field('year') <= pd.Timestamp(self.end).year)
+        return conditions
\ No newline at end of file
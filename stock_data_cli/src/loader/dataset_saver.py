@@ -0,0 +1,68 @@
+import os
+import shutil
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+import pandas as pd
+from typing import List
+from .base_saver import BaseSaver
+from .parquet_saver import ParquetSaver
+
+class DatasetSaver(BaseSaver):
+    """Saver for a hive-partitioned Parquet dataset: <root>/ticker=<symbol>/year=<yyyy>/part-0.parquet
+
+    Partitions are written concurrently into a staging directory, then each
+    (ticker, year) partition is swapped in. Partitions absent from the saved
+    data keep their existing files, so a single-ticker or date-filtered
+    rerun rewrites only the tickers and years it contains. A year present in
+    the data is replaced whole: rows of that year missing from the saved
+    data are removed.
+    """
+
+    def __init__(self, filepath: str, max_workers: int = None):
+        super().__init__(filepath)
+        self.max_workers = max_workers
+
+    @property
+    def supported_extensions(self) -> List[str]:
+        """Dataset saver handles directories (paths without an extension)"""
+        return ['']
+
+    def can_handle(self, file_extension: str) -> bool:
+        return file_extension == '' or os.path.isdir(self.filepath)
+
+    def save(self, data: pd.DataFrame) -> None:
+        data = data.sort_values(['ticker_symbol', 'datetime'], kind='mergesort')
+        years = pd.to_datetime(data['datetime']).dt.year.to_numpy()
+
+        os.makedirs(self.filepath, exist_ok=True)
+        staging = os.path.join(self.filepath, f'.staging-{uuid.uuid4().hex}')
+        try:
+            jobs = []
+            for (ticker, year), part in data.groupby([data['ticker_symbol'].to_numpy(), years], sort=False):
+                path = os.path.join(staging, self.ticker_dir(ticker), f'year={year}', 'part-0.parquet')
+                jobs.append((path, part))
+
+            def write(job):
+                path, part = job
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                ParquetSaver(path).save(part)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                list(pool.map(write, jobs))
+
+            # swap in each rewritten (ticker, year); other partitions are left untouched
+            for ticker_dir in os.listdir(staging):
+                os.makedirs(os.path.join(self.filepath, ticker_dir), exist_ok=True)
+                for year_dir in os.listdir(os.path.join(staging, ticker_dir)):
+                    target = os.path.join(self.filepath, ticker_dir, year_dir)
+                    if os.path.isdir(target):
+                        shutil.rmtree(target)
+                    os.replace(os.path.join(staging, ticker_dir, year_dir), target)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    @staticmethod
+    def ticker_dir(ticker: str) -> str:
+        """Partition directory name for a ticker (URI-encoded, as pyarrow expects)"""
+        return f'ticker={quote(str(ticker), safe="")}'
\ No newline at end of file
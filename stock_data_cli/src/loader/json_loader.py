@@ -1,15 +1,49 @@
+import os
 import pandas as pd
-from typing import List
+from typing import Iterator, List
 from .base_loader import BaseLoader
 
 class JsonLoader(BaseLoader):
+    """Loader for JSON arrays (.json) and JSON Lines (.jsonl/.ndjson).
+
+    JSON Lines files are parsed line by line in bounded batches, so only one
+    batch of text is held in memory before filtering.
+    """
+
+    LINE_EXTENSIONS = ['.jsonl', '.ndjson']
+    CACHEABLE = True
+
     @property
     def supported_extensions(self) -> List[str]:
-        """JSON loader supports .json files"""
-        return ['.json']
+        """JSON loader supports .json, .jsonl and .ndjson files"""
+        return ['.json'] + self.LINE_EXTENSIONS
 
     def load_data(self) -> pd.DataFrame:
-        from .base_loader import REQUIRED_COLUMNS
+        if self.is_line_delimited():
+            batches = list(self.iter_batches())
+            return pd.concat(batches, ignore_index=True) if batches else pd.DataFrame(columns=self.columns)
         data = pd.read_json(self.filepath)
-        data = data[REQUIRED_COLUMNS]
-        return data
\ No newline at end of file
+        data = self.filter_frame(data)
+        return data
+
+    def iter_batches(self, batch_size: int = BaseLoader.DEFAULT_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+        """Stream line-delimited JSON in batches; a JSON array is loaded whole and sliced"""
+        if not self.is_line_delimited():
+            yield from super().iter_batches(batch_size)
+            return
+        with pd.read_json(self.filepath, lines=True, chunksize=batch_size) as reader:
+            for chunk in reader:
+                chunk = self.filter_frame(chunk)
+                if len(chunk):
+                    yield chunk
+
+    def is_line_delimited(self) -> bool:
+        """Check whether the file holds one JSON record per line rather than an array"""
+        if os.path.splitext(self.filepath)[1].lower() in self.LINE_EXTENSIONS:
+            return True
+        with open(self.filepath, 'r') as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped:
+                    return not stripped.startswith('[')
+        return False
\ No newline at end of file
@@ -1,12 +1,17 @@
 import pandas as pd
-from typing import List
+from typing import List, Optional
 from .base_saver import BaseSaver
 
 class JsonSaver(BaseSaver):
+    def __init__(self, filepath: str, indent: Optional[int] = 2):
+        super().__init__(filepath)
+        # None writes the array without whitespace, roughly halving the file size
+        self.indent = indent
+
     @property
     def supported_extensions(self) -> List[str]:
         """JSON saver supports .json files"""
         return ['.json']
 
     def save(self, data: pd.DataFrame) -> None:
-        data.to_json(self.filepath, orient='records', indent=2)
\ No newline at end of file
+        data.to_json(self.filepath, orient='records', indent=self.indent, date_format='iso')
\ No newline at end of file
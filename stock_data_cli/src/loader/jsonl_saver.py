@@ -0,0 +1,38 @@
+import pandas as pd
+from typing import Iterable, List
+from .base_saver import BaseSaver
+
+class JsonLinesSaver(BaseSaver):
+    """Saver for JSON Lines (.jsonl/.ndjson): one record per line with ISO dates.
+
+    Rows are serialized CHUNK_ROWS at a time, so only one chunk of text is
+    held in memory, and ``append`` adds lines without rewriting the file, so
+    readers tailing it see complete records as they are written.
+    """
+
+    CHUNK_ROWS = 10_000
+
+    @property
+    def supported_extensions(self) -> List[str]:
+        """JSON Lines saver supports .jsonl and .ndjson files"""
+        return ['.jsonl', '.ndjson']
+
+    def save(self, data: pd.DataFrame) -> None:
+        self.save_batches([data])
+
+    def save_batches(self, batches: Iterable[pd.DataFrame]) -> None:
+        """Write batches one after another, e.g. the output of a streaming adjuster"""
+        with open(self.filepath, 'w') as f:
+            for batch in batches:
+                self._write(f, batch)
+
+    def append(self, data: pd.DataFrame) -> None:
+        """Add records to the end of the file, creating it if needed"""
+        with open(self.filepath, 'a') as f:
+            self._write(f, data)
+
+    def _write(self, f, data: pd.DataFrame) -> None:
+        for start in range(0, len(data), self.CHUNK_ROWS):
+            chunk = data.iloc[start:start + self.CHUNK_ROWS]
+            chunk.to_json(f, orient='records', lines=True, date_format='iso')
+            f.flush()
\ No newline at end of file
@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import List
+from typing import Iterator, List
 from .base_loader import BaseLoader
 
 class ParquetLoader(BaseLoader):
@@ -9,7 +9,23 @@ class ParquetLoader(BaseLoader):
         return ['.parquet', '.pq']
 
     def load_data(self) -> pd.DataFrame:
-        from .base_loader import REQUIRED_COLUMNS
-        data = pd.read_parquet(self.filepath)
-        data = data[REQUIRED_COLUMNS]
-        return data
\ No newline at end of file
+        return self.load_table().to_pandas()
+
+    def load_table(self):
+        # columns are projected and row groups pruned by their statistics at read time
+        dataset = self.dataset()
+        return dataset.to_table(columns=self.columns, filter=self.arrow_filter(dataset.schema))
+
+    def iter_batches(self, batch_size: int = BaseLoader.DEFAULT_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+        """Read the file row group by row group, in batches of at most batch_size rows"""
+        dataset = self.dataset()
+        batches = dataset.to_batches(columns=self.columns, filter=self.arrow_filter(dataset.schema),
+                                     batch_size=batch_size)
+        for batch in batches:
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+    def dataset(self):
+        """pyarrow dataset over the file"""
+        import pyarrow.dataset as ds
+        return ds.dataset(self.filepath, format='parquet')
\ No newline at end of file
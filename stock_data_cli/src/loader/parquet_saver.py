@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import List
+from typing import Iterable, List
 from .base_saver import BaseSaver
 
 class ParquetSaver(BaseSaver):
@@ -9,4 +9,24 @@ class ParquetSaver(BaseSaver):
         return ['.parquet', '.pq']
 
     def save(self, data: pd.DataFrame) -> None:
-        data.to_parquet(self.filepath, index=False)
\ No newline at end of file
+        data.to_parquet(self.filepath, index=False)
+
+    def save_table(self, table) -> None:
+        import pyarrow.parquet as pq
+        pq.write_table(table, self.filepath)
+
+    def save_batches(self, batches: Iterable[pd.DataFrame]) -> None:
+        """Write each batch as its own row group, using the schema of the first one"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        writer = None
+        try:
+            for batch in batches:
+                schema = None if writer is None else writer.schema
+                table = pa.Table.from_pandas(batch, schema=schema, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(self.filepath, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
\ No newline at end of file
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import List, Optional
+import pandas as pd
+from .base_loader import BaseLoader
+from .arrow_loader import ArrowLoader
+from .arrow_saver import ArrowSaver
+
+CACHE_DIR_ENV = 'STOCK_DATA_CACHE_DIR'
+DEFAULT_MAX_BYTES = 4 * 1024 ** 3
+
+class ParseCache:
+    """On-disk cache of parsed text inputs, stored as Arrow IPC files.
+
+    The first load of a CSV/JSON file parses it with its own loader (without
+    the ticker/date filters) and writes the typed columns to
+    ``<directory>/<source>-<fingerprint>.arrow``; later loads memory-map that
+    file with ``ArrowLoader`` and apply the filters there. ``source`` hashes
+    the resolved path and the loader options that change the parsed frame
+    (loader class, columns, ``float32``); ``fingerprint`` hashes the file
+    size, modification time and a SHA-256 of the contents, so an edited or
+    replaced file is parsed again. Hashing reads the file once per load,
+    which is still several times faster than parsing it.
+
+    Writing a new version of a source removes its older versions, and the
+    least recently used entries are removed while the cache is larger than
+    ``max_bytes``. Entries are written to a temporary name and renamed, so
+    concurrent runs never read a partial file.
+    """
+
+    VERSION = 1
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 1:
+            raise ValueError("Cache size must be at least 1 byte")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_environment(cls, max_bytes: int = DEFAULT_MAX_BYTES) -> Optional['ParseCache']:
+        """Cache in the directory named by STOCK_DATA_CACHE_DIR, or None when it is not set"""
+        directory = os.environ.get(CACHE_DIR_ENV)
+        return cls(directory, max_bytes) if directory else None
+
+    def load_data(self, loader: BaseLoader) -> pd.DataFrame:
+        """``loader.load_data()``, served from the cache for cacheable formats"""
+        if not loader.CACHEABLE:
+            return loader.load_data()
+        return loader.to_pandas(self.load_table(loader))
+
+    def load_table(self, loader: BaseLoader):
+        """``loader.load_table()``, served from the cache for cacheable formats"""
+        if not loader.CACHEABLE:
+            return loader.load_table()
+
+        path = self.entry_path(loader)
+        cached = ArrowLoader(path, columns=loader.columns, tickers=loader.tickers,
+                             start=loader.start, end=loader.end)
+        if os.path.exists(path):
+            try:
+                table = cached.load_table()
+                os.utime(path)  # mark as recently used
+                self.hits += 1
+                return table
+            except (OSError, ValueError):
+                pass  # evicted or replaced by another run meanwhile: parse again
+
+        self.misses += 1
+        unfiltered = type(loader)(loader.filepath, columns=loader.columns, float32=loader.float32)
+        table = unfiltered.load_table()
+        self.store(path, table)
+        return cached.filter_table(table)
+
+    def entry_path(self, loader: BaseLoader) -> str:
+        """Cache file for the loader's input file in its current state"""
+        return os.path.join(self.directory, f'{self.source_key(loader)}-{self.fingerprint(loader.filepath)}.arrow')
+
+    def source_key(self, loader: BaseLoader) -> str:
+        """Hash of the resolved input path and the loader options"""
+        return self._digest({
+            'version': self.VERSION,
+            'path': os.path.realpath(loader.filepath),
+            'loader': type(loader).__name__,
+            'columns': loader.columns,
+            'float32': loader.float32,
+        })
+
+    @classmethod
+    def fingerprint(cls, filepath: str) -> str:
+        """Hash of the file's size, modification time and contents"""
+        stat = os.stat(filepath)
+        content = hashlib.sha256()
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                content.update(chunk)
+        return cls._digest({'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': content.hexdigest()})
+
+    def store(self, path: str, table) -> None:
+        """Write ``table`` as the entry ``path``, drop older versions of the file and evict"""
+        if table.nbytes > self.max_bytes:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        prefix = os.path.basename(path).split('-')[0] + '-'
+        for entry in self.entries():
+            if os.path.basename(entry).startswith(prefix) and entry != path:
+                self._remove(entry)
+
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            ArrowSaver(temp_path).save_table(table)
+            os.replace(temp_path, path)
+        finally:
+            self._remove(temp_path)
+        self.evict(keep=path)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Remove the least recently used entries until the cache fits in ``max_bytes``"""
+        entries = []
+        for entry in self.entries():
+            try:
+                stat = os.stat(entry)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry != keep:
+                self._remove(entry)
+                total -= size
+
+    def entries(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith('.arrow')]
+
+    def size(self) -> int:
+        """Total bytes of the cached entries"""
+        return sum(os.path.getsize(entry) for entry in self.entries() if os.path.exists(entry))
+
+    def clear(self) -> None:
+        for entry in self.entries():
+            self._remove(entry)
+
+    @staticmethod
+    def _digest(fields: dict) -> str:
+        return hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
\ No newline at end of file
@@ -0,0 +1,99 @@
+import importlib
+from typing import Dict, List, Optional, Union
+
+
+class FormatRegistry:
+    """Extension -> loader/saver class registry resolved by dictionary lookup.
+
+    Classes are registered as ``'package.module:ClassName'`` strings and only
+    imported when their extension is requested, so picking a CSV loader never
+    imports the Parquet or JSON modules. Third-party formats can register
+    through the ``entry_point_group`` entry points, e.g. in ``pyproject.toml``::
+
+        [project.entry-points."stock_data_cli.loaders"]
+        ".xlsx" = "my_package.excel:ExcelLoader"
+
+    Entry points are only scanned when an extension is not built in.
+    """
+
+    def __init__(self, entry_point_group: str, builtins: Dict[str, str]):
+        self.entry_point_group = entry_point_group
+        self._targets: Dict[str, Union[str, type]] = {}
+        self._entry_points_loaded = False
+        for extension, target in builtins.items():
+            self.register(extension, target)
+
+    def register(self, extension: str, target: Union[str, type]) -> None:
+        """Map an extension (e.g. '.csv', or '' for directories) to a class or 'module:Class' path"""
+        self._targets[self._normalize(extension)] = target
+
+    def get(self, extension: str) -> Optional[type]:
+        """Class registered for the extension, importing it on first use; None if unknown"""
+        extension = self._normalize(extension)
+        if extension not in self._targets:
+            self._load_entry_points()
+        target = self._targets.get(extension)
+        if isinstance(target, str):
+            module_name, class_name = target.split(':')
+            target = getattr(importlib.import_module(module_name), class_name)
+            self._targets[extension] = target
+        return target
+
+    def extensions(self) -> List[str]:
+        self._load_entry_points()
+        return sorted(self._targets)
+
+    @staticmethod
+    def _normalize(extension: str) -> str:
+        extension = extension.lower()
+        return extension if not extension or extension.startswith('.') else '.' + extension
+
+    def _load_entry_points(self) -> None:
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:  # Python < 3.8
+            return
+        found = entry_points()
+        if hasattr(found, 'select'):
+            found = found.select(group=self.entry_point_group)
+        else:
+            found = found.get(self.entry_point_group, [])
+        for entry_point in found:
+            # built-in formats win over plugins claiming the same extension
+            self._targets.setdefault(self._normalize(entry_point.name), entry_point.value)
+
+
+LOADERS = FormatRegistry('stock_data_cli.loaders', {
+    '.csv': f'{__package__}.csv_loader:CsvLoader',
+    '.json': f'{__package__}.json_loader:JsonLoader',
+    '.jsonl': f'{__package__}.json_loader:JsonLoader',
+    '.ndjson': f'{__package__}.json_loader:JsonLoader',
+    '.parquet': f'{__package__}.parquet_loader:ParquetLoader',
+    '.pq': f'{__package__}.parquet_loader:ParquetLoader',
+    '.arrow': f'{__package__}.arrow_loader:ArrowLoader',
+    '.feather': f'{__package__}.arrow_loader:ArrowLoader',
+    '': f'{__package__}.dataset_loader:DatasetLoader',
+})
+
+SAVERS = FormatRegistry('stock_data_cli.savers', {
+    '.csv': f'{__package__}.csv_saver:CsvSaver',
+    '.json': f'{__package__}.json_saver:JsonSaver',
+    '.jsonl': f'{__package__}.jsonl_saver:JsonLinesSaver',
+    '.ndjson': f'{__package__}.jsonl_saver:JsonLinesSaver',
+    '.parquet': f'{__package__}.parquet_saver:ParquetSaver',
+    '.pq': f'{__package__}.parquet_saver:ParquetSaver',
+    '.arrow': f'{__package__}.arrow_saver:ArrowSaver',
+    '.feather': f'{__package__}.arrow_saver:ArrowSaver',
+    '': f'{__package__}.dataset_saver:DatasetSaver',
+})
+
+
+def register_loader(extension: str, target: Union[str, type]) -> None:
+    LOADERS.register(extension, target)
+
+
+def register_saver(extension: str, target: Union[str, type]) -> None:
+    SAVERS.register(extension, target)
@@ -0,0 +1,7 @@
+from .pipeline import adjusted_blocks, write_pipelined, ResultPreview
+
+__all__ = [
+    'adjusted_blocks',
+    'write_pipelined',
+    'ResultPreview'
+]
@@ -0,0 +1,104 @@
+from typing import Iterable, Iterator, Optional
+import pandas as pd
+
+from ..returns.segments import sorted_by_ticker_and_date
+from ..returns.parallel_adjusted import MODES
+
+BLOCK_ROWS = 250_000
+
+
+def adjusted_blocks(data: pd.DataFrame, mode: str = 'forward', block_rows: int = BLOCK_ROWS,
+                    profiler=None) -> Iterator[pd.DataFrame]:
+    """Yield the adjusted rows in ticker/date order, a few whole tickers at a time.
+
+    Only the ticker and date columns are sorted, and not at all when ``data``
+    is already in order; each block is taken from ``data`` by position (a
+    new frame, not a view) and adjusted in place on its own, so the full
+    result frame is never built. Blocks hold whole tickers and at least
+    ``block_rows`` rows (except the last), which keeps Parquet row groups
+    and CSV chunks a useful size. Tickers are independent, so the
+    concatenated blocks equal the single-call result. With an enabled
+    ``profiler`` every ticker is adjusted and recorded separately, as in
+    ``adjust_by_ticker``.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode}. Expected one of {tuple(MODES)}")
+    adjuster_class, method, _ = MODES[mode]
+    per_ticker = profiler is not None and profiler.enabled
+
+    keys = data[['ticker_symbol', 'datetime']].reset_index(drop=True)
+    keys, segments = sorted_by_ticker_and_date(keys, inplace=True)
+    order = keys.index.to_numpy()
+    del keys
+
+    if len(segments) == 0:
+        # one empty block, so the saver still writes the header/schema
+        yield getattr(adjuster_class(data.iloc[:0]), method)()
+        return
+
+    block_start = 0
+    parts = []
+    for ticker, start, stop in segments:
+        if per_ticker:
+            with profiler.ticker(ticker, rows=stop - start):
+                parts.append(getattr(adjuster_class(data.take(order[start:stop]), inplace=True), method)())
+        if stop - block_start < block_rows and stop < segments.num_rows:
+            continue
+        if per_ticker:
+            yield pd.concat(parts)
+            parts = []
+        else:
+            yield getattr(adjuster_class(data.take(order[block_start:stop]), inplace=True), method)()
+        block_start = stop
+
+
+class ResultPreview:
+    """First and last ``rows`` rows of a stream of blocks, plus the total count.
+
+    Printing it looks like printing the whole frame with pandas' truncated
+    display, but only ``2 * rows`` rows are ever kept.
+    """
+
+    def __init__(self, rows: int = 5):
+        self.rows = rows
+        self.head: Optional[pd.DataFrame] = None
+        self.tail: Optional[pd.DataFrame] = None
+        self.total = 0
+
+    def add(self, block: pd.DataFrame) -> None:
+        self.total += len(block)
+        if self.head is None:
+            self.head = block.iloc[:0]
+            self.tail = block.iloc[:0]
+        if len(self.head) < self.rows:
+            self.head = pd.concat([self.head, block.iloc[:self.rows - len(self.head)]])
+        self.tail = pd.concat([self.tail, block.iloc[-self.rows:]]).iloc[-self.rows:]
+
+    def __str__(self) -> str:
+        if self.head is None:
+            return "Empty DataFrame"
+        if self.total <= 2 * self.rows:
+            skipped = self.total - len(self.head)
+            frame = pd.concat([self.head, self.tail.iloc[len(self.tail) - skipped:]]) if skipped else self.head
+            return frame.to_string()
+
+        lines = pd.concat([self.head, self.tail]).to_string().split('\n')
+        lines.insert(len(lines) - len(self.tail), '...')
+        lines += ['', f'[{self.total} rows x {len(self.head.columns)} columns]']
+        return '\n'.join(lines)
+
+
+def write_pipelined(blocks: Iterable[pd.DataFrame], saver, preview: ResultPreview = None) -> int:
+    """Hand each block to ``saver.save_batches`` as it is produced; returns the number of rows written"""
+    rows = 0
+
+    def counted():
+        nonlocal rows
+        for block in blocks:
+            rows += len(block)
+            if preview is not None:
+                preview.add(block)
+            yield block
+
+    saver.save_batches(counted())
+    return rows
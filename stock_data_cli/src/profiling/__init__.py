@@ -0,0 +1,8 @@
+from .profiler import Profiler, ProfileRecord
+from .ticker_profile import adjust_by_ticker
+
+__all__ = [
+    'Profiler',
+    'ProfileRecord',
+    'adjust_by_ticker'
+]
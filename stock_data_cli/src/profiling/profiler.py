@@ -0,0 +1,165 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process (peak RSS where the current value is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024  # kilobytes on Linux
+    except ImportError:
+        return None
+
+
+class ProfileRecord(NamedTuple):
+    kind: str  # 'stage' or 'ticker'
+    name: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_mb: Optional[float]
+    rows: Optional[int]
+
+
+class Measurement:
+    """An open stage; ``rows`` can be set inside the ``with`` block once it is known"""
+
+    def __init__(self, rows: Optional[int] = None):
+        self.rows = rows
+        self.peak_rss = None
+
+    def observe(self, rss: Optional[int]) -> None:
+        if rss is not None and (self.peak_rss is None or rss > self.peak_rss):
+            self.peak_rss = rss
+
+
+class _RssSampler:
+    """Background thread updating the peak RSS of every open measurement.
+
+    The thread runs only while a measurement is open: it is started by the
+    first ``add`` and stopped (and joined) when the last one is removed.
+    """
+
+    INTERVAL = 0.005
+    THREAD_NAME = 'rss-sampler'
+
+    def __init__(self):
+        self.active = set()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = None
+
+    def add(self, measurement: Measurement) -> None:
+        measurement.observe(current_rss_bytes())
+        with self._lock:
+            self.active.add(measurement)
+            if self._thread is None:
+                self._stop = threading.Event()
+                self._thread = threading.Thread(target=self._run, args=(self._stop,),
+                                                name=self.THREAD_NAME, daemon=True)
+                self._thread.start()
+
+    def remove(self, measurement: Measurement) -> None:
+        measurement.observe(current_rss_bytes())
+        with self._lock:
+            self.active.discard(measurement)
+            if self.active or self._thread is None:
+                return
+            thread, self._thread = self._thread, None
+            self._stop.set()
+        thread.join()  # outside the lock, which the thread takes on every sample
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.wait(self.INTERVAL):
+            rss = current_rss_bytes()
+            with self._lock:
+                for measurement in self.active:
+                    measurement.observe(rss)
+
+
+class Profiler:
+    """Wall time, CPU time, peak RSS and rows of pipeline stages and of individual tickers.
+
+    Wrap work in ``with profiler.stage('load') as m:`` (or ``profiler.ticker``)
+    and set ``m.rows`` when the row count is known. Finished records are kept
+    in ``records`` and passed to ``on_record`` as they complete, which is the
+    hook for feeding them to monitoring as a run progresses. A disabled
+    profiler measures nothing, so call sites need no conditionals.
+    """
+
+    def __init__(self, enabled: bool = True, on_record: Callable[[ProfileRecord], None] = None):
+        self.enabled = enabled
+        self.on_record = on_record
+        self.records: List[ProfileRecord] = []
+        self._sampler = _RssSampler()
+
+    def stage(self, name: str, rows: Optional[int] = None):
+        return self._measure('stage', name, rows)
+
+    def ticker(self, ticker: str, rows: Optional[int] = None):
+        return self._measure('ticker', str(ticker), rows)
+
+    @contextmanager
+    def _measure(self, kind: str, name: str, rows: Optional[int]) -> Iterator[Measurement]:
+        measurement = Measurement(rows)
+        if not self.enabled:
+            yield measurement
+            return
+
+        self._sampler.add(measurement)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield measurement
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            self._sampler.remove(measurement)
+            peak = None if measurement.peak_rss is None else measurement.peak_rss / 2 ** 20
+            record = ProfileRecord(kind, name, wall, cpu, peak, measurement.rows)
+            self.records.append(record)
+            if self.on_record is not None:
+                self.on_record(record)
+
+    @property
+    def stages(self) -> List[ProfileRecord]:
+        return [r for r in self.records if r.kind == 'stage']
+
+    @property
+    def tickers(self) -> List[ProfileRecord]:
+        return [r for r in self.records if r.kind == 'ticker']
+
+    def summary(self, top_tickers: int = 10) -> str:
+        """Stage table plus the slowest tickers"""
+        def table(records):
+            lines = [f"{'name':<16}{'wall s':>10}{'cpu s':>10}{'peak RSS MB':>13}{'rows':>12}"]
+            for r in records:
+                peak = '-' if r.peak_rss_mb is None else f'{r.peak_rss_mb:.1f}'
+                rows = '-' if r.rows is None else f'{r.rows:,}'
+                lines.append(f"{r.name:<16}{r.wall_seconds:>10.3f}{r.cpu_seconds:>10.3f}{peak:>13}{rows:>12}")
+            return lines
+
+        lines = ["Stages:"] + table(self.stages)
+        tickers = sorted(self.tickers, key=lambda r: r.wall_seconds, reverse=True)[:top_tickers]
+        if tickers:
+            lines += ["", f"Slowest tickers ({len(tickers)} of {len(self.tickers)}):"] + table(tickers)
+        return "\n".join(lines)
+
+    def report(self) -> dict:
+        """Machine-readable report: every stage and ticker record"""
+        return {
+            'stages': [r._asdict() for r in self.stages],
+            'tickers': [r._asdict() for r in self.tickers],
+        }
+
+    def write_report(self, filepath: str) -> None:
+        with open(filepath, 'w') as f:
+            json.dump(self.report(), f, indent=2)
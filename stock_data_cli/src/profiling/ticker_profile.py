@@ -0,0 +1,28 @@
+import pandas as pd
+
+from ..returns.segments import sorted_by_ticker_and_date
+from ..returns.parallel_adjusted import MODES
+from .profiler import Profiler
+
+
+def adjust_by_ticker(data: pd.DataFrame, mode: str, profiler: Profiler) -> pd.DataFrame:
+    """Adjust ``data`` one ticker at a time, recording a 'sort' and an 'adjust' stage plus every ticker.
+
+    Tickers are independent, so the result equals a single adjuster call on
+    the whole frame; the per-call overhead is the price of the breakdown.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode: {mode}. Expected one of {tuple(MODES)}")
+    adjuster_class, method, _ = MODES[mode]
+
+    with profiler.stage('sort', rows=len(data)):
+        df, segments = sorted_by_ticker_and_date(data)
+
+    with profiler.stage('adjust', rows=len(df)):
+        if len(segments) == 0:
+            return getattr(adjuster_class(df), method)()
+        parts = []
+        for ticker, start, stop in segments:
+            with profiler.ticker(ticker, rows=stop - start):
+                parts.append(getattr(adjuster_class(df.iloc[start:stop]), method)())
+        return pd.concat(parts)
@@ -1,3 +1,41 @@
-# filepath: stock-data-cli/src/returns/__init__.py
+from importlib import import_module
 
-# This file is intentionally left blank.
\ No newline at end of file
+# name -> submodule; imported on first use so e.g. pyarrow is only loaded by the engines that need it
+_EXPORTS = {
+    'TickerSegments': 'segments',
+    'ForwardAdjusted': 'forward_adjusted',
+    'BackwardAdjusted': 'backward_adjusted',
+    'ParallelAdjusted': 'parallel_adjusted',
+    'StreamingForwardAdjusted': 'streaming_adjusted',
+    'StreamingBackwardAdjusted': 'streaming_adjusted',
+    'IncrementalAdjusted': 'incremental_adjusted',
+    'FactorStore': 'factor_store',
+    'ArrowAdjusted': 'arrow_adjusted',
+    'CombinedAdjusted': 'combined_adjusted',
+    'AdjustedPriceIndex': 'price_index',
+    'ReturnsMatrix': 'returns_matrix',
+    'ExternalSort': 'external_sort',
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(import_module(f'.{_EXPORTS[name]}', __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    'TickerSegments',
+    'ForwardAdjusted',
+    'BackwardAdjusted',
+    'ParallelAdjusted',
+    'StreamingForwardAdjusted',
+    'StreamingBackwardAdjusted',
+    'IncrementalAdjusted',
+    'FactorStore',
+    'ArrowAdjusted',
+    'CombinedAdjusted',
+    'AdjustedPriceIndex',
+    'ReturnsMatrix',
+    'ExternalSort'
+]
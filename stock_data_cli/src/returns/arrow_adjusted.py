@@ -0,0 +1,73 @@
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from .segments import TickerSegments
+from .forward_adjusted import forward_adjusted_prices
+from .backward_adjusted import backward_adjusted_prices
+
+PRICE_FUNCTIONS = {
+    'forward': [(forward_adjusted_prices, 'forward_adj_close')],
+    'backward': [(backward_adjusted_prices, 'backward_adj_close')],
+    'both': [(forward_adjusted_prices, 'forward_adj_close'), (backward_adjusted_prices, 'backward_adj_close')],
+}
+
+
+def _numpy_column(table: pa.Table, name: str) -> np.ndarray:
+    """Float64 view of a column; zero-copy when it is a single chunk without nulls"""
+    column = table.column(name)
+    if column.num_chunks == 1:
+        column = column.chunk(0)
+    else:
+        column = column.combine_chunks()
+    if not pa.types.is_float64(column.type):
+        column = column.cast(pa.float64())
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _sorted_by_ticker_and_date(table: pa.Table) -> pa.Table:
+    """Sort by ticker and date(oldest -> newest), including dictionary-encoded tickers"""
+    tickers = table.column('ticker_symbol')
+    if not pa.types.is_dictionary(tickers.type):
+        return table.sort_by([('ticker_symbol', 'ascending'), ('datetime', 'ascending')])
+
+    # Arrow cannot sort dictionary columns: sort by each index's rank in the sorted dictionary
+    tickers = tickers.unify_dictionaries().combine_chunks()
+    rank = pc.rank(tickers.dictionary, sort_keys='ascending', tiebreaker='dense')
+    keys = pa.table({'ticker_rank': pc.take(rank, tickers.indices), 'datetime': table.column('datetime')})
+    order = pc.sort_indices(keys, sort_keys=[('ticker_rank', 'ascending'), ('datetime', 'ascending')])
+    return table.take(order)
+
+
+class ArrowAdjusted:
+    """Forward/backward adjustment computed directly on a pyarrow Table.
+
+    The table is sorted with Arrow kernels, the price columns are read as
+    NumPy views of the Arrow buffers and the adjusted column(s) are appended
+    as new Arrow arrays (``mode='both'`` adds forward and backward), so no
+    pandas conversion happens. Values are the same as the vectorized
+    ``ForwardAdjusted`` / sparse ``BackwardAdjusted``.
+    """
+
+    def __init__(self, table: pa.Table, mode: str = 'forward'):
+        if mode not in PRICE_FUNCTIONS:
+            raise ValueError(f"Unknown mode: {mode}. Expected one of {tuple(PRICE_FUNCTIONS)}")
+        self.table = table
+        self.mode = mode
+
+    def adjust(self) -> pa.Table:
+        table = _sorted_by_ticker_and_date(self.table)
+        segments = TickerSegments.from_arrow(table)
+
+        price = _numpy_column(table, 'unadjusted_close')
+        split = _numpy_column(table, 'split')
+        dividend = _numpy_column(table, 'dividend')
+        # float32 prices give float32 columns
+        is_float32 = pa.types.is_float32(table.schema.field('unadjusted_close').type)
+
+        for price_function, column in PRICE_FUNCTIONS[self.mode]:
+            adjusted = price_function(price, split, dividend, segments)
+            if is_float32:
+                adjusted = adjusted.astype(np.float32)
+            table = table.append_column(column, pa.array(adjusted))
+        return table
@@ -1,37 +1,149 @@
+import numpy as np
+
+from .segments import sorted_by_ticker_and_date
+
+
+def backward_event_factors(price, split, dividend, group, last):
+    """Cumulative backward factor at split/dividend event rows.
+
+    Inputs hold only the event rows, in ticker/date order; ``last`` flags
+    events on a ticker's most recent row. Returns, per event, the factor
+    that applies to the rows of the same ticker before it.
+    """
+    # walk the events newest -> oldest, replaying the loop's arithmetic
+    factor = np.ones(len(price))
+    cumulative_factor = 1.0
+    current_group = None
+    for j in range(len(price) - 1, -1, -1):
+        if group[j] != current_group:
+            current_group = group[j]
+            cumulative_factor = 1.0
+
+        if last[j]:
+            adjusted = price[j]  # most recent price unchanged
+        else:
+            adjusted = round(price[j] * cumulative_factor, 2)
+
+        event_split = split[j] or 1.0
+        event_dividend = dividend[j]
+        if event_split != 1.0:
+            cumulative_factor /= event_split
+        if event_dividend > 0:
+            cumulative_factor *= (adjusted - event_dividend) / adjusted
+
+        factor[j] = cumulative_factor
+
+    return factor
+
+
+def backward_factors(price, split, dividend, segments):
+    """Cumulative backward factor of every row of ticker/date ordered arrays"""
+    first = segments.first
+    last = segments.last
+    group = segments.group_ids
+
+    # an event on row k adjusts every earlier row of the same ticker;
+    # the first row of a ticker has no earlier rows to adjust
+    is_event = ((split != 1.0) & (split != 0.0)) | (dividend > 0)
+    is_event &= ~first
+    events = np.flatnonzero(is_event)
+
+    factor = backward_event_factors(price[events], split[events], dividend[events],
+                                    group[events], last[events])
+
+    # broadcast: each row takes the factor of the first later event in its ticker
+    row_factor = np.ones(len(price))
+    if len(events):
+        nxt = np.searchsorted(events, np.arange(len(price)), side='right')
+        has_next = nxt < len(events)
+        nxt_clipped = np.minimum(nxt, len(events) - 1)
+        has_next &= group[events[nxt_clipped]] == group
+        row_factor[has_next] = factor[nxt_clipped[has_next]]
+    return row_factor
+
+
+def backward_adjusted_prices(price, split, dividend, segments):
+    """Event-sparse backward adjusted prices of ticker/date ordered arrays"""
+    last = segments.last
+    adjusted_prices = np.round(price * backward_factors(price, split, dividend, segments), 2)
+    adjusted_prices[last] = price[last]  # most recent price unchanged
+
+    return adjusted_prices
+
+
 class BackwardAdjusted:
-    def __init__(self, data):
+    """Backward adjusted prices: the most recent price of each ticker stays unchanged.
+
+    Two engines are available:
+
+    - ``'sparse'`` (default) only walks the split/dividend rows, computes the
+      cumulative backward factor at each of them and broadcasts it over the
+      price segments between events with ``searchsorted``. The cost scales
+      with the number of corporate actions plus one vectorized multiply.
+    - ``'loop'`` is the original per-row reference implementation.
+
+    The sparse engine replays the loop's arithmetic at the event rows
+    (including the rounded adjusted price used for dividends), so both
+    engines produce the same ``backward_adj_close`` values.
+
+    As with ``ForwardAdjusted``, sorted input is not re-sorted and
+    ``inplace=True`` adds the column to the input frame instead of a copy.
+    """
+
+    ENGINES = ('sparse', 'loop')
+
+    def __init__(self, data, engine='sparse', inplace=False):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown engine: {engine}. Expected one of {self.ENGINES}")
         self.data = data
+        self.engine = engine
+        self.inplace = inplace
 
     def backward_adj(self):
-        df = self.data.copy()
-
-        # sort by ticker and date(oldest -> newest)
-        df = df.sort_values(['ticker_symbol', 'datetime'], ascending=[True, True])
-        
-        for ticker in df['ticker_symbol'].unique():
-            mask = df['ticker_symbol'] == ticker
-            sub = df.loc[mask].copy()  # Get data for just this ticker
-            
+        # sort by ticker and date(oldest -> newest), unless already in order
+        df, segments = sorted_by_ticker_and_date(self.data, inplace=self.inplace)
+
+        if self.engine == 'loop':
+            return self._backward_adj_loop(df, segments)
+        return self._backward_adj_sparse(df, segments)
+
+    def _backward_adj_sparse(self, df, segments):
+        price = df['unadjusted_close'].to_numpy(dtype=float)
+        split = df['split'].to_numpy(dtype=float)
+        dividend = df['dividend'].to_numpy(dtype=float)
+
+        adjusted = backward_adjusted_prices(price, split, dividend, segments)
+        # float32 prices give a float32 column; other price dtypes give float64
+        df['backward_adj_close'] = adjusted.astype(np.promote_types(df['unadjusted_close'].dtype, np.float32))
+        return df
+
+    def _backward_adj_loop(self, df, segments):
+        result = np.empty(len(df))
+
+        for _, start, stop in segments:
+            sub = df.iloc[start:stop]  # Get data for just this ticker
+
             # Start from most recent (no adjustment needed)
             adjusted_prices = [0] * len(sub)
             adjusted_prices[-1] = sub.iloc[-1]['unadjusted_close']  # most recent price unchanged
 
-            cumulative_factor = 1.0 
-            
+            cumulative_factor = 1.0
+
             # Work backwards from second-to-last
             for i in range(len(sub) - 2, -1, -1):
                 current_price = sub.iloc[i]['unadjusted_close']
                 next_split = sub.iloc[i + 1]['split'] or 1.0
                 next_dividend = sub.iloc[i + 1]['dividend'] or 0.0
-                
+
                 # Update cumulative factor based on next period's events
                 if next_split != 1.0:
                     cumulative_factor /= next_split
                 if next_dividend > 0:
                     cumulative_factor *= (adjusted_prices[i + 1] - next_dividend) / adjusted_prices[i + 1]
-                
+
                 adjusted_prices[i] = round(current_price * cumulative_factor, 2)
-            
-            df.loc[mask, 'backward_adj_close'] = adjusted_prices
-        
-        return df
\ No newline at end of file
+
+            result[start:stop] = adjusted_prices
+
+        df['backward_adj_close'] = result
+        return df
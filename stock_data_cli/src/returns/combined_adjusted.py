@@ -0,0 +1,33 @@
+import numpy as np
+
+from .segments import sorted_by_ticker_and_date
+from .forward_adjusted import forward_adjusted_prices
+from .backward_adjusted import backward_adjusted_prices
+
+
+class CombinedAdjusted:
+    """Forward and backward adjusted prices computed in one pass.
+
+    The frame is copied (or, with ``inplace=True``, used as is) and sorted
+    once if it is not already in order, the per-ticker index is built once
+    and the price columns are read once; both ``forward_adj_close`` and
+    ``backward_adj_close`` are added to the same frame. Values are the same
+    as ``ForwardAdjusted`` (vectorized) and ``BackwardAdjusted`` (sparse).
+    """
+
+    def __init__(self, data, inplace=False):
+        self.data = data
+        self.inplace = inplace
+
+    def adjust(self):
+        # sort by ticker and date(oldest -> newest), unless already in order
+        df, segments = sorted_by_ticker_and_date(self.data, inplace=self.inplace)
+        price = df['unadjusted_close'].to_numpy(dtype=float)
+        split = df['split'].to_numpy(dtype=float)
+        dividend = df['dividend'].to_numpy(dtype=float)
+
+        # float32 prices give float32 columns; other price dtypes give float64
+        dtype = np.promote_types(df['unadjusted_close'].dtype, np.float32)
+        df['forward_adj_close'] = forward_adjusted_prices(price, split, dividend, segments).astype(dtype)
+        df['backward_adj_close'] = backward_adjusted_prices(price, split, dividend, segments).astype(dtype)
+        return df
@@ -0,0 +1,246 @@
+import os
+import shutil
+import tempfile
+from typing import Iterable, Iterator, List, Optional
+import numpy as np
+import pandas as pd
+
+from ..loader.base_loader import REQUIRED_COLUMNS
+from .streaming_adjusted import StreamingForwardAdjusted, StreamingBackwardAdjusted
+
+DEFAULT_MEMORY_BUDGET = 1024 ** 3
+MIN_MERGE_ROWS = 1_000
+RUN_BATCH_ROWS = 8_192
+
+
+def _sorted_table(table):
+    """``table`` ordered by ticker and date, keeping the order of equal keys"""
+    import pyarrow.compute as pc
+    # rank the distinct tickers once, then two stable integer sorts (faster than sorting strings)
+    encoded = pc.dictionary_encode(table.column('ticker_symbol').combine_chunks())
+    ranks = pc.rank(encoded.dictionary, sort_keys='ascending', tiebreaker='first').to_numpy()
+    codes = ranks[encoded.indices.to_numpy()]
+    dates = table.column('datetime').combine_chunks().to_numpy().view(np.int64)
+    order = np.argsort(dates, kind='stable')
+    order = order[np.argsort(codes[order], kind='stable')]
+    return table.take(order)
+
+
+class _RunCursor:
+    """Reads one sorted run from its Arrow file, a block of record batches at a time"""
+
+    def __init__(self, path: str, block_rows: int):
+        import pyarrow as pa
+        # plain reads rather than a memory map, so finished blocks do not stay resident
+        self.reader = pa.ipc.open_file(pa.OSFile(path, 'r'))
+        self.block_rows = block_rows
+        self.next_batch = 0
+        self.block = None
+        self.offset = 0
+
+    def fill(self) -> bool:
+        """Load the next block once the current one is used up; False when the run is finished"""
+        if self.block is not None and self.offset < len(self.block):
+            return True
+        if self.next_batch >= self.reader.num_record_batches:
+            return False
+        import pyarrow as pa
+        batches, rows = [], 0
+        while rows < self.block_rows and self.next_batch < self.reader.num_record_batches:
+            batches.append(self.reader.get_batch(self.next_batch))
+            rows += batches[-1].num_rows
+            self.next_batch += 1
+        self.block = pa.Table.from_batches(batches)
+        self.offset = 0
+        self.tickers = self.block.column('ticker_symbol').combine_chunks()
+        self.dates = self.block.column('datetime').to_numpy().view(np.int64)
+        return True
+
+    def key(self, i: int):
+        return self.tickers[i].as_py(), int(self.dates[i])
+
+    def last_key(self):
+        return self.key(len(self.block) - 1)
+
+    def take_through(self, key):
+        """Remove and return the rows of the block ordered at or before ``key`` (a pyarrow Table)"""
+        # binary search on (ticker, date); only the probed tickers become Python strings
+        lo, hi = self.offset, len(self.block)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key(mid) <= key:
+                lo = mid + 1
+            else:
+                hi = mid
+        rows = self.block.slice(self.offset, lo - self.offset)
+        self.offset = lo
+        return rows
+
+
+class ExternalSort:
+    """Order price rows by ticker and date within a memory budget, spilling to disk.
+
+    ``batches`` (e.g. ``loader.iter_batches()``) are read once, converted
+    to Arrow and collected into runs of about half of ``memory_budget``
+    bytes (sorting a run copies it); each run is sorted with a stable Arrow
+    sort and written to ``temp_dir`` as an Arrow IPC file of small record
+    batches. ``batches()`` then merges the runs: every run is read a block
+    at a time, the rows of all blocks up to the smallest last key among them
+    are sorted and yielded, and the used-up blocks are refilled. The blocks
+    take a third of the budget, so memory stays bounded whatever the input
+    size or order, e.g. for date-major vendor files.
+
+    The merged stream is grouped by ticker and ordered by date, which is
+    what ``StreamingForwardAdjusted`` and ``StreamingBackwardAdjusted``
+    consume; ``adjusted_batches`` runs them (and both together). Rows with
+    equal ticker and date keep their input order. Tickers are compared as
+    strings and dates as timestamps. An input without rows gives one empty
+    frame (with the columns of the input's batches, else ``columns``), so a
+    saver still writes the header/schema. Use as a context manager, or call
+    ``close``, to remove the spilled runs.
+    """
+
+    def __init__(self, batches: Iterable[pd.DataFrame], memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                 temp_dir: Optional[str] = None, batch_size: int = 100_000,
+                 columns: List[str] = REQUIRED_COLUMNS):
+        if memory_budget < 1:
+            raise ValueError("Memory budget must be at least 1 byte")
+        self.source = batches
+        self.memory_budget = memory_budget
+        self.temp_dir = temp_dir
+        self.batch_size = batch_size
+        self.columns = list(columns)
+        self.runs: Optional[List[str]] = None
+        self.num_rows = 0
+        self.row_bytes = 0.0
+        self._spill_dir = None
+        self._schema = None
+
+    @classmethod
+    def from_loader(cls, loader, **options) -> 'ExternalSort':
+        """Sort the batches streamed by ``loader`` (its ticker/date filters apply while reading)"""
+        options.setdefault('columns', loader.columns)
+        return cls(loader.iter_batches(), **options)
+
+    def __enter__(self) -> 'ExternalSort':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def spill(self) -> List[str]:
+        """Read the input and write its sorted runs; returns the run files (done once)"""
+        if self.runs is not None:
+            return self.runs
+        import pyarrow as pa
+
+        self._spill_dir = tempfile.mkdtemp(prefix='sort_', dir=self.temp_dir)
+        self.runs = []
+        pending, pending_bytes, total_bytes = [], 0, 0
+
+        def write_run():
+            table = pa.concat_tables(pending)
+            pending.clear()
+            table = _sorted_table(table)
+            path = os.path.join(self._spill_dir, f'run-{len(self.runs):05d}.arrow')
+            with pa.OSFile(path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table, max_chunksize=RUN_BATCH_ROWS)
+            self.runs.append(path)
+
+        for batch in self.source:
+            if len(batch) == 0:
+                if self._schema is None:
+                    self._normalized(batch)  # keep its columns for the empty result
+                continue
+            table = self._normalized(batch)
+            pending.append(table)
+            pending_bytes += table.nbytes
+            total_bytes += table.nbytes
+            self.num_rows += table.num_rows
+            if pending_bytes >= self.memory_budget // 2:
+                write_run()
+                pending_bytes = 0
+        if pending:
+            write_run()
+        self.row_bytes = total_bytes / self.num_rows if self.num_rows else 0.0
+        return self.runs
+
+    def batches(self) -> Iterator[pd.DataFrame]:
+        """Yield all rows in ticker/date order, in frames of at most ``batch_size`` rows"""
+        return self._merged(share=1)
+
+    def _merged(self, share: int) -> Iterator[pd.DataFrame]:
+        """Merge the runs with 1/``share`` of the block memory, for ``share`` merges open at once"""
+        runs = self.spill()
+        if not runs:
+            yield self._empty_frame()
+            return
+        import pyarrow as pa
+
+        block_rows = max(MIN_MERGE_ROWS, self.merge_rows() // share)
+        cursors = [_RunCursor(path, block_rows) for path in runs]
+        active = [cursor for cursor in cursors if cursor.fill()]
+        while active:
+            # every row up to the smallest last key is in memory: nothing later can sort before it
+            bound = min(cursor.last_key() for cursor in active)
+            parts = [part for part in (cursor.take_through(bound) for cursor in active) if part.num_rows]
+            piece = pa.concat_tables(parts)
+            if len(parts) > 1:
+                piece = _sorted_table(piece)  # stable: equal keys keep the run order
+            for start in range(0, piece.num_rows, self.batch_size):
+                yield piece.slice(start, self.batch_size).to_pandas()
+            active = [cursor for cursor in active if cursor.fill()]
+
+    def merge_rows(self) -> int:
+        """Rows per run block during the merge, so all blocks together take a third of the budget"""
+        runs = len(self.spill())
+        if runs == 0 or self.row_bytes == 0:
+            return MIN_MERGE_ROWS
+        return max(MIN_MERGE_ROWS, int(self.memory_budget / 3 / runs / self.row_bytes))
+
+    def adjusted_batches(self, mode: str = 'forward') -> Iterator[pd.DataFrame]:
+        """Adjust the merged stream with the streaming adjusters ('forward', 'backward' or 'both').
+
+        Backward adjustment reads the stream twice, so the runs are merged
+        once per pass; 'both' merges three times.
+        """
+        if mode == 'forward':
+            return StreamingForwardAdjusted(self.batches()).forward_adj()
+        if mode == 'backward':
+            return StreamingBackwardAdjusted(self.batches).backward_adj()
+        if mode == 'both':
+            return self._both()
+        raise ValueError(f"Unknown mode: {mode}. Expected one of ('forward', 'backward', 'both')")
+
+    def _both(self) -> Iterator[pd.DataFrame]:
+        # the merge is deterministic, so both streams have the same batches; each
+        # pass of the backward adjuster is open together with the forward stream
+        forward = StreamingForwardAdjusted(self._merged(share=2)).forward_adj()
+        backward = StreamingBackwardAdjusted(lambda: self._merged(share=2)).backward_adj()
+        for forward_batch, backward_batch in zip(forward, backward):
+            forward_batch['backward_adj_close'] = backward_batch['backward_adj_close'].to_numpy()
+            yield forward_batch
+
+    def _empty_frame(self) -> pd.DataFrame:
+        if self._schema is not None:
+            return self._schema.empty_table().to_pandas()
+        dtypes = {'ticker_symbol': object, 'datetime': 'datetime64[ns]'}
+        return pd.DataFrame({column: pd.Series(dtype=dtypes.get(column, float)) for column in self.columns})
+
+    def _normalized(self, batch: pd.DataFrame):
+        """The batch as a pyarrow Table with plain string tickers and the schema of the first batch"""
+        import pyarrow as pa
+        if not pd.api.types.is_datetime64_any_dtype(batch['datetime']):
+            batch = batch.assign(datetime=pd.to_datetime(batch['datetime']))
+        table = pa.Table.from_pandas(batch, preserve_index=False).replace_schema_metadata(None)
+        i = table.schema.get_field_index('ticker_symbol')
+        table = table.set_column(i, 'ticker_symbol', table.column(i).cast(pa.string()))
+        if self._schema is None:
+            self._schema = table.schema
+        return table.cast(self._schema)
\ No newline at end of file
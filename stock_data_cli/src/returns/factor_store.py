@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+
+from .segments import TickerSegments, sorted_by_ticker_and_date
+from .backward_adjusted import backward_event_factors
+
+EVENT_COLUMNS = ['ticker_symbol', 'datetime', 'unadjusted_close', 'split', 'dividend']
+FACTOR_COLUMNS = ['forward_factor', 'backward_factor']
+
+
+class FactorStore:
+    """Compact per-ticker table of corporate actions and cumulative factors.
+
+    One row per split/dividend plus each ticker's first and last row, with:
+
+    - ``forward_factor``: factor for the rows *after* this date up to the next stored row
+    - ``backward_factor``: factor for the rows *before* this date back to the previous stored row
+
+    Adjusted prices are derived on read with a binary search per ticker and
+    one vectorized multiply, and match ``ForwardAdjusted``/``BackwardAdjusted``
+    exactly. Because the store keeps the raw event rows, it can be rebuilt
+    (e.g. after appending new corporate actions) without rescanning prices.
+    """
+
+    def __init__(self, table: pd.DataFrame):
+        self.table = table.reset_index(drop=True)
+        self.segments = TickerSegments.from_frame(self.table)
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame) -> 'FactorStore':
+        """Build the store from price rows, or from an already reduced event table"""
+        df = data[EVENT_COLUMNS].sort_values(['ticker_symbol', 'datetime'], kind='mergesort')
+        segments = TickerSegments.from_frame(df)
+
+        split = df['split'].to_numpy(dtype=float)
+        dividend = df['dividend'].to_numpy(dtype=float)
+        keep = ((split != 1.0) & (split != 0.0)) | (dividend > 0)
+        keep[segments.starts] = True
+        keep[segments.stops - 1] = True
+
+        table = df.iloc[np.flatnonzero(keep)].reset_index(drop=True)
+        return cls(cls._with_factors(table))
+
+    @staticmethod
+    def _with_factors(table: pd.DataFrame) -> pd.DataFrame:
+        segments = TickerSegments.from_frame(table)
+        price = table['unadjusted_close'].to_numpy(dtype=float)
+        split = table['split'].to_numpy(dtype=float)
+        dividend = table['dividend'].to_numpy(dtype=float)
+        group = segments.group_ids
+
+        # forward: same operation order as forward_factors, so values are bit-identical
+        split_norm = np.where(split == 0, 1.0, split)
+        dividend_norm = np.where(dividend > 0, dividend, 0.0)
+        split_after = pd.Series(split_norm).groupby(group).cumprod().to_numpy()
+        split_before = np.roll(split_after, 1)
+        split_before[segments.first] = 1.0
+        reinvest = np.divide(dividend_norm, price * split_before, out=np.zeros(len(table)),
+                             where=dividend_norm > 0)  # a missing price without a dividend adds nothing
+        reinvest_after = pd.Series(reinvest).groupby(group).cumsum().to_numpy()
+        forward_factor = split_after * (1.0 + reinvest_after)
+
+        # backward: factor of the first event at or after each stored row
+        is_event = ((split != 1.0) & (split != 0.0)) | (dividend > 0)
+        is_event &= ~segments.first
+        events = np.flatnonzero(is_event)
+        event_factor = backward_event_factors(price[events], split[events], dividend[events],
+                                              group[events], segments.last[events])
+        backward_factor = np.ones(len(table))
+        if len(events):
+            nxt = np.searchsorted(events, np.arange(len(table)), side='left')
+            has_next = nxt < len(events)
+            nxt_clipped = np.minimum(nxt, len(events) - 1)
+            has_next &= group[events[nxt_clipped]] == group
+            backward_factor[has_next] = event_factor[nxt_clipped[has_next]]
+
+        return table.assign(forward_factor=forward_factor, backward_factor=backward_factor)
+
+    def rebuild(self) -> 'FactorStore':
+        """Recompute the factors from the stored corporate-action rows alone"""
+        return FactorStore.from_frame(self.table[EVENT_COLUMNS])
+
+    def save(self, filepath: str) -> None:
+        """Persist the store (Parquet recommended) through the matching saver"""
+        from ..loader.base_saver import BaseSaver
+        BaseSaver.get_saver_for_file(filepath).save(self.table)
+
+    @classmethod
+    def load(cls, filepath: str) -> 'FactorStore':
+        from ..loader.base_loader import BaseLoader
+        loader = BaseLoader.get_loader_for_file(filepath, columns=EVENT_COLUMNS + FACTOR_COLUMNS)
+        return cls(loader.load_data())
+
+    def adjust(self, data: pd.DataFrame, mode: str = 'forward') -> pd.DataFrame:
+        """Add forward_adj_close or backward_adj_close to price rows using the stored factors"""
+        if mode not in ('forward', 'backward'):
+            raise ValueError(f"Unknown mode: {mode}. Expected one of ('forward', 'backward')")
+
+        df, segments = sorted_by_ticker_and_date(data)
+        dates = df['datetime'].to_numpy()
+        price = df['unadjusted_close'].to_numpy(dtype=float)
+
+        store_dates = self.table['datetime'].to_numpy()
+        store_factor = self.table[f'{mode}_factor'].to_numpy(dtype=float)
+
+        factor = np.ones(len(df))
+        anchor = np.zeros(len(df), dtype=bool)
+        for ticker, start, stop in segments:
+            if ticker not in self.segments:
+                raise ValueError(f"Ticker {ticker} is not in the factor store")
+            rows = self.segments[ticker]
+            ticker_dates = store_dates[rows]
+            ticker_factor = store_factor[rows]
+            row_dates = dates[start:stop]
+
+            if mode == 'forward':
+                # events on a day affect the following days
+                idx = np.searchsorted(ticker_dates, row_dates, side='left') - 1
+                found = idx >= 0
+                anchor[start:stop] = row_dates == ticker_dates[0]
+            else:
+                idx = np.searchsorted(ticker_dates, row_dates, side='right')
+                found = idx < len(ticker_dates)
+                anchor[start:stop] = row_dates == ticker_dates[-1]
+            factor[start:stop][found] = ticker_factor[idx[found]]
+
+        adjusted = np.round(price * factor, 2)
+        adjusted[anchor] = price[anchor]  # first (forward) / most recent (backward) price unchanged
+
+        df[f'{mode}_adj_close'] = adjusted
+        return df
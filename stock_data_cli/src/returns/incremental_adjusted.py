@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+
+from .segments import TickerSegments
+from .forward_adjusted import forward_factors
+from .backward_adjusted import BackwardAdjusted
+
+ADJUSTED_COLUMNS = {
+    'forward': 'forward_adj_close',
+    'backward': 'backward_adj_close',
+}
+
+
+class IncrementalAdjusted:
+    """Extend a previously adjusted frame with newly arrived rows.
+
+    ``existing`` is an earlier output of ``ForwardAdjusted``/``BackwardAdjusted``
+    (including its adjusted column) and ``new_rows`` holds later bars with the
+    required columns only.
+
+    - forward: history never changes; each ticker continues from its last
+      cumulative factor, which is rebuilt from the existing split/dividend
+      rows alone, so the work is O(events + new rows).
+    - backward: only tickers with a split or dividend in the new rows are
+      recomputed; every other existing row is passed through untouched.
+
+    The result equals a full recompute over the combined history.
+    """
+
+    def __init__(self, existing, new_rows, mode: str = 'forward'):
+        if mode not in ADJUSTED_COLUMNS:
+            raise ValueError(f"Unknown mode: {mode}. Expected one of {tuple(ADJUSTED_COLUMNS)}")
+        column = ADJUSTED_COLUMNS[mode]
+        if column not in existing.columns:
+            raise ValueError(f"Existing data has no {column} column to extend")
+        self.existing = existing
+        self.new_rows = new_rows
+        self.mode = mode
+        self.column = column
+
+    def adjust(self) -> pd.DataFrame:
+        existing = self.existing.sort_values(['ticker_symbol', 'datetime'], kind='mergesort')
+        new_rows = self.new_rows.sort_values(['ticker_symbol', 'datetime'], kind='mergesort')
+        if existing['datetime'].dtype != new_rows['datetime'].dtype:
+            existing = existing.assign(datetime=pd.to_datetime(existing['datetime']))
+            new_rows = new_rows.assign(datetime=pd.to_datetime(new_rows['datetime']))
+
+        existing_segments = TickerSegments.from_frame(existing)
+        new_segments = TickerSegments.from_frame(new_rows)
+        self._check_new_rows_are_later(existing, existing_segments, new_rows, new_segments)
+
+        if self.mode == 'forward':
+            existing, new_rows = self._append_forward(existing, existing_segments, new_rows, new_segments)
+        else:
+            existing, new_rows = self._append_backward(existing, existing_segments, new_rows, new_segments)
+
+        combined = pd.concat([existing, new_rows], ignore_index=True)
+        return combined.sort_values(['ticker_symbol', 'datetime'], kind='mergesort', ignore_index=True)
+
+    @staticmethod
+    def _check_new_rows_are_later(existing, existing_segments, new_rows, new_segments):
+        existing_dates = existing['datetime'].to_numpy()
+        new_dates = new_rows['datetime'].to_numpy()
+        for ticker, start, _ in new_segments:
+            if ticker not in existing_segments:
+                continue
+            last = existing_segments[ticker].stop - 1
+            if new_dates[start] <= existing_dates[last]:
+                raise ValueError(f"New rows for {ticker} must be later than the existing rows")
+
+    def _append_forward(self, existing, existing_segments, new_rows, new_segments):
+        # rows without a split or dividend only multiply the factor by 1 and add 0,
+        # so the event rows plus each ticker's last row reproduce the full history
+        split = existing['split'].to_numpy(dtype=float)
+        dividend = existing['dividend'].to_numpy(dtype=float)
+        keep = ((split != 1.0) & (split != 0.0)) | (dividend > 0)
+        keep[existing_segments.stops - 1] = True
+        history = existing.iloc[np.flatnonzero(keep)][list(new_rows.columns)]
+
+        combined = pd.concat([history, new_rows], ignore_index=True)
+        is_new = np.zeros(len(combined), dtype=bool)
+        is_new[len(history):] = True
+        order = np.lexsort((combined['datetime'].to_numpy(), combined['ticker_symbol'].to_numpy()))
+        combined = combined.iloc[order]
+        is_new = is_new[order]
+
+        segments = TickerSegments.from_frame(combined)
+        price = combined['unadjusted_close'].to_numpy(dtype=float)
+        factor = forward_factors(price, combined['split'].to_numpy(dtype=float),
+                                 combined['dividend'].to_numpy(dtype=float), segments)
+        adjusted = np.round(price * factor, 2)
+        first = segments.first
+        adjusted[first] = price[first]  # first price unchanged
+
+        # lexsort is stable, so the new rows come out in their sorted order
+        new_rows = new_rows.assign(**{self.column: adjusted[is_new]})
+        return existing, new_rows
+
+    def _append_backward(self, existing, existing_segments, new_rows, new_segments):
+        split = new_rows['split'].to_numpy(dtype=float)
+        dividend = new_rows['dividend'].to_numpy(dtype=float)
+        is_event = ((split != 1.0) & (split != 0.0)) | (dividend > 0)
+
+        # an event on the first row of a brand-new ticker adjusts nothing
+        is_event[new_segments.starts] &= np.array([t in existing_segments for t in new_segments.tickers], dtype=bool)
+        rescale = [ticker for ticker, start, stop in new_segments if is_event[start:stop].any()]
+
+        # new rows without events have a factor of 1 until the new last row
+        price = new_rows['unadjusted_close'].to_numpy(dtype=float)
+        adjusted = np.round(price, 2)
+        new_last = new_segments.last
+        adjusted[new_last] = price[new_last]  # most recent price unchanged
+        new_rows = new_rows.assign(**{self.column: adjusted})
+
+        # the old last row of an extended ticker is no longer the unchanged anchor
+        existing_adjusted = existing[self.column].to_numpy(dtype=float).copy()
+        existing_price = existing['unadjusted_close'].to_numpy(dtype=float)
+        for ticker, _, _ in new_segments:
+            if ticker in existing_segments:
+                k = existing_segments[ticker].stop - 1
+                existing_adjusted[k] = np.round(existing_price[k], 2)
+        existing = existing.assign(**{self.column: existing_adjusted})
+
+        if not rescale:
+            return existing, new_rows
+
+        # tickers with new events: recompute their (combined) history
+        existing_keep = np.ones(len(existing), dtype=bool)
+        new_keep = np.ones(len(new_rows), dtype=bool)
+        parts = []
+        for ticker in rescale:
+            if ticker in existing_segments:
+                old = existing_segments[ticker]
+                existing_keep[old] = False
+                parts.append(existing.iloc[old].drop(columns=[self.column]))
+            new = new_segments[ticker]
+            new_keep[new] = False
+            parts.append(new_rows.iloc[new].drop(columns=[self.column]))
+
+        recomputed = BackwardAdjusted(pd.concat(parts, ignore_index=True)).backward_adj()
+        existing = pd.concat([existing.iloc[np.flatnonzero(existing_keep)], recomputed], ignore_index=True)
+        return existing, new_rows.iloc[np.flatnonzero(new_keep)]
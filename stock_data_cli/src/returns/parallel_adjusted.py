@@ -0,0 +1,91 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+import numpy as np
+
+from .segments import TickerSegments, sorted_by_ticker_and_date
+from .forward_adjusted import ForwardAdjusted
+from .backward_adjusted import BackwardAdjusted
+from .combined_adjusted import CombinedAdjusted
+
+MODES = {
+    'forward': (ForwardAdjusted, 'forward_adj', ['forward_adj_close']),
+    'backward': (BackwardAdjusted, 'backward_adj', ['backward_adj_close']),
+    'both': (CombinedAdjusted, 'adjust', ['forward_adj_close', 'backward_adj_close']),
+}
+
+
+def _adjust_shard(path: str, start: int, stop: int, mode: str) -> List[np.ndarray]:
+    """Worker entry point: adjust rows [start, stop) of the shared Arrow file"""
+    import pyarrow as pa
+    adjuster_class, method, columns = MODES[mode]
+
+    # memory-mapped read: the pages are shared with every other worker
+    table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    shard = table.slice(start, stop - start).to_pandas()
+
+    result = getattr(adjuster_class(shard), method)()
+    return [result[column].to_numpy() for column in columns]
+
+
+class ParallelAdjusted:
+    """Run forward/backward adjustment on ticker shards across a process pool.
+
+    The frame is sorted once and written to a temporary Arrow IPC file that
+    workers memory-map, so the input is never pickled; each worker only
+    receives a ``(start, stop)`` row range covering whole tickers and sends
+    back the adjusted column(s). Shards are reassembled in the sorted order, so
+    the result is identical to the single-process adjusters.
+    """
+
+    SHARDS_PER_WORKER = 4
+
+    def __init__(self, data, mode: str = 'forward', workers: int = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}. Expected one of {tuple(MODES)}")
+        self.data = data
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+
+    def adjust(self):
+        adjuster_class, method, columns = MODES[self.mode]
+        if self.workers <= 1:
+            return getattr(adjuster_class(self.data), method)()
+
+        df, segments = sorted_by_ticker_and_date(self.data)
+        shards = self.shard_bounds(segments, self.workers * self.SHARDS_PER_WORKER)
+
+        import pyarrow as pa
+        temp_dir = tempfile.mkdtemp(prefix='adjust_')
+        try:
+            path = os.path.join(temp_dir, 'input.arrow')
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            with pa.OSFile(path, 'wb') as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            del table
+
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(_adjust_shard, path, start, stop, self.mode) for start, stop in shards]
+                parts = [future.result() for future in futures]
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        for i, column in enumerate(columns):
+            df[column] = np.concatenate([part[i] for part in parts]) if parts else np.empty(0)
+        return df
+
+    @staticmethod
+    def shard_bounds(segments: TickerSegments, num_shards: int) -> List[Tuple[int, int]]:
+        """Split the rows into up to ``num_shards`` contiguous ranges of whole tickers"""
+        if len(segments) == 0:
+            return []
+
+        # cut at the ticker boundary closest to each equal-rows target
+        targets = np.linspace(0, segments.num_rows, num_shards + 1)[1:-1]
+        cut_idx = np.searchsorted(segments.stops, targets)
+        cuts = np.unique(segments.stops[np.minimum(cut_idx, len(segments) - 1)])
+        bounds = [0] + [int(c) for c in cuts if 0 < c < segments.num_rows] + [segments.num_rows]
+        return list(zip(bounds[:-1], bounds[1:]))
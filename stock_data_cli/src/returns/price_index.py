@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+
+from .segments import TickerSegments
+from .forward_adjusted import forward_factors
+from .backward_adjusted import backward_factors
+
+LOOKUP_MODES = ('forward', 'backward')
+
+
+def _to_ns(dates) -> np.ndarray:
+    """Dates (strings, date objects, timestamps) as int64 nanoseconds"""
+    return pd.to_datetime(np.asarray(dates).ravel()).to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+
+class AdjustedPriceIndex:
+    """Point-in-time adjusted closes for (ticker, date) queries.
+
+    Built once from price rows: the rows are sorted by ticker and date, the
+    dates are kept as one int64 array sliced per ticker with
+    ``TickerSegments``, and the cumulative forward and backward factor of
+    every row is precomputed together with the adjusted close it gives,
+    rounded exactly like ``ForwardAdjusted``/``BackwardAdjusted`` (first/last
+    price unchanged). A lookup is a dict hit for the ticker, a binary search
+    in that ticker's dates and an array read, so the values equal a full
+    adjustment of the same rows.
+
+    Lookups are *as of* the date: they use the last bar on or before it, and
+    give NaN for dates before a ticker's first bar or for unknown tickers in
+    batch lookups.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        df = data[['ticker_symbol', 'datetime', 'unadjusted_close', 'split', 'dividend']]
+        df = df.sort_values(['ticker_symbol', 'datetime'], kind='mergesort')
+        self.segments = TickerSegments.from_frame(df)
+        self.dates = _to_ns(df['datetime'])
+        self.prices = df['unadjusted_close'].to_numpy(dtype=float)
+        split = df['split'].to_numpy(dtype=float)
+        dividend = df['dividend'].to_numpy(dtype=float)
+
+        # float32 prices give float32 results, as with the adjusters
+        self.dtype = np.promote_types(df['unadjusted_close'].dtype, np.float32)
+        self.factors = {
+            'forward': forward_factors(self.prices, split, dividend, self.segments),
+            'backward': backward_factors(self.prices, split, dividend, self.segments),
+        }
+        # first (forward) / most recent (backward) price unchanged
+        anchors = {'forward': self.segments.first, 'backward': self.segments.last}
+        self.adjusted = {}
+        for mode, factor in self.factors.items():
+            adjusted = np.round(self.prices * factor, 2)
+            adjusted[anchors[mode]] = self.prices[anchors[mode]]
+            self.adjusted[mode] = adjusted.astype(self.dtype)
+        self._ticker_index = pd.Index(self.segments.tickers)
+
+    @classmethod
+    def from_file(cls, filepath: str, **loader_options) -> 'AdjustedPriceIndex':
+        """Load ``filepath`` with the matching loader (``tickers``, ``start``, ... are passed on) and index it"""
+        from ..loader.base_loader import BaseLoader
+        data = BaseLoader.get_loader_for_file(filepath, **loader_options).load_data()
+        if data is None:
+            raise ValueError(f"Could not load {filepath}")
+        return cls(data)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def tickers(self) -> np.ndarray:
+        return self.segments.tickers
+
+    def price(self, ticker, date, mode: str = 'forward') -> float:
+        """Adjusted close of ``ticker`` as of ``date``; NaN before the ticker's first bar"""
+        self._check_mode(mode)
+        if ticker not in self.segments:
+            raise KeyError(f"Unknown ticker: {ticker}")
+        rows = self.segments[ticker]
+        k = rows.start + int(self.dates[rows].searchsorted(pd.Timestamp(date).value, side='right')) - 1
+        if k < rows.start:
+            return float('nan')
+        return float(self.adjusted[mode][k])
+
+    def series(self, ticker, start=None, end=None, mode: str = 'forward') -> pd.DataFrame:
+        """Rows of ``ticker`` between ``start`` and ``end`` (inclusive) with the adjusted close"""
+        self._check_mode(mode)
+        if ticker not in self.segments:
+            raise KeyError(f"Unknown ticker: {ticker}")
+        rows = self.segments[ticker]
+        dates = self.dates[rows]
+        lo = 0 if start is None else int(np.searchsorted(dates, pd.Timestamp(start).value, side='left'))
+        hi = len(dates) if end is None else int(np.searchsorted(dates, pd.Timestamp(end).value, side='right'))
+
+        positions = np.arange(rows.start + lo, rows.start + max(lo, hi))
+        return pd.DataFrame({
+            'datetime': self.dates[positions].view('datetime64[ns]'),
+            'unadjusted_close': self.prices[positions].astype(self.dtype),
+            f'{mode}_adj_close': self.adjusted[mode][positions],
+        })
+
+    def lookup(self, tickers, dates, mode: str = 'forward') -> np.ndarray:
+        """Vectorized ``price`` for many (ticker, date) pairs; unknown tickers give NaN"""
+        self._check_mode(mode)
+        tickers = np.asarray(tickers, dtype=object).ravel()
+        when = _to_ns(dates)
+        if len(tickers) != len(when):
+            raise ValueError("tickers and dates must have the same length")
+
+        ticker_ids = self._ticker_index.get_indexer(tickers)
+        positions = np.full(len(when), -1, dtype=np.int64)
+
+        # one binary search per distinct ticker over all of its queries
+        order = np.argsort(ticker_ids, kind='stable')
+        sorted_ids = ticker_ids[order]
+        bounds = np.flatnonzero(np.diff(sorted_ids)) + 1
+        for group in np.split(order, bounds):
+            if len(group) == 0 or ticker_ids[group[0]] < 0:
+                continue
+            i = ticker_ids[group[0]]
+            start, stop = self.segments.starts[i], self.segments.stops[i]
+            k = start + np.searchsorted(self.dates[start:stop], when[group], side='right') - 1
+            positions[group] = np.where(k >= start, k, -1)
+
+        result = np.full(len(when), np.nan, dtype=self.dtype)
+        found = positions >= 0
+        result[found] = self.adjusted[mode][positions[found]]
+        return result
+
+    @staticmethod
+    def _check_mode(mode: str) -> None:
+        if mode not in LOOKUP_MODES:
+            raise ValueError(f"Unknown mode: {mode}. Expected one of {LOOKUP_MODES}")
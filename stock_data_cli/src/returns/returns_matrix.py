@@ -0,0 +1,185 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class ReturnsMatrix:
+    """Returns of many tickers at once, computed on a dates x tickers price matrix.
+
+    The adjusted output is pivoted once into a ``(dates, tickers)`` array
+    over the union of all dates; every calculation is then a NumPy operation
+    on the whole matrix instead of a per-ticker groupby. Use
+    ``forward_adj_close`` (the default) or ``backward_adj_close`` for total
+    returns with dividends reinvested, ``unadjusted_close`` for price returns.
+
+    A ticker missing a date that other tickers have is handled by ``missing``:
+
+    - ``'nan'``: the missing date and the date after it have no return
+    - ``'skip'``: the missing date has no return; the next one is measured
+      from the last observed price
+    - ``'ffill'``: the last price is carried over (a 0 return on the missing
+      date) and the next date is measured from it
+
+    Dates before a ticker's first or after its last row are always NaN.
+    """
+
+    MISSING = ('nan', 'skip', 'ffill')
+    STATISTICS = ('mean', 'std', 'sum', 'min', 'max')
+
+    def __init__(self, prices: pd.DataFrame, missing: str = 'nan'):
+        if missing not in self.MISSING:
+            raise ValueError(f"Unknown missing-date handling: {missing}. Expected one of {self.MISSING}")
+        self.prices = prices
+        self.missing = missing
+        self.values = prices.to_numpy(dtype=float)
+
+        observed = ~np.isnan(self.values)
+        self.first_rows = np.argmax(observed, axis=0)
+        self.last_rows = len(self.values) - 1 - np.argmax(observed[::-1], axis=0)
+        rows = np.arange(len(self.values))[:, None]
+        self.listed = (rows >= self.first_rows) & (rows <= self.last_rows) & observed.any(axis=0)
+        self.filled = self._forward_fill(self.values, observed) if missing != 'nan' else self.values
+
+    @classmethod
+    def from_adjusted(cls, data: pd.DataFrame, column: str = 'forward_adj_close',
+                      missing: str = 'nan') -> 'ReturnsMatrix':
+        """Pivot long adjusted rows (ticker_symbol, datetime, ``column``) into a matrix"""
+        if column not in data.columns:
+            raise ValueError(f"Data has no {column} column")
+        date_codes, dates = pd.factorize(pd.to_datetime(data['datetime']), sort=True)
+        ticker_codes, tickers = pd.factorize(data['ticker_symbol'], sort=True)
+        tickers = pd.Index(np.asarray(tickers, dtype=object), name='ticker_symbol')
+
+        cells = date_codes.astype(np.int64) * len(tickers) + ticker_codes
+        if len(cells) and np.bincount(cells, minlength=len(dates) * len(tickers)).max() > 1:
+            raise ValueError("Data has more than one row for the same ticker and date")
+
+        values = np.full((len(dates), len(tickers)), np.nan)
+        values[date_codes, ticker_codes] = data[column].to_numpy(dtype=float)
+        prices = pd.DataFrame(values, index=pd.DatetimeIndex(dates, name='datetime'), columns=tickers)
+        return cls(prices, missing=missing)
+
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        return self.prices.index
+
+    @property
+    def tickers(self) -> pd.Index:
+        return self.prices.columns
+
+    def simple_returns(self) -> pd.DataFrame:
+        """Daily returns ``p_t / p_{t-1} - 1``"""
+        return self._frame(self._ratios() - 1.0)
+
+    def log_returns(self) -> pd.DataFrame:
+        """Daily log returns ``ln(p_t / p_{t-1})``"""
+        return self._frame(np.log(self._ratios()))
+
+    def total_returns(self) -> pd.DataFrame:
+        """Cumulative return since each ticker's first row, ``p_t / p_first - 1``"""
+        first = self.values[self.first_rows, np.arange(self.values.shape[1])]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            total = self._current() / first - 1.0
+        return self._frame(total)
+
+    def rolling(self, window: int, statistic: str = 'std', returns: str = 'simple') -> pd.DataFrame:
+        """``statistic`` of the daily ``returns`` ('simple' or 'log') over the trailing ``window`` dates.
+
+        A window containing a missing return gives NaN, like pandas' rolling
+        with ``min_periods=window``. Sums, means and sample standard deviations
+        use running sums; minima and maxima use a strided window view.
+        """
+        if statistic not in self.STATISTICS:
+            raise ValueError(f"Unknown statistic: {statistic}. Expected one of {self.STATISTICS}")
+        if returns not in ('simple', 'log'):
+            raise ValueError(f"Unknown returns: {returns}. Expected one of ('simple', 'log')")
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        ratios = self._ratios()
+        r = ratios - 1.0 if returns == 'simple' else np.log(ratios)
+        result = np.full(r.shape, np.nan)
+        if window > len(r):
+            return self._frame(result)
+
+        if statistic in ('min', 'max'):
+            windows = sliding_window_view(r, window, axis=0)
+            result[window - 1:] = windows.min(axis=-1) if statistic == 'min' else windows.max(axis=-1)
+            return self._frame(result)
+
+        complete = self._window_sum(~np.isnan(r), window) == window
+        observed = np.where(np.isnan(r), 0.0, r)
+        total = self._window_sum(observed, window)
+        if statistic == 'sum':
+            stat = total
+        elif statistic == 'mean':
+            stat = total / window
+        elif window == 1:
+            stat = np.full(r.shape, np.nan)  # a sample std needs two values
+        else:
+            # center each column first so the sum of squares does not cancel
+            counts = (~np.isnan(r)).sum(axis=0)
+            center = np.divide(observed.sum(axis=0), counts, out=np.zeros(r.shape[1]), where=counts > 0)
+            centered = np.where(np.isnan(r), 0.0, r - center)
+            shifted_sum = self._window_sum(centered, window)
+            squares = self._window_sum(centered ** 2, window)
+            stat = np.sqrt(np.maximum(squares - shifted_sum ** 2 / window, 0.0) / (window - 1))
+        result[complete] = stat[complete]
+        return self._frame(result)
+
+    @staticmethod
+    def to_long(frame: pd.DataFrame, name: str = 'value') -> pd.DataFrame:
+        """Matrix back to ``ticker_symbol, datetime, <name>`` rows, without the empty cells"""
+        values = frame.to_numpy(dtype=float).T
+        ticker_rows, date_rows = np.nonzero(~np.isnan(values))  # ticker-major, dates in order
+        return pd.DataFrame({
+            'ticker_symbol': frame.columns.to_numpy()[ticker_rows],
+            'datetime': frame.index.to_numpy()[date_rows],
+            name: values[ticker_rows, date_rows],
+        })
+
+    @classmethod
+    def save(cls, frame: pd.DataFrame, filepath: str, layout: str = 'wide', name: str = 'value') -> None:
+        """Write a result matrix through the saver matching ``filepath``.
+
+        ``'wide'`` writes a ``datetime`` column plus one column per ticker,
+        ``'long'`` one row per ticker and date (needed for partitioned datasets).
+        """
+        from ..loader.base_saver import BaseSaver
+        if layout not in ('wide', 'long'):
+            raise ValueError(f"Unknown layout: {layout}. Expected one of ('wide', 'long')")
+        if layout == 'wide':
+            table = frame.reset_index()
+            table.columns = [str(column) for column in table.columns]
+        else:
+            table = cls.to_long(frame, name)
+        BaseSaver.get_saver_for_file(filepath).save(table)
+
+    def _current(self) -> np.ndarray:
+        """Prices on each date: observed, or carried over with ``missing='ffill'``"""
+        current = self.filled if self.missing == 'ffill' else self.values
+        return np.where(self.listed, current, np.nan)
+
+    def _ratios(self) -> np.ndarray:
+        """``p_t / p_{t-1}`` with the previous price chosen by ``missing``"""
+        previous = np.full(self.values.shape, np.nan)
+        previous[1:] = self.filled[:-1] if self.missing != 'nan' else self.values[:-1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self._current() / previous
+
+    def _frame(self, values: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(values, index=self.prices.index, columns=self.prices.columns)
+
+    @staticmethod
+    def _forward_fill(values: np.ndarray, observed: np.ndarray) -> np.ndarray:
+        """Carry the last observed value of every column down over NaNs"""
+        rows = np.where(observed, np.arange(len(values))[:, None], 0)
+        np.maximum.accumulate(rows, axis=0, out=rows)
+        return values[rows, np.arange(values.shape[1])]
+
+    @staticmethod
+    def _window_sum(values: np.ndarray, window: int) -> np.ndarray:
+        """Sum of each trailing ``window`` rows (rows before a full window are left as partial sums)"""
+        sums = np.cumsum(values, axis=0, dtype=float)
+        sums[window:] = sums[window:] - sums[:-window]
+        return sums
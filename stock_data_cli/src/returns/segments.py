@@ -0,0 +1,163 @@
+from typing import Iterator, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+SORT_COLUMNS = ['ticker_symbol', 'datetime']
+
+
+class TickerSegments:
+    """Index of contiguous per-ticker row ranges in a frame sorted by ticker.
+
+    Built once after the ``['ticker_symbol', 'datetime']`` sort, it maps each
+    ticker to ``(start, stop)`` positional offsets so per-ticker work can use
+    plain slices instead of ``df['ticker_symbol'] == ticker`` mask scans.
+    """
+
+    def __init__(self, tickers):
+        tickers = np.asarray(tickers)
+        first = self._first_rows(tickers)
+        self._build(first, tickers[first])
+
+    @staticmethod
+    def _first_rows(keys: np.ndarray) -> np.ndarray:
+        first = np.ones(len(keys), dtype=bool)
+        if len(keys):
+            first[1:] = keys[1:] != keys[:-1]
+        return first
+
+    def _build(self, first: np.ndarray, tickers: np.ndarray) -> None:
+        n = len(first)
+        self.starts = np.flatnonzero(first)
+        self.stops = np.append(self.starts[1:], n) if n else self.starts.copy()
+        self.tickers = tickers
+        self.num_rows = n
+        self._offsets = {ticker: i for i, ticker in enumerate(self.tickers)}
+
+        if len(self._offsets) != len(self.tickers):
+            raise ValueError("Ticker rows are not contiguous; sort by ticker_symbol before indexing")
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, column: str = 'ticker_symbol') -> 'TickerSegments':
+        """Build the index from a frame already sorted by ``column``"""
+        values = df[column]
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            return cls(values.to_numpy())
+
+        # categorical tickers: compare the integer codes, look up one label per ticker
+        codes = values.cat.codes.to_numpy()
+        first = cls._first_rows(codes)
+        segments = cls.__new__(cls)
+        segments._build(first, values.cat.categories.to_numpy(dtype=object)[codes[first]])
+        return segments
+
+    @classmethod
+    def from_arrow(cls, table, column: str = 'ticker_symbol') -> 'TickerSegments':
+        """Build the index from a pyarrow Table sorted by ``column``.
+
+        Boundaries are found with Arrow compute kernels; only one value per
+        ticker is converted to a Python object.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        column = table.column(column)
+        dictionary = None
+        if pa.types.is_dictionary(column.type):
+            # compare the dictionary indices once every chunk shares one dictionary
+            values = column.unify_dictionaries().combine_chunks()
+            dictionary, values = values.dictionary, values.indices
+        else:
+            values = column.combine_chunks()
+        n = len(values)
+
+        first = np.ones(n, dtype=bool)
+        if n > 1:
+            changed = pc.not_equal(values.slice(1), values.slice(0, n - 1))
+            first[1:] = changed.to_numpy(zero_copy_only=False)
+
+        labels = values.filter(first)
+        if dictionary is not None:
+            labels = dictionary.take(labels)
+        segments = cls.__new__(cls)
+        segments._build(first, np.asarray(labels.to_pylist(), dtype=object))
+        return segments
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def __iter__(self) -> Iterator[Tuple[str, int, int]]:
+        """Yield ``(ticker, start, stop)`` for every segment in row order"""
+        for ticker, start, stop in zip(self.tickers, self.starts, self.stops):
+            yield ticker, int(start), int(stop)
+
+    def __contains__(self, ticker) -> bool:
+        return ticker in self._offsets
+
+    def __getitem__(self, ticker) -> slice:
+        """Positional slice covering the rows of ``ticker``"""
+        i = self._offsets[ticker]
+        return slice(int(self.starts[i]), int(self.stops[i]))
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return self.stops - self.starts
+
+    @property
+    def first(self) -> np.ndarray:
+        """Boolean mask of the first (oldest) row of every ticker"""
+        mask = np.zeros(self.num_rows, dtype=bool)
+        mask[self.starts] = True
+        return mask
+
+    @property
+    def last(self) -> np.ndarray:
+        """Boolean mask of the last (most recent) row of every ticker"""
+        mask = np.zeros(self.num_rows, dtype=bool)
+        mask[self.stops - 1] = True
+        return mask
+
+    @property
+    def group_ids(self) -> np.ndarray:
+        """Segment number of every row, usable as a groupby key"""
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+
+def sorted_segments(df: pd.DataFrame) -> Optional[TickerSegments]:
+    """Segments of ``df`` if it is already ordered by ticker and date, else None.
+
+    One O(n) pass: the ticker column must be non-decreasing (category order
+    for categoricals, as ``sort_values`` uses) and the dates non-decreasing
+    within every ticker. The segments are needed by the adjusters anyway,
+    so on sorted input the check costs only the date comparison.
+    """
+    tickers = df['ticker_symbol']
+    if isinstance(tickers.dtype, pd.CategoricalDtype):
+        codes = tickers.cat.codes.to_numpy()
+        monotonic = bool(np.all(codes[1:] >= codes[:-1])) and not np.any(codes < 0)
+    else:
+        monotonic = tickers.is_monotonic_increasing and not tickers.hasnans
+    if not monotonic:
+        return None
+
+    segments = TickerSegments.from_frame(df)
+    dates = df['datetime'].to_numpy()
+    ordered = dates[1:] >= dates[:-1]
+    ordered |= segments.first[1:]
+    return segments if ordered.all() else None
+
+
+def sorted_by_ticker_and_date(df: pd.DataFrame, inplace: bool = False) -> Tuple[pd.DataFrame, TickerSegments]:
+    """``df`` ordered by ticker and date, and its segments, sorting only when needed.
+
+    Returns a frame the caller may add columns to: a copy of ``df`` (one
+    copy, whether or not a sort was needed) or, with ``inplace=True``, ``df``
+    itself, sorted in place if it was not already in order.
+    """
+    segments = sorted_segments(df)
+    if segments is not None:
+        return (df if inplace else df.copy()), segments
+
+    if inplace:
+        df.sort_values(SORT_COLUMNS, inplace=True)
+    else:
+        df = df.sort_values(SORT_COLUMNS)
+    return df, TickerSegments.from_frame(df)
@@ -0,0 +1,173 @@
+from typing import Callable, Iterable, Iterator
+import numpy as np
+import pandas as pd
+
+from .segments import TickerSegments
+from .forward_adjusted import forward_factors
+from .backward_adjusted import backward_event_factors
+
+
+class _BatchOrderCheck:
+    """Validate that batches arrive grouped by ticker and ordered by date"""
+
+    def __init__(self):
+        self.finished = set()
+        self.current = None
+        self.last_date = None
+
+    def check(self, df: pd.DataFrame, segments: TickerSegments) -> None:
+        dates = df['datetime'].to_numpy()
+        unordered = dates[1:] < dates[:-1]
+        unordered &= ~segments.first[1:]
+
+        for ticker, start, stop in segments:
+            if ticker == self.current:
+                if self.last_date is not None and dates[start] < self.last_date:
+                    unordered = True
+                continue
+            if ticker in self.finished:
+                raise ValueError("Batches must be grouped by ticker: "
+                                 f"{ticker} reappears after other tickers")
+            if self.current is not None:
+                self.finished.add(self.current)
+            self.current = ticker
+
+        if np.any(unordered):
+            raise ValueError("Batches must be ordered by date within each ticker")
+        if len(df):
+            self.last_date = dates[-1]
+
+
+class StreamingForwardAdjusted:
+    """Forward adjustment over batches of ticker-grouped, date-ordered data.
+
+    Each batch goes through the vectorized forward engine. The factor, split,
+    dividend and price of the last row are carried over, so a ticker may span
+    batch boundaries while memory stays bounded by the batch size. Results
+    agree with ``ForwardAdjusted`` within ``ForwardAdjusted.TOLERANCE``.
+    """
+
+    def __init__(self, batches: Iterable[pd.DataFrame]):
+        self.batches = batches
+        self._order = _BatchOrderCheck()
+        self._carry = None  # (ticker, factor, split, dividend, price) of the last row seen
+
+    def forward_adj(self) -> Iterator[pd.DataFrame]:
+        for batch in self.batches:
+            yield self.adjust_batch(batch)
+
+    def adjust_batch(self, batch: pd.DataFrame) -> pd.DataFrame:
+        """Adjust one batch, continuing any ticker carried over from the previous one"""
+        df = batch.copy()
+        segments = TickerSegments.from_frame(df)
+        self._order.check(df, segments)
+        if len(df) == 0:
+            df['forward_adj_close'] = np.empty(0)
+            return df
+
+        price = df['unadjusted_close'].to_numpy(dtype=float)
+        split = df['split'].to_numpy(dtype=float)
+        dividend = df['dividend'].to_numpy(dtype=float)
+
+        # only the first segment can continue a ticker from the previous batch
+        start_factor = np.ones(len(segments))
+        continues = self._carry is not None and segments.tickers[0] == self._carry[0]
+        if continues:
+            _, factor, prev_split, prev_dividend, prev_price = self._carry
+            start_factor[0] = prev_split * (factor + prev_dividend / prev_price)
+
+        factor = forward_factors(price, split, dividend, segments, start_factor)
+        adjusted = np.round(price * factor, 2)
+
+        new_starts = segments.starts[1:] if continues else segments.starts
+        adjusted[new_starts] = price[new_starts]  # first price unchanged
+
+        k = len(df) - 1
+        last_split = 1.0 if split[k] == 0 else split[k]
+        last_dividend = dividend[k] if dividend[k] > 0 else 0.0
+        self._carry = (segments.tickers[-1], factor[k], last_split, last_dividend, price[k])
+
+        df['forward_adj_close'] = adjusted
+        return df
+
+
+class StreamingBackwardAdjusted:
+    """Backward adjustment over batches of ticker-grouped, date-ordered data.
+
+    Backward factors depend on later events, so the batches are read twice:
+    the first pass keeps only the split/dividend rows and per-ticker row
+    counts and computes the event factors, the second broadcasts them onto
+    each batch. ``batches`` is called once per pass and must return the same
+    data each time. Memory is bounded by the batch size plus the events.
+    """
+
+    def __init__(self, batches: Callable[[], Iterable[pd.DataFrame]]):
+        self.batches = batches
+
+    def backward_adj(self) -> Iterator[pd.DataFrame]:
+        counts, event_ordinals, event_factors = self._collect_event_factors()
+
+        seen = {}
+        for batch in self.batches():
+            df = batch.copy()
+            segments = TickerSegments.from_frame(df)
+            price = df['unadjusted_close'].to_numpy(dtype=float)
+            row_factor = np.ones(len(df))
+            is_last = np.zeros(len(df), dtype=bool)
+
+            for ticker, start, stop in segments:
+                base = seen.get(ticker, 0)
+                ordinals = np.arange(base, base + stop - start)
+                seen[ticker] = base + stop - start
+                is_last[start:stop] = ordinals == counts[ticker] - 1
+
+                ordinals_at_events = event_ordinals.get(ticker)
+                if ordinals_at_events is None:
+                    continue
+                nxt = np.searchsorted(ordinals_at_events, ordinals, side='right')
+                has_next = nxt < len(ordinals_at_events)
+                row_factor[start:stop][has_next] = event_factors[ticker][nxt[has_next]]
+
+            adjusted = np.round(price * row_factor, 2)
+            adjusted[is_last] = price[is_last]  # most recent price unchanged
+
+            df['backward_adj_close'] = adjusted
+            yield df
+
+    def _collect_event_factors(self):
+        """First pass: per-ticker row counts plus the factor at every event row"""
+        order = _BatchOrderCheck()
+        counts = {}
+        events = []
+
+        for batch in self.batches():
+            segments = TickerSegments.from_frame(batch)
+            order.check(batch, segments)
+
+            split = batch['split'].to_numpy(dtype=float)
+            dividend = batch['dividend'].to_numpy(dtype=float)
+            price = batch['unadjusted_close'].to_numpy(dtype=float)
+            is_event = ((split != 1.0) & (split != 0.0)) | (dividend > 0)
+
+            for ticker, start, stop in segments:
+                base = counts.get(ticker, 0)
+                counts[ticker] = base + stop - start
+                for k in np.flatnonzero(is_event[start:stop]) + start:
+                    ordinal = base + k - start
+                    if ordinal > 0:  # the first row has no earlier rows to adjust
+                        events.append((ticker, ordinal, price[k], split[k], dividend[k]))
+
+        if not events:
+            return counts, {}, {}
+
+        event_segments = TickerSegments(np.array([e[0] for e in events], dtype=object))
+        ordinals = np.array([e[1] for e in events])
+        last = np.array([e[1] == counts[e[0]] - 1 for e in events])
+        factors = backward_event_factors(np.array([e[2] for e in events]),
+                                         np.array([e[3] for e in events]),
+                                         np.array([e[4] for e in events]),
+                                         event_segments.group_ids, last)
+
+        event_ordinals = {ticker: ordinals[start:stop] for ticker, start, stop in event_segments}
+        event_factors = {ticker: factors[start:stop] for ticker, start, stop in event_segments}
+        return counts, event_ordinals, event_factors
@@ -0,0 +1,10 @@
+from .lru_cache import LRUCache
+from .adjustment_service import AdjustmentService
+from .http_server import AdjustmentServer, serve
+
+__all__ = [
+    'LRUCache',
+    'AdjustmentService',
+    'AdjustmentServer',
+    'serve'
+]
@@ -0,0 +1,101 @@
+import os
+import threading
+from typing import List, Tuple
+import pandas as pd
+
+from ..loader.base_loader import BaseLoader
+from ..returns.segments import TickerSegments
+from ..returns.parallel_adjusted import MODES
+from .lru_cache import LRUCache
+
+
+def file_signature(filepath: str) -> Tuple[int, int]:
+    """(latest mtime, total size) of a file, or of every file under a dataset directory"""
+    if not os.path.isdir(filepath):
+        stat = os.stat(filepath)
+        return stat.st_mtime_ns, stat.st_size
+
+    latest, total = os.stat(filepath).st_mtime_ns, 0
+    for root, dirs, files in os.walk(filepath):
+        for name in dirs + files:
+            stat = os.stat(os.path.join(root, name))
+            latest = max(latest, stat.st_mtime_ns)
+            total += stat.st_size if name in files else 0
+    return latest, total
+
+
+class AdjustmentService:
+    """Adjusted series for (ticker, mode, date range) requests against a resident dataset.
+
+    The file is loaded and sorted once and indexed with ``TickerSegments``,
+    so a request only touches the rows of one ticker. Results are memoized
+    in an LRU cache keyed on the request; when the file's modification time
+    or size changes the dataset is reloaded and the cache cleared.
+
+    A date range selects rows before adjusting, as ``calculator.py
+    --tickers T --start S --end E`` does, so the results match the CLI.
+    """
+
+    def __init__(self, filepath: str, cache_size: int = 128):
+        self.filepath = filepath
+        self.cache = LRUCache(cache_size)
+        self._lock = threading.Lock()
+        self._signature = None
+        self._data = None
+        self._segments = None
+        self.reload_if_changed()
+
+    def reload_if_changed(self) -> bool:
+        """Reload the dataset (and drop cached results) if the file changed; True when reloaded"""
+        signature = file_signature(self.filepath)
+        with self._lock:
+            if signature == self._signature:
+                return False
+
+            data = BaseLoader.get_loader_for_file(self.filepath).load_data()
+            if data is None:
+                raise ValueError(f"Could not load {self.filepath}")
+            data = data.sort_values(['ticker_symbol', 'datetime'], kind='mergesort', ignore_index=True)
+
+            self._data = data
+            self._segments = TickerSegments.from_frame(data)
+            self._signature = signature
+            self.cache.clear()
+            return True
+
+    @property
+    def tickers(self) -> List[str]:
+        return [str(ticker) for ticker in self._segments.tickers]
+
+    def adjusted(self, ticker: str, mode: str = 'forward', start=None, end=None) -> pd.DataFrame:
+        """Rows of ``ticker`` between ``start`` and ``end`` (inclusive) with the adjusted column(s)"""
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}. Expected one of {tuple(MODES)}")
+        start = pd.Timestamp(start).date() if start is not None else None
+        end = pd.Timestamp(end).date() if end is not None else None
+
+        self.reload_if_changed()
+        key = (ticker, mode, start, end)
+        result = self.cache.get(key)
+        if result is None:
+            result, signature = self._compute(ticker, mode, start, end)
+            with self._lock:
+                # a reload meanwhile means the result came from the old data: return it, don't cache it
+                if signature == self._signature:
+                    self.cache.put(key, result)
+        return result
+
+    def _compute(self, ticker: str, mode: str, start, end) -> Tuple[pd.DataFrame, Tuple[int, int]]:
+        """The adjusted rows and the signature of the dataset they were computed from"""
+        with self._lock:
+            data, segments, signature = self._data, self._segments, self._signature
+        if ticker not in segments:
+            raise KeyError(f"Unknown ticker: {ticker}")
+
+        rows = data.iloc[segments[ticker]]
+        dates = rows['datetime']
+        first = 0 if start is None else dates.searchsorted(BaseLoader.date_bound(start, dates), side='left')
+        stop = len(rows) if end is None else dates.searchsorted(BaseLoader.date_bound(end, dates), side='right')
+
+        adjuster_class, method, _ = MODES[mode]
+        return getattr(adjuster_class(rows.iloc[first:stop]), method)().reset_index(drop=True), signature
@@ -0,0 +1,97 @@
+import asyncio
+import functools
+import json
+from urllib.parse import parse_qs, urlsplit
+
+from .adjustment_service import AdjustmentService
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           500: 'Internal Server Error'}
+
+
+class AdjustmentServer:
+    """Minimal asyncio HTTP/1.1 front end for an ``AdjustmentService``.
+
+    Endpoints (JSON responses, one request per connection):
+
+    - ``GET /tickers``: the tickers in the dataset
+    - ``GET /adjusted?ticker=AAPL&mode=forward&start=2024-01-01&end=2024-12-31``:
+      the adjusted rows as records; ``mode``, ``start`` and ``end`` are optional
+
+    Adjustments run on the default thread pool so a slow request does not
+    block the event loop. Serve over TCP or a Unix domain socket.
+    """
+
+    def __init__(self, service: AdjustmentService):
+        self.service = service
+
+    async def serve_tcp(self, host: str = '127.0.0.1', port: int = 8765) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle, host, port)
+
+    async def serve_unix(self, path: str) -> asyncio.AbstractServer:
+        return await asyncio.start_unix_server(self.handle, path)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await reader.readline()
+            while True:  # headers are not needed
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+            method, target, _ = request_line.decode('latin-1').split(' ', 2)
+            status, body = await self.respond(method, target)
+        except ValueError:
+            status, body = 400, {'error': 'Malformed request'}
+        except Exception as e:
+            status, body = 500, {'error': f'{type(e).__name__}: {e}'}
+
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n")
+        writer.write(head.encode('latin-1') + payload)
+        await writer.drain()
+        writer.close()
+
+    async def respond(self, method: str, target: str):
+        """(status, body) for a request; body is bytes of JSON or an object to encode"""
+        if method != 'GET':
+            return 405, {'error': f'Method {method} not allowed'}
+
+        url = urlsplit(target)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        loop = asyncio.get_running_loop()
+
+        if url.path == '/tickers':
+            await loop.run_in_executor(None, self.service.reload_if_changed)
+            return 200, {'tickers': self.service.tickers}
+
+        if url.path == '/adjusted':
+            if 'ticker' not in params:
+                return 400, {'error': 'Missing ticker parameter'}
+            request = functools.partial(self.service.adjusted, params['ticker'], params.get('mode', 'forward'),
+                                        params.get('start'), params.get('end'))
+            try:
+                result = await loop.run_in_executor(None, request)
+            except KeyError as e:
+                return 404, {'error': e.args[0]}
+            except ValueError as e:
+                return 400, {'error': str(e)}
+            return 200, result.to_json(orient='records', date_format='iso').encode()
+
+        return 404, {'error': f'Unknown path {url.path}'}
+
+
+def serve(service: AdjustmentService, host: str = '127.0.0.1', port: int = 8765, socket_path: str = None) -> None:
+    """Run the server until interrupted, on a Unix socket when ``socket_path`` is given"""
+    async def main():
+        server = AdjustmentServer(service)
+        if socket_path:
+            listener = await server.serve_unix(socket_path)
+        else:
+            listener = await server.serve_tcp(host, port)
+        async with listener:
+            await listener.serve_forever()
+
+    asyncio.run(main())
@@ -1,6 +1,7 @@
 import unittest
 import os
 import tempfile
+import numpy as np
 import pandas as pd
 import sys
 from unittest.mock import patch
@@ -17,9 +18,35 @@ from stock_data_cli.src.loader.json_loader import JsonLoader
 from stock_data_cli.src.loader.parquet_loader import ParquetLoader
 from stock_data_cli.src.loader.csv_saver import CsvSaver
 from stock_data_cli.src.loader.json_saver import JsonSaver
+from stock_data_cli.src.loader.jsonl_saver import JsonLinesSaver
 from stock_data_cli.src.loader.parquet_saver import ParquetSaver
+from stock_data_cli.src.loader.arrow_loader import ArrowLoader
+from stock_data_cli.src.loader.arrow_saver import ArrowSaver
+from stock_data_cli.src.loader.dataset_loader import DatasetLoader
+from stock_data_cli.src.loader.dataset_saver import DatasetSaver
+from stock_data_cli.src.loader.registry import FormatRegistry
+from stock_data_cli.src.loader.parse_cache import ParseCache
 from stock_data_cli.src.returns.forward_adjusted import ForwardAdjusted
 from stock_data_cli.src.returns.backward_adjusted import BackwardAdjusted
+from stock_data_cli.src.returns import TickerSegments
+from stock_data_cli.src.returns.segments import sorted_segments
+from stock_data_cli.src.returns.parallel_adjusted import ParallelAdjusted
+from stock_data_cli.src.returns.streaming_adjusted import StreamingForwardAdjusted, StreamingBackwardAdjusted
+from stock_data_cli.src.returns.incremental_adjusted import IncrementalAdjusted
+from stock_data_cli.src.returns.factor_store import FactorStore
+from stock_data_cli.src.returns.arrow_adjusted import ArrowAdjusted
+from stock_data_cli.src.returns.combined_adjusted import CombinedAdjusted
+from stock_data_cli.src.returns.price_index import AdjustedPriceIndex
+from stock_data_cli.src.returns.returns_matrix import ReturnsMatrix
+from stock_data_cli.src.returns.external_sort import ExternalSort
+from stock_data_cli.src.service.lru_cache import LRUCache
+from stock_data_cli.src.benchmark.synthetic import generate_market_data
+from stock_data_cli.src.profiling.profiler import Profiler
+from stock_data_cli.src.profiling.ticker_profile import adjust_by_ticker
+from stock_data_cli.src.output.pipeline import adjusted_blocks, write_pipelined, ResultPreview
+from stock_data_cli.src.benchmark.suite import BenchmarkSuite, BenchmarkResult
+from stock_data_cli.src.service.adjustment_service import AdjustmentService
+from stock_data_cli.src.service.http_server import AdjustmentServer
 
 
 class TestStrategyPattern(unittest.TestCase):
@@ -42,7 +69,7 @@ class TestStrategyPattern(unittest.TestCase):
         parquet_loader = ParquetLoader("dummy.parquet")
         
         self.assertEqual(csv_loader.supported_extensions, ['.csv'])
-        self.assertEqual(json_loader.supported_extensions, ['.json'])
+        self.assertEqual(json_loader.supported_extensions, ['.json', '.jsonl', '.ndjson'])
         self.assertEqual(parquet_loader.supported_extensions, ['.parquet', '.pq'])
     
     def test_saver_supported_extensions(self):
@@ -95,11 +122,28 @@ class TestStrategyPattern(unittest.TestCase):
         loader = BaseLoader.get_loader_for_file("test.parquet")
         self.assertIsInstance(loader, ParquetLoader)
         
+        # Test Arrow IPC / Feather
+        self.assertIsInstance(BaseLoader.get_loader_for_file("test.arrow"), ArrowLoader)
+        self.assertIsInstance(BaseLoader.get_loader_for_file("test.feather"), ArrowLoader)
+        
         # Test unsupported format
         with self.assertRaises(ValueError) as context:
             BaseLoader.get_loader_for_file("test.xlsx")
         self.assertIn("No loader found for file extension", str(context.exception))
     
+    def test_format_registry(self):
+        """Test extension lookup, lazy 'module:Class' targets and registering new formats"""
+        registry = FormatRegistry('stock_data_cli.tests', {'.csv': 'stock_data_cli.src.loader.csv_loader:CsvLoader'})
+        self.assertIs(registry.get('.CSV'), CsvLoader)
+        self.assertIsNone(registry.get('.xlsx'))
+
+        class ExcelLoader(CsvLoader):
+            pass
+
+        registry.register('xlsx', ExcelLoader)
+        self.assertIs(registry.get('.xlsx'), ExcelLoader)
+        self.assertListEqual(registry.extensions(), ['.csv', '.xlsx'])
+    
     def test_saver_factory_method(self):
         """Test the factory method for savers"""
         # Test CSV
@@ -157,6 +201,55 @@ class TestFileOperations(unittest.TestCase):
                            ['unadjusted_close', 'ticker_symbol', 'datetime', 'split', 'dividend'])
         self.assertEqual(loaded_data['ticker_symbol'].iloc[0], 'TEST')
     
+    def test_csv_typed_columns(self):
+        """Test CSV columns get compact, explicit dtypes instead of inferred objects"""
+        csv_path = os.path.join(self.temp_dir, "typed.csv")
+        data = pd.concat([self.sample_data.assign(ticker_symbol='ZZZ'), self.sample_data])
+        data.to_csv(csv_path, index=False)
+
+        loaded = CsvLoader(csv_path).load_data()
+        self.assertIsInstance(loaded['ticker_symbol'].dtype, pd.CategoricalDtype)
+        self.assertListEqual(list(loaded['ticker_symbol'].cat.categories), ['TEST', 'ZZZ'])
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(loaded['datetime']))
+        self.assertEqual(loaded['unadjusted_close'].dtype, np.float64)
+
+        compact = CsvLoader(csv_path, float32=True).load_data()
+        self.assertEqual(compact['unadjusted_close'].dtype, np.float32)
+
+        # categorical tickers sort alphabetically and float32 prices stay float32
+        result = ForwardAdjusted(compact).forward_adj()
+        self.assertListEqual(list(result['ticker_symbol'].iloc[[0, -1]]), ['TEST', 'ZZZ'])
+        self.assertEqual(result['forward_adj_close'].dtype, np.float32)
+        expected = ForwardAdjusted(data).forward_adj()['forward_adj_close'].to_numpy()
+        np.testing.assert_allclose(result['forward_adj_close'].to_numpy(), expected, atol=ForwardAdjusted.TOLERANCE)
+
+    def test_csv_non_iso_dates(self):
+        """Test dates pyarrow cannot parse (e.g. 01/02/2023) are parsed by pandas instead"""
+        csv_path = os.path.join(self.temp_dir, "us_dates.csv")
+        self.sample_data.assign(datetime=self.sample_data['datetime'].dt.strftime('%m/%d/%Y')).to_csv(
+            csv_path, index=False)
+
+        loaded = CsvLoader(csv_path).load_data()
+        pd.testing.assert_series_equal(loaded['datetime'], self.sample_data['datetime'], check_dtype=False)
+        filtered = CsvLoader(csv_path, start='2023-01-02').load_data()
+        self.assertListEqual(filtered['unadjusted_close'].tolist(), [102.0, 101.0])
+        batches = list(CsvLoader(csv_path).iter_batches())
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(batches[0]['datetime']))
+    
+    def test_csv_to_json_writes_iso_dates(self):
+        """Test timestamps parsed from CSV are written to JSON as ISO dates, not epoch milliseconds"""
+        import json
+        csv_path = os.path.join(self.temp_dir, "dates.csv")
+        json_path = os.path.join(self.temp_dir, "dates.json")
+        self.sample_data.to_csv(csv_path, index=False)
+
+        JsonSaver(json_path).save(CsvLoader(csv_path).load_data())
+        with open(json_path) as f:
+            records = json.load(f)
+        self.assertTrue(records[0]['datetime'].startswith('2023-01-01'))
+        loaded = JsonLoader(json_path).load_data()
+        self.assertEqual(pd.Timestamp(loaded['datetime'].iloc[2]), pd.Timestamp('2023-01-03'))
+
     def test_json_round_trip(self):
         """Test saving and loading JSON files"""
         json_path = os.path.join(self.temp_dir, "test.json")
@@ -174,6 +267,32 @@ class TestFileOperations(unittest.TestCase):
         self.assertListEqual(list(loaded_data.columns), 
                            ['unadjusted_close', 'ticker_symbol', 'datetime', 'split', 'dividend'])
     
+    def test_json_lines_round_trip(self):
+        """Test saving, appending and loading JSON Lines files"""
+        jsonl_path = os.path.join(self.temp_dir, "test.jsonl")
+
+        saver = BaseSaver.get_saver_for_file(jsonl_path)
+        self.assertIsInstance(saver, JsonLinesSaver)
+        saver.save(self.sample_data.iloc[:2])
+        saver.append(self.sample_data.iloc[2:])
+        with open(jsonl_path) as f:
+            self.assertEqual(len(f.readlines()), 3)
+
+        loader = BaseLoader.get_loader_for_file(jsonl_path)
+        self.assertIsInstance(loader, JsonLoader)
+        loaded_data = loader.load_data()
+        self.assertListEqual(list(loaded_data['unadjusted_close']), [100.0, 102.0, 101.0])
+        self.assertListEqual(list(loaded_data['datetime']), list(self.sample_data['datetime']))
+        self.assertListEqual([len(b) for b in loader.iter_batches(batch_size=2)], [2, 1])
+
+    def test_compact_json(self):
+        """Test JSON output without indentation"""
+        json_path = os.path.join(self.temp_dir, "compact.json")
+        JsonSaver(json_path, indent=None).save(self.sample_data)
+        with open(json_path) as f:
+            self.assertEqual(len(f.read().splitlines()), 1)
+        self.assertEqual(len(JsonLoader(json_path).load_data()), 3)
+
     def test_parquet_round_trip(self):
         """Test saving and loading Parquet files"""
         parquet_path = os.path.join(self.temp_dir, "test.parquet")
@@ -191,6 +310,214 @@ class TestFileOperations(unittest.TestCase):
         self.assertListEqual(list(loaded_data.columns), 
                            ['unadjusted_close', 'ticker_symbol', 'datetime', 'split', 'dividend'])
 
+    def test_iter_batches(self):
+        """Test that every loader streams the file in bounded batches"""
+        csv_path = os.path.join(self.temp_dir, "test.csv")
+        jsonl_path = os.path.join(self.temp_dir, "test_lines.json")
+        parquet_path = os.path.join(self.temp_dir, "test.parquet")
+        self.sample_data.to_csv(csv_path, index=False)
+        self.sample_data.to_json(jsonl_path, orient='records', lines=True, date_format='iso')
+        self.sample_data.to_parquet(parquet_path, index=False)
+
+        for loader in [CsvLoader(csv_path), JsonLoader(jsonl_path), ParquetLoader(parquet_path)]:
+            batches = list(loader.iter_batches(batch_size=2))
+            self.assertListEqual([len(b) for b in batches], [2, 1])
+            self.assertListEqual(list(batches[0].columns),
+                                 ['unadjusted_close', 'ticker_symbol', 'datetime', 'split', 'dividend'])
+
+        self.assertTrue(JsonLoader(jsonl_path).is_line_delimited())
+
+    def test_arrow_table_round_trip(self):
+        """Test loading and saving pyarrow Tables without going through pandas"""
+        import pyarrow as pa
+        parquet_path = os.path.join(self.temp_dir, "table.parquet")
+        ParquetSaver(parquet_path).save_table(pa.Table.from_pandas(self.sample_data, preserve_index=False))
+
+        table = ParquetLoader(parquet_path).load_table()
+        self.assertIsInstance(table, pa.Table)
+        self.assertEqual(table.num_rows, 3)
+        self.assertListEqual(table.column_names,
+                             ['unadjusted_close', 'ticker_symbol', 'datetime', 'split', 'dividend'])
+
+        csv_path = os.path.join(self.temp_dir, "table.csv")
+        CsvSaver(csv_path).save_table(table)
+        self.assertEqual(CsvLoader(csv_path).load_table().num_rows, 3)
+
+    def test_arrow_ipc_round_trip(self):
+        """Test Arrow IPC/Feather files are memory-mapped, filtered and written batch by batch"""
+        import pyarrow as pa
+        arrow_path = os.path.join(self.temp_dir, "test.arrow")
+        data = pd.concat([self.sample_data, self.sample_data.assign(ticker_symbol='OTHER')], ignore_index=True)
+
+        saver = BaseSaver.get_saver_for_file(arrow_path)
+        self.assertIsInstance(saver, ArrowSaver)
+        saver.save_batches([data.iloc[:3], data.iloc[3:]])
+
+        loader = ArrowLoader(arrow_path)
+        allocated = pa.total_allocated_bytes()
+        table = loader.mapped_table()
+        self.assertEqual(pa.total_allocated_bytes(), allocated)  # buffers live in the map
+        self.assertEqual(table.num_rows, 6)
+        self.assertEqual(loader.open_reader().num_record_batches, 2)
+        pd.testing.assert_frame_equal(loader.load_data(), data)
+
+        filtered = ArrowLoader(arrow_path, tickers=['OTHER'], start='2023-01-02').load_data()
+        self.assertListEqual(filtered['unadjusted_close'].tolist(), [102.0, 101.0])
+        self.assertListEqual([len(b) for b in loader.iter_batches(batch_size=2)], [2, 1, 2, 1])
+
+        # pandas/pyarrow written Feather (compressed by default) loads too
+        feather_path = os.path.join(self.temp_dir, "test.feather")
+        data.to_feather(feather_path)
+        pd.testing.assert_frame_equal(BaseLoader.get_loader_for_file(feather_path).load_data(), data)
+
+    def test_partitioned_dataset_round_trip(self):
+        """Test writing and reading a ticker/year partitioned dataset"""
+        dataset_path = os.path.join(self.temp_dir, "history")
+        data = pd.concat([self.sample_data,
+                          self.sample_data.assign(ticker_symbol='OTHER',
+                                                  datetime=pd.to_datetime(['2022-12-30', '2023-01-02', '2023-01-03']))],
+                         ignore_index=True)
+
+        saver = BaseSaver.get_saver_for_file(dataset_path)
+        self.assertIsInstance(saver, DatasetSaver)
+        saver.save(data)
+
+        self.assertListEqual(sorted(os.listdir(dataset_path)), ['ticker=OTHER', 'ticker=TEST'])
+        self.assertListEqual(sorted(os.listdir(os.path.join(dataset_path, 'ticker=OTHER'))), ['year=2022', 'year=2023'])
+
+        loader = BaseLoader.get_loader_for_file(dataset_path)
+        self.assertIsInstance(loader, DatasetLoader)
+        loaded = loader.load_data()
+        self.assertEqual(len(loaded), 6)
+        self.assertListEqual(list(loaded.columns),
+                             ['unadjusted_close', 'ticker_symbol', 'datetime', 'split', 'dividend'])
+
+        filtered = DatasetLoader(dataset_path, tickers=['OTHER'], end='2022-12-31').load_data()
+        self.assertEqual(len(filtered), 1)
+
+    def test_partitioned_dataset_rewrites_only_saved_tickers(self):
+        """Test that saving one ticker leaves the other tickers' files untouched"""
+        dataset_path = os.path.join(self.temp_dir, "history")
+        data = pd.concat([self.sample_data, self.sample_data.assign(ticker_symbol='OTHER')], ignore_index=True)
+        DatasetSaver(dataset_path).save(data)
+        other_file = os.path.join(dataset_path, 'ticker=OTHER', 'year=2023', 'part-0.parquet')
+        other_mtime = os.path.getmtime(other_file)
+
+        DatasetSaver(dataset_path).save(self.sample_data.iloc[:2])
+
+        self.assertEqual(os.path.getmtime(other_file), other_mtime)
+        loaded = DatasetLoader(dataset_path).load_data()
+        self.assertEqual(len(loaded[loaded['ticker_symbol'] == 'TEST']), 2)
+        self.assertEqual(len(loaded[loaded['ticker_symbol'] == 'OTHER']), 3)
+
+    def test_partitioned_dataset_filtered_rerun_keeps_other_years(self):
+        """Test that saving a date range of a ticker leaves its other years untouched"""
+        dataset_path = os.path.join(self.temp_dir, "history")
+        data = pd.concat([self.sample_data.assign(datetime=self.sample_data['datetime'] - pd.DateOffset(years=1)),
+                          self.sample_data], ignore_index=True)
+        DatasetSaver(dataset_path).save(data)
+
+        DatasetSaver(dataset_path).save(self.sample_data.iloc[1:])
+
+        self.assertListEqual(sorted(os.listdir(os.path.join(dataset_path, 'ticker=TEST'))), ['year=2022', 'year=2023'])
+        loaded = DatasetLoader(dataset_path).load_data()
+        self.assertEqual((loaded['datetime'].dt.year == 2022).sum(), 3)
+        self.assertEqual((loaded['datetime'].dt.year == 2023).sum(), 2)
+
+    def test_ticker_and_date_filters(self):
+        """Test that every loader applies ticker/date filters and the column projection"""
+        data = pd.concat([self.sample_data, self.sample_data.assign(ticker_symbol='OTHER')], ignore_index=True)
+        csv_path = os.path.join(self.temp_dir, "filter.csv")
+        json_path = os.path.join(self.temp_dir, "filter.json")
+        parquet_path = os.path.join(self.temp_dir, "filter.parquet")
+        data.to_csv(csv_path, index=False)
+        data.to_json(json_path, orient='records', date_format='iso')
+        data.to_parquet(parquet_path, index=False, row_group_size=2)
+
+        for loader_class, path in [(CsvLoader, csv_path), (JsonLoader, json_path), (ParquetLoader, parquet_path)]:
+            loader = loader_class(path, tickers=['TEST'], start='2023-01-02', end='2023-01-03')
+            loaded = loader.load_data()
+            self.assertEqual(len(loaded), 2, loader_class.__name__)
+            self.assertListEqual(loaded['ticker_symbol'].tolist(), ['TEST', 'TEST'])
+            self.assertEqual(sum(len(b) for b in loader.iter_batches(batch_size=1)), 2)
+
+            projected = loader_class(path, columns=['unadjusted_close'], tickers=['OTHER']).load_data()
+            self.assertListEqual(list(projected.columns), ['unadjusted_close'])
+            self.assertEqual(len(projected), 3)
+
+
+class TestParseCache(unittest.TestCase):
+    """Test the on-disk cache of parsed CSV/JSON inputs"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data = generate_market_data(num_tickers=4, years=1, seed=3)
+        self.csv_path = os.path.join(self.temp_dir, "prices.csv")
+        self.data.to_csv(self.csv_path, index=False)
+        self.cache = ParseCache(os.path.join(self.temp_dir, "cache"))
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_cached_load_matches_parse(self):
+        """Test cache hits give the parsed frame, with filters applied to the cached copy"""
+        jsonl_path = os.path.join(self.temp_dir, "prices.jsonl")
+        self.data.to_json(jsonl_path, orient='records', lines=True, date_format='iso')
+        filters = dict(tickers=['T00001', 'T00003'], start='2015-03-01', end='2015-06-30')
+
+        for path in [self.csv_path, jsonl_path]:
+            for options in [{}, filters]:
+                expected = BaseLoader.get_loader_for_file(path, **options).load_data().reset_index(drop=True)
+                for _ in range(2):
+                    loaded = self.cache.load_data(BaseLoader.get_loader_for_file(path, **options))
+                    pd.testing.assert_frame_equal(loaded, expected)
+
+        # one parse per file: the filtered loads reuse the unfiltered entry
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(self.cache.hits, 6)
+        self.assertEqual(len(self.cache.entries()), 2)
+
+        parquet_path = os.path.join(self.temp_dir, "prices.parquet")
+        self.data.to_parquet(parquet_path, index=False)
+        self.cache.load_data(ParquetLoader(parquet_path))
+        self.assertEqual(len(self.cache.entries()), 2)  # binary formats are not cached
+
+    def test_changed_file_is_parsed_again(self):
+        """Test an edit is detected by the content hash even with the same size and mtime"""
+        self.cache.load_data(CsvLoader(self.csv_path))
+        stat = os.stat(self.csv_path)
+        with open(self.csv_path) as f:
+            text = f.read()
+        with open(self.csv_path, 'w') as f:
+            f.write(text.replace(',1.0,', ',2.0,', 1))  # the first split
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(os.path.getsize(self.csv_path), stat.st_size)
+
+        loaded = self.cache.load_data(CsvLoader(self.csv_path))
+        self.assertEqual(int((loaded['split'] == 2.0).sum()), int((self.data['split'] == 2.0).sum()) + 1)
+        self.assertEqual(self.cache.misses, 2)
+        self.assertEqual(len(self.cache.entries()), 1)  # the old version is removed
+
+    def test_size_bound_evicts_least_recently_used(self):
+        """Test entries beyond max_bytes are removed, oldest use first"""
+        paths = []
+        for i in range(3):
+            path = os.path.join(self.temp_dir, f"copy{i}.csv")
+            self.data.to_csv(path, index=False)
+            paths.append(path)
+            self.cache.load_data(CsvLoader(path))
+        entry_size = self.cache.size() // 3
+
+        cache = ParseCache(self.cache.directory, max_bytes=2 * entry_size)
+        cache.load_data(CsvLoader(paths[0]))  # a hit makes copy0 the most recently used
+        cache.evict()
+        self.assertEqual(len(cache.entries()), 2)
+
+        cache.load_data(CsvLoader(paths[1]))  # evicted: copy1 was the least recently used
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
 
 class TestCalculationMethods(unittest.TestCase):
     """Test the forward and backward adjustment calculations"""
@@ -217,6 +544,40 @@ class TestCalculationMethods(unittest.TestCase):
             f"Expected {expected}, got {result['forward_adj_close'].tolist()}"
         )
     
+    def test_forward_adjusted_loop_engine(self):
+        """Test the reference loop engine gives the same hand-computed values"""
+        result = ForwardAdjusted(self.test_data, engine='loop').forward_adj()
+
+        expected = [100.0, 105, 111.05, 232.19]
+
+        self.assertTrue(
+            all(abs(a - b) < 0.000001 for a, b in zip(result['forward_adj_close'], expected)),
+            f"Expected {expected}, got {result['forward_adj_close'].tolist()}"
+        )
+
+    def test_forward_adjusted_missing_price(self):
+        """Test a missing or 0 price without a dividend only affects its own row"""
+        import warnings
+        data = pd.DataFrame({
+            'unadjusted_close': [10.0, 11.0, np.nan, 12.0, 0.0, 13.0],
+            'ticker_symbol': ['TEST'] * 6,
+            'datetime': pd.date_range('2023-01-01', periods=6),
+            'split': [1.0] * 6,
+            'dividend': [0.0, 0.5, 0.0, 0.0, 0.0, 0.0]
+        })
+        loop = ForwardAdjusted(data, engine='loop').forward_adj()['forward_adj_close']
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            result = ForwardAdjusted(data).forward_adj()['forward_adj_close']
+
+        pd.testing.assert_series_equal(result, loop)
+        self.assertListEqual(result.fillna(-1.0).tolist(), [10.0, 11.0, -1.0, 12.55, 0.0, 13.59])
+
+    def test_forward_adjusted_unknown_engine(self):
+        """Test that an unknown engine is rejected"""
+        with self.assertRaises(ValueError):
+            ForwardAdjusted(self.test_data, engine='gpu')
+
     def test_backward_adjusted_calculation(self):
         """Test backward adjustment calculation"""
         backward_adj = BackwardAdjusted(self.test_data)
@@ -229,6 +590,771 @@ class TestCalculationMethods(unittest.TestCase):
             f"Expected {expected}, got {result['backward_adj_close'].tolist()}"
         )
 
+    def test_backward_adjusted_loop_engine(self):
+        """Test the reference loop engine gives the same hand-computed values"""
+        result = BackwardAdjusted(self.test_data, engine='loop').backward_adj()
+
+        expected = [49.05, 52.5, 110, 115.0]
+
+        self.assertTrue(
+            all(abs(a - b) < 0.000001 for a, b in zip(result['backward_adj_close'], expected)),
+            f"Expected {expected}, got {result['backward_adj_close'].tolist()}"
+        )
+
+    def test_backward_engines_agree_across_tickers(self):
+        """Test the sparse engine resets its factor at every ticker boundary"""
+        other = self.test_data.copy()
+        other['ticker_symbol'] = 'ABC'
+        other['split'] = [1.0, 3.0, 1.0, 1.0]
+        other['dividend'] = [0.0, 0.0, 0.0, 0.5]
+        data = pd.concat([self.test_data, other], ignore_index=True)
+
+        loop = BackwardAdjusted(data, engine='loop').backward_adj()
+        sparse = BackwardAdjusted(data).backward_adj()
+
+        self.assertListEqual(list(loop.index), list(sparse.index))
+        self.assertListEqual(loop['backward_adj_close'].tolist(), sparse['backward_adj_close'].tolist())
+
+    def test_combined_matches_separate_runs(self):
+        """Test the single-pass combined adjuster adds both columns with the same values"""
+        result = CombinedAdjusted(self.test_data.iloc[::-1]).adjust()
+
+        forward = ForwardAdjusted(self.test_data).forward_adj()
+        backward = BackwardAdjusted(self.test_data).backward_adj()
+        self.assertListEqual(list(result.index), list(forward.index))
+        self.assertListEqual(result['forward_adj_close'].tolist(), forward['forward_adj_close'].tolist())
+        self.assertListEqual(result['backward_adj_close'].tolist(), backward['backward_adj_close'].tolist())
+
+
+class TestStreamingAdjusted(unittest.TestCase):
+    """Test batch-wise adjustment with state carried across batch boundaries"""
+
+    def setUp(self):
+        """Set up two tickers with events near the batch boundaries"""
+        self.data = pd.DataFrame({
+            'unadjusted_close': [100.0, 105.0, 110.0, 115.0, 50.0, 52.0, 26.0, 27.0, 28.0],
+            'ticker_symbol': ['AAA'] * 4 + ['BBB'] * 5,
+            'datetime': pd.to_datetime(['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04',
+                                        '2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04',
+                                        '2023-01-05']),
+            'split': [1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0],
+            'dividend': [0.0, 1.0, 0.0, 0.0, 0.0, 0.5, 0.0, 0.0, 0.3]
+        })
+
+    def batches(self, size=3):
+        return [self.data.iloc[start:start + size] for start in range(0, len(self.data), size)]
+
+    def test_streaming_forward_matches_in_memory(self):
+        """Test streamed forward prices match the in-memory engine"""
+        expected = ForwardAdjusted(self.data).forward_adj()
+        for size in [1, 2, 3, 4]:
+            result = pd.concat(StreamingForwardAdjusted(self.batches(size)).forward_adj())
+            diff = (result['forward_adj_close'] - expected['forward_adj_close']).abs()
+            self.assertLessEqual(diff.max(), ForwardAdjusted.TOLERANCE)
+
+    def test_streaming_backward_matches_in_memory(self):
+        """Test streamed backward prices match the in-memory engine exactly"""
+        expected = BackwardAdjusted(self.data).backward_adj()
+        for size in [1, 2, 3, 4]:
+            result = pd.concat(StreamingBackwardAdjusted(lambda: self.batches(size)).backward_adj())
+            self.assertListEqual(result['backward_adj_close'].tolist(), expected['backward_adj_close'].tolist())
+
+    def test_ungrouped_batches_rejected(self):
+        """Test that a ticker reappearing in a later batch raises an error"""
+        batches = [self.data.iloc[0:2], self.data.iloc[4:6], self.data.iloc[2:4]]
+        with self.assertRaises(ValueError):
+            list(StreamingForwardAdjusted(batches).forward_adj())
+
+
+class TestIncrementalAdjusted(unittest.TestCase):
+    """Test appending new rows to previously adjusted data"""
+
+    def setUp(self):
+        """Set up a history where only AAA gets a new dividend and CCC is a new ticker"""
+        self.data = pd.DataFrame({
+            'unadjusted_close': [100.0, 105.0, 110.0, 115.0, 116.0, 50.0, 52.0, 26.0, 27.0, 28.0, 10.0, 11.0],
+            'ticker_symbol': ['AAA'] * 5 + ['BBB'] * 5 + ['CCC'] * 2,
+            'datetime': pd.to_datetime(['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04', '2023-01-05',
+                                        '2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04', '2023-01-05',
+                                        '2023-01-04', '2023-01-05']),
+            'split': [1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0],
+            'dividend': [0.0, 1.0, 0.0, 0.0, 0.4, 0.0, 0.5, 0.0, 0.0, 0.0, 0.0, 0.2]
+        })
+        self.is_new = (self.data['datetime'] >= pd.Timestamp('2023-01-04')).to_numpy()
+
+    def test_append_matches_full_recompute(self):
+        """Test both modes give exactly the values of a full recompute"""
+        old = self.data[~self.is_new]
+        new = self.data[self.is_new]
+        for mode, adjuster, method, column in [
+                ('forward', ForwardAdjusted, 'forward_adj', 'forward_adj_close'),
+                ('backward', BackwardAdjusted, 'backward_adj', 'backward_adj_close')]:
+            existing = getattr(adjuster(old), method)()
+            result = IncrementalAdjusted(existing, new, mode=mode).adjust()
+            expected = getattr(adjuster(self.data), method)()
+
+            self.assertListEqual(result['ticker_symbol'].tolist(), expected['ticker_symbol'].tolist())
+            self.assertListEqual(result[column].tolist(), expected[column].tolist())
+
+    def test_backward_untouched_without_new_events(self):
+        """Test tickers without new events keep their existing backward values"""
+        old = self.data[~self.is_new]
+        existing = BackwardAdjusted(old).backward_adj()
+        result = IncrementalAdjusted(existing, self.data[self.is_new], mode='backward').adjust()
+
+        bbb_old = existing[existing['ticker_symbol'] == 'BBB']['backward_adj_close'].tolist()
+        bbb_new = result[result['ticker_symbol'] == 'BBB']['backward_adj_close'].tolist()
+        self.assertListEqual(bbb_new[:len(bbb_old)], bbb_old)
+
+    def test_overlapping_rows_rejected(self):
+        """Test that new rows not later than the existing history raise an error"""
+        existing = ForwardAdjusted(self.data).forward_adj()
+        with self.assertRaises(ValueError):
+            IncrementalAdjusted(existing, self.data.iloc[[4]], mode='forward').adjust()
+
+
+class TestFactorStore(unittest.TestCase):
+    """Test the persisted corporate-action factor store"""
+
+    def setUp(self):
+        """Set up two tickers with splits and dividends"""
+        self.data = pd.DataFrame({
+            'unadjusted_close': [100.0, 105.0, 110.0, 115.0, 116.0, 50.0, 52.0, 26.0, 27.0, 28.0],
+            'ticker_symbol': ['AAA'] * 5 + ['BBB'] * 5,
+            'datetime': pd.to_datetime(['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04', '2023-01-05'] * 2),
+            'split': [1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 1.0, 2.0, 1.0, 1.0],
+            'dividend': [0.0, 1.0, 0.0, 0.0, 0.4, 0.0, 0.5, 0.0, 0.0, 0.0]
+        })
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_store_keeps_only_events_and_boundaries(self):
+        """Test the store holds the event rows plus each ticker's first and last row"""
+        store = FactorStore.from_frame(self.data)
+        self.assertEqual(len(store.table), 8)
+        self.assertListEqual(list(store.segments.tickers), ['AAA', 'BBB'])
+
+    def test_adjust_matches_adjusters(self):
+        """Test prices derived from the store match the adjusters exactly"""
+        store = FactorStore.from_frame(self.data)
+        forward = store.adjust(self.data, mode='forward')
+        backward = store.adjust(self.data, mode='backward')
+
+        self.assertListEqual(forward['forward_adj_close'].tolist(),
+                             ForwardAdjusted(self.data).forward_adj()['forward_adj_close'].tolist())
+        self.assertListEqual(backward['backward_adj_close'].tolist(),
+                             BackwardAdjusted(self.data).backward_adj()['backward_adj_close'].tolist())
+
+    def test_missing_first_price(self):
+        """Test a missing first price without a dividend only affects its own row"""
+        data = self.data.copy()
+        data.loc[0, 'unadjusted_close'] = np.nan
+        forward = FactorStore.from_frame(data).adjust(data, mode='forward')['forward_adj_close']
+        expected = ForwardAdjusted(data, engine='loop').forward_adj()['forward_adj_close']
+
+        self.assertTrue(np.isnan(forward.iloc[0]))
+        self.assertListEqual(forward.iloc[1:].tolist(), expected.iloc[1:].tolist())
+
+    def test_save_load_and_rebuild(self):
+        """Test a persisted store round-trips and rebuilds from its event rows alone"""
+        store = FactorStore.from_frame(self.data)
+        path = os.path.join(self.temp_dir, "factors.parquet")
+        store.save(path)
+
+        loaded = FactorStore.load(path)
+        pd.testing.assert_frame_equal(loaded.table, store.table)
+        pd.testing.assert_frame_equal(loaded.rebuild().table, store.table)
+
+    def test_unknown_ticker_rejected(self):
+        """Test that prices for a ticker missing from the store raise an error"""
+        store = FactorStore.from_frame(self.data[self.data['ticker_symbol'] == 'AAA'])
+        with self.assertRaises(ValueError):
+            store.adjust(self.data, mode='forward')
+
+
+class TestArrowAdjusted(unittest.TestCase):
+    """Test adjustment computed directly on pyarrow Tables"""
+
+    def setUp(self):
+        """Set up two tickers in shuffled order"""
+        self.data = pd.DataFrame({
+            'unadjusted_close': [100.0, 105.0, 110.0, 115.0, 50.0, 52.0, 26.0, 27.0],
+            'ticker_symbol': ['AAA'] * 4 + ['BBB'] * 4,
+            'datetime': pd.to_datetime(['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04'] * 2),
+            'split': [1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 2.0, 1.0],
+            'dividend': [0.0, 1.0, 0.0, 0.0, 0.0, 0.5, 0.0, 0.3]
+        }).sample(frac=1.0, random_state=1)
+
+    def test_arrow_matches_pandas(self):
+        """Test the Arrow engine gives the same values as the pandas adjusters"""
+        import pyarrow as pa
+        table = pa.Table.from_pandas(self.data, preserve_index=False)
+
+        forward = ArrowAdjusted(table, mode='forward').adjust()
+        backward = ArrowAdjusted(table, mode='backward').adjust()
+
+        self.assertIsInstance(forward, pa.Table)
+        self.assertListEqual(forward.column('forward_adj_close').to_pylist(),
+                             ForwardAdjusted(self.data).forward_adj()['forward_adj_close'].tolist())
+        self.assertListEqual(backward.column('backward_adj_close').to_pylist(),
+                             BackwardAdjusted(self.data).backward_adj()['backward_adj_close'].tolist())
+
+        both = ArrowAdjusted(table, mode='both').adjust()
+        self.assertListEqual(both.column('forward_adj_close').to_pylist(), forward.column('forward_adj_close').to_pylist())
+        self.assertListEqual(both.column('backward_adj_close').to_pylist(), backward.column('backward_adj_close').to_pylist())
+
+    def test_segments_from_arrow(self):
+        """Test the segment index built with Arrow kernels"""
+        import pyarrow as pa
+        table = pa.table({'ticker_symbol': ['AAA', 'AAA', 'BBB', 'CCC', 'CCC']})
+        self.assertListEqual(list(TickerSegments.from_arrow(table)), [('AAA', 0, 2), ('BBB', 2, 3), ('CCC', 3, 5)])
+
+
+class TestAdjustedPriceIndex(unittest.TestCase):
+    """Test point-in-time lookups of adjusted prices"""
+
+    def setUp(self):
+        self.data = generate_market_data(num_tickers=5, years=2, seed=9).sample(frac=1.0, random_state=0)
+        self.expected = CombinedAdjusted(self.data).adjust()
+        self.index = AdjustedPriceIndex(self.data)
+
+    def test_batch_lookup_matches_adjusters(self):
+        """Test every (ticker, date) pair gives the full adjustment's value"""
+        for mode in ['forward', 'backward']:
+            result = self.index.lookup(self.expected['ticker_symbol'], self.expected['datetime'], mode)
+            np.testing.assert_array_equal(result, self.expected[f'{mode}_adj_close'].to_numpy())
+
+    def test_point_lookup_is_as_of(self):
+        """Test a date between bars uses the last bar before it"""
+        row = self.expected.iloc[100]
+        later = row['datetime'] + pd.Timedelta(hours=12)
+
+        self.assertEqual(self.index.price(row['ticker_symbol'], later, 'backward'), row['backward_adj_close'])
+        self.assertTrue(np.isnan(self.index.price(row['ticker_symbol'], '1990-01-01')))
+        self.assertTrue(np.isnan(self.index.lookup(['UNKNOWN'], ['2016-01-04'])[0]))
+        with self.assertRaises(KeyError):
+            self.index.price('UNKNOWN', '2016-01-04')
+        with self.assertRaises(ValueError):
+            self.index.price(row['ticker_symbol'], later, 'both')
+
+    def test_series_range(self):
+        """Test a date range returns the ticker's rows in that range"""
+        ticker = self.expected['ticker_symbol'].iloc[0]
+        result = self.index.series(ticker, '2015-03-01', '2015-03-31', 'forward')
+        rows = self.expected[(self.expected['ticker_symbol'] == ticker)
+                             & (self.expected['datetime'] >= '2015-03-01')
+                             & (self.expected['datetime'] <= '2015-03-31')]
+
+        self.assertEqual(len(result), len(rows))
+        np.testing.assert_array_equal(result['forward_adj_close'].to_numpy(), rows['forward_adj_close'].to_numpy())
+
+
+class TestReturnsMatrix(unittest.TestCase):
+    """Test returns and rolling statistics on the dates x tickers matrix"""
+
+    def setUp(self):
+        data = generate_market_data(num_tickers=4, years=1, seed=11)
+        adjusted = ForwardAdjusted(data).forward_adj()
+        # a missing date for one ticker and a later listing for another
+        self.adjusted = adjusted.drop(adjusted.index[10])
+        self.adjusted = self.adjusted[~((self.adjusted['ticker_symbol'] == 'T00003')
+                                        & (self.adjusted['datetime'] < '2015-03-01'))]
+        self.wide = self.adjusted.pivot(index='datetime', columns='ticker_symbol', values='forward_adj_close')
+
+    def test_matches_pandas_per_ticker(self):
+        """Test returns and rolling stats equal pandas on the pivoted prices"""
+        matrix = ReturnsMatrix.from_adjusted(self.adjusted.astype({'ticker_symbol': 'category'}))
+        expected = self.wide.pct_change(fill_method=None)
+
+        np.testing.assert_allclose(matrix.simple_returns().to_numpy(), expected.to_numpy())
+        np.testing.assert_allclose(matrix.log_returns().to_numpy(), np.log1p(expected.to_numpy()))
+        np.testing.assert_allclose(matrix.total_returns().to_numpy(), (self.wide / self.wide.bfill().iloc[0] - 1).to_numpy())
+        for statistic in ReturnsMatrix.STATISTICS:
+            np.testing.assert_allclose(matrix.rolling(10, statistic).to_numpy(),
+                                       getattr(expected.rolling(10), statistic)().to_numpy(), rtol=1e-9, atol=1e-15)
+
+    def test_missing_dates(self):
+        """Test the three ways of handling a date missing for one ticker"""
+        gap = self.wide.index[10]
+        date_after = self.wide.index[11]
+        ticker = self.wide.columns[0]
+        returns = {missing: ReturnsMatrix.from_adjusted(self.adjusted, missing=missing).simple_returns()
+                   for missing in ReturnsMatrix.MISSING}
+        before, after = self.wide.loc[self.wide.index[9], ticker], self.wide.loc[date_after, ticker]
+
+        self.assertTrue(np.isnan(returns['nan'].loc[date_after, ticker]))
+        self.assertTrue(np.isnan(returns['skip'].loc[gap, ticker]))
+        self.assertAlmostEqual(returns['skip'].loc[date_after, ticker], after / before - 1)
+        self.assertEqual(returns['ffill'].loc[gap, ticker], 0.0)
+        self.assertAlmostEqual(returns['ffill'].loc[date_after, ticker], after / before - 1)
+        # before its first row a ticker has no returns in any mode
+        self.assertTrue(returns['ffill'].loc[:'2015-02-27', 'T00003'].isna().all())
+
+    def test_save_wide_and_long(self):
+        """Test results are written through the savers in both layouts"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            matrix = ReturnsMatrix.from_adjusted(self.adjusted)
+            wide_path = os.path.join(temp_dir, 'returns.parquet')
+            long_path = os.path.join(temp_dir, 'returns.csv')
+            ReturnsMatrix.save(matrix.simple_returns(), wide_path)
+            ReturnsMatrix.save(matrix.total_returns(), long_path, layout='long', name='total_return')
+
+            wide = pd.read_parquet(wide_path)
+            long = pd.read_csv(long_path)
+            self.assertListEqual(list(wide.columns), ['datetime'] + list(self.wide.columns))
+            self.assertEqual(len(long), len(self.adjusted))
+            self.assertListEqual(list(long.columns), ['ticker_symbol', 'datetime', 'total_return'])
+        finally:
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        with self.assertRaises(ValueError):
+            ReturnsMatrix.from_adjusted(pd.concat([self.adjusted, self.adjusted.iloc[:1]]))
+
+
+class TestExternalSort(unittest.TestCase):
+    """Test the disk-backed ticker/date sort feeding the streaming adjusters"""
+
+    def setUp(self):
+        self.data = generate_market_data(num_tickers=12, years=2, seed=9)
+        # vendor files arrive date-major
+        self.date_major = self.data.sort_values(['datetime', 'ticker_symbol'], kind='mergesort').reset_index(drop=True)
+        self.batches = [self.date_major.iloc[i:i + 500] for i in range(0, len(self.date_major), 500)]
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_merged_stream_is_sorted(self):
+        """Test the runs spill under the budget and merge into ticker/date order"""
+        with ExternalSort(self.batches, memory_budget=100_000, temp_dir=self.temp_dir, batch_size=1000) as sorter:
+            self.assertGreater(len(sorter.spill()), 2)
+            batches = list(sorter.batches())
+            self.assertTrue(all(len(batch) <= 1000 for batch in batches))
+        self.assertListEqual(os.listdir(self.temp_dir), [])  # runs removed on exit
+
+        merged = pd.concat(batches, ignore_index=True)
+        expected = self.data.sort_values(['ticker_symbol', 'datetime'], kind='mergesort').reset_index(drop=True)
+        pd.testing.assert_frame_equal(merged, expected.astype({'ticker_symbol': merged['ticker_symbol'].dtype}))
+
+    def test_adjusted_stream_matches_in_memory(self):
+        """Test every mode of the sorted stream equals adjusting the whole frame"""
+        expected = CombinedAdjusted(self.data).adjust().reset_index(drop=True)
+        with ExternalSort(self.batches, memory_budget=100_000, temp_dir=self.temp_dir) as sorter:
+            for mode, columns in [('forward', ['forward_adj_close']), ('backward', ['backward_adj_close']),
+                                  ('both', ['forward_adj_close', 'backward_adj_close'])]:
+                result = pd.concat(list(sorter.adjusted_batches(mode)), ignore_index=True)
+                for column in columns:
+                    np.testing.assert_allclose(result[column].to_numpy(), expected[column].to_numpy(),
+                                               atol=ForwardAdjusted.TOLERANCE, err_msg=f'{mode} {column}')
+
+    def test_empty_input(self):
+        """Test an input without rows gives one empty frame, with or without empty batches"""
+        for batches in [[self.data.iloc[:0]], []]:
+            with ExternalSort(batches, temp_dir=self.temp_dir) as sorter:
+                merged = list(sorter.batches())
+                self.assertEqual(len(merged), 1)
+                self.assertListEqual(list(merged[0].columns), list(self.data.columns))
+                self.assertEqual(len(merged[0]), 0)
+                for mode in ['forward', 'backward', 'both']:
+                    adjusted = list(sorter.adjusted_batches(mode))
+                    self.assertEqual(len(adjusted), 1)
+                    self.assertEqual(len(adjusted[0]), 0)
+
+    def test_empty_input_still_writes_output(self):
+        """Test --sort-memory-mb with filters matching nothing still creates the output files"""
+        source = os.path.join(self.temp_dir, "prices.parquet")
+        self.data.to_parquet(source, index=False)
+
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            for name in ['empty.parquet', 'empty.csv', 'empty.arrow']:
+                output = os.path.join(self.temp_dir, name)
+                with patch('sys.argv', ['calculator.py', '--input', source, '--tickers', 'NOPE',
+                                        '--output', output, '--sort-memory-mb', '5']):
+                    calculator.main()
+                result = BaseLoader.get_loader_for_file(output, columns=['ticker_symbol', 'forward_adj_close']).load_data()
+                self.assertEqual(len(result), 0)
+        finally:
+            sys.stdout = old_stdout
+
+
+class TestTickerSegments(unittest.TestCase):
+    """Test the per-ticker segment index"""
+
+    def test_segment_offsets(self):
+        """Test start/stop offsets and slicing by ticker"""
+        segments = TickerSegments(['AAA', 'AAA', 'BBB', 'CCC', 'CCC', 'CCC'])
+
+        self.assertEqual(len(segments), 3)
+        self.assertListEqual(list(segments), [('AAA', 0, 2), ('BBB', 2, 3), ('CCC', 3, 6)])
+        self.assertEqual(segments['CCC'], slice(3, 6))
+        self.assertIn('BBB', segments)
+        self.assertNotIn('DDD', segments)
+        self.assertListEqual(segments.first.tolist(), [True, False, True, True, False, False])
+        self.assertListEqual(segments.last.tolist(), [False, True, True, False, False, True])
+        self.assertListEqual(segments.group_ids.tolist(), [0, 0, 1, 2, 2, 2])
+
+    def test_empty_index(self):
+        """Test an index over no rows"""
+        segments = TickerSegments([])
+        self.assertEqual(len(segments), 0)
+        self.assertEqual(len(segments.group_ids), 0)
+
+    def test_unsorted_tickers_rejected(self):
+        """Test that non-contiguous ticker rows raise an error"""
+        with self.assertRaises(ValueError):
+            TickerSegments(['AAA', 'BBB', 'AAA'])
+
+    def test_sortedness_detection(self):
+        """Test sorted input is recognised and unsorted tickers or dates are not"""
+        data = generate_market_data(num_tickers=3, years=1, seed=2)
+        swapped_dates = data.iloc[[1, 0] + list(range(2, len(data)))]
+        categorical = data.astype({'ticker_symbol': pd.CategoricalDtype(['T00002', 'T00001', 'T00000'])})
+
+        self.assertEqual(len(sorted_segments(data)), 3)
+        self.assertIsNone(sorted_segments(data.iloc[::-1]))
+        self.assertIsNone(sorted_segments(swapped_dates))
+        # categoricals sort in category order, as sort_values does
+        self.assertIsNone(sorted_segments(categorical))
+        self.assertIsNotNone(sorted_segments(categorical.iloc[::-1].sort_values('datetime').sort_values(
+            'ticker_symbol', kind='mergesort')))
+
+    def test_inplace_adjusters(self):
+        """Test in-place mode adds the column to the input frame and gives the same values"""
+        data = generate_market_data(num_tickers=3, years=1, seed=2)
+        expected = ForwardAdjusted(data).forward_adj()
+        self.assertNotIn('forward_adj_close', data.columns)
+
+        frame = data.copy()
+        result = ForwardAdjusted(frame, inplace=True).forward_adj()
+        self.assertIs(result, frame)
+        pd.testing.assert_frame_equal(result, expected)
+
+        # unsorted input is sorted in place first
+        frame = data.sample(frac=1.0, random_state=0)
+        result = BackwardAdjusted(frame, inplace=True).backward_adj()
+        self.assertIs(result, frame)
+        pd.testing.assert_frame_equal(result, BackwardAdjusted(data).backward_adj())
+
+
+class TestParallelAdjusted(unittest.TestCase):
+    """Test ticker-sharded multi-process adjustment"""
+
+    def setUp(self):
+        """Set up a small multi-ticker frame in shuffled order"""
+        frames = []
+        for i, ticker in enumerate(['AAA', 'BBB', 'CCC', 'DDD', 'EEE']):
+            frames.append(pd.DataFrame({
+                'unadjusted_close': [100.0 + i, 105.0, 110.0, 115.0],
+                'ticker_symbol': [ticker] * 4,
+                'datetime': pd.to_datetime(['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04']),
+                'split': [1.0, 1.0, 2.0, 1.0],
+                'dividend': [0.0, 1.0 + i, 0.0, 0.5]
+            }))
+        self.data = pd.concat(frames, ignore_index=True).sample(frac=1.0, random_state=0)
+
+    def test_shard_bounds_cover_whole_tickers(self):
+        """Test shards are contiguous, cover every row and never split a ticker"""
+        segments = TickerSegments(['A'] * 5 + ['B'] * 1 + ['C'] * 3 + ['D'] * 7)
+        shards = ParallelAdjusted.shard_bounds(segments, 3)
+
+        self.assertEqual(shards[0][0], 0)
+        self.assertEqual(shards[-1][1], 16)
+        for (_, stop), (start, _) in zip(shards[:-1], shards[1:]):
+            self.assertEqual(stop, start)
+            self.assertIn(stop, segments.stops.tolist())
+
+    def test_parallel_matches_serial(self):
+        """Test that sharded results match the single-process adjusters in order"""
+        for mode, adjuster, method in [('forward', ForwardAdjusted, 'forward_adj'),
+                                       ('backward', BackwardAdjusted, 'backward_adj'),
+                                       ('both', CombinedAdjusted, 'adjust')]:
+            serial = getattr(adjuster(self.data), method)()
+            parallel = ParallelAdjusted(self.data, mode=mode, workers=2).adjust()
+            pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_unknown_mode(self):
+        """Test that an unknown mode is rejected"""
+        with self.assertRaises(ValueError):
+            ParallelAdjusted(self.data, mode='sideways')
+
+
+class TestAdjustmentService(unittest.TestCase):
+    """Test the resident adjustment service and its result cache"""
+
+    def setUp(self):
+        """Write a two-ticker Parquet file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "prices.parquet")
+        self.data = pd.DataFrame({
+            'unadjusted_close': [100.0, 105.0, 110.0, 115.0, 50.0, 52.0, 26.0, 27.0],
+            'ticker_symbol': ['AAA'] * 4 + ['BBB'] * 4,
+            'datetime': pd.to_datetime(['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04'] * 2),
+            'split': [1.0, 1.0, 2.0, 1.0, 1.0, 1.0, 2.0, 1.0],
+            'dividend': [0.0, 1.0, 0.0, 0.0, 0.0, 0.5, 0.0, 0.3]
+        })
+        self.data.to_parquet(self.path, index=False)
+
+    def tearDown(self):
+        """Clean up temporary files"""
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        """Test the cache keeps the most recently used entries"""
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_matches_filtered_adjustment(self):
+        """Test a request equals adjusting the same ticker and date range directly"""
+        service = AdjustmentService(self.path, cache_size=4)
+        result = service.adjusted('BBB', 'backward', start='2023-01-02')
+
+        rows = self.data[(self.data['ticker_symbol'] == 'BBB') & (self.data['datetime'] >= '2023-01-02')]
+        expected = BackwardAdjusted(rows).backward_adj()
+        self.assertListEqual(result['backward_adj_close'].tolist(), expected['backward_adj_close'].tolist())
+
+        self.assertIs(service.adjusted('BBB', 'backward', start='2023-01-02'), result)
+        self.assertEqual(service.cache.hits, 1)
+        with self.assertRaises(KeyError):
+            service.adjusted('ZZZ')
+
+    def test_file_change_invalidates_cache(self):
+        """Test a modified file is reloaded and cached results are dropped"""
+        service = AdjustmentService(self.path)
+        before = service.adjusted('AAA')
+
+        changed = self.data.assign(unadjusted_close=self.data['unadjusted_close'] * 2)
+        changed.to_parquet(self.path, index=False)
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        after = service.adjusted('AAA')
+        self.assertEqual(after['unadjusted_close'].iloc[0], 2 * before['unadjusted_close'].iloc[0])
+
+    def test_result_of_replaced_data_is_not_cached(self):
+        """Test a result computed while the file was reloaded is returned but not cached"""
+        service = AdjustmentService(self.path)
+        compute = service._compute
+
+        def compute_then_reload(*args):
+            result = compute(*args)
+            self.data.assign(unadjusted_close=self.data['unadjusted_close'] * 2).to_parquet(self.path, index=False)
+            stat = os.stat(self.path)
+            os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertTrue(service.reload_if_changed())
+            return result
+
+        service._compute = compute_then_reload
+        stale = service.adjusted('AAA')
+        self.assertEqual(stale['unadjusted_close'].iloc[0], 100.0)
+        self.assertEqual(len(service.cache), 0)
+
+        service._compute = compute
+        self.assertEqual(service.adjusted('AAA')['unadjusted_close'].iloc[0], 200.0)
+
+    def test_http_responses(self):
+        """Test the HTTP front end's status codes and JSON bodies"""
+        import asyncio
+        import json
+        server = AdjustmentServer(AdjustmentService(self.path))
+
+        status, body = asyncio.run(server.respond('GET', '/adjusted?ticker=AAA&mode=both'))
+        self.assertEqual(status, 200)
+        records = json.loads(body)
+        self.assertEqual(len(records), 4)
+        self.assertIn('forward_adj_close', records[0])
+        self.assertIn('backward_adj_close', records[0])
+
+        self.assertEqual(asyncio.run(server.respond('GET', '/tickers')), (200, {'tickers': ['AAA', 'BBB']}))
+        self.assertEqual(asyncio.run(server.respond('GET', '/adjusted?ticker=ZZZ'))[0], 404)
+        self.assertEqual(asyncio.run(server.respond('GET', '/adjusted?ticker=AAA&mode=sideways'))[0], 400)
+        self.assertEqual(asyncio.run(server.respond('POST', '/adjusted'))[0], 405)
+
+    def test_http_unexpected_error_is_answered(self):
+        """Test an unexpected exception gives a 500 response instead of a dropped connection"""
+        import asyncio
+        server = AdjustmentServer(AdjustmentService(self.path))
+
+        async def failing(method, target):
+            raise RuntimeError('boom')
+        server.respond = failing
+
+        async def request():
+            listener = await server.serve_tcp(port=0)
+            async with listener:
+                port = listener.sockets[0].getsockname()[1]
+                reader, writer = await asyncio.open_connection('127.0.0.1', port)
+                writer.write(b'GET /tickers HTTP/1.1\r\n\r\n')
+                await writer.drain()
+                response = await reader.read()
+                writer.close()
+                return response
+
+        response = asyncio.run(request())
+        self.assertTrue(response.startswith(b'HTTP/1.1 500 Internal Server Error'))
+        self.assertIn(b'RuntimeError: boom', response)
+
+
+class TestBenchmark(unittest.TestCase):
+    """Test the synthetic data generator and the benchmark baseline comparison"""
+
+    def test_generator_is_deterministic(self):
+        """Test the generator's shape, ordering and reproducibility"""
+        data = generate_market_data(num_tickers=20, years=2, seed=7)
+        self.assertEqual(len(data), 20 * 2 * 252)
+        self.assertListEqual(list(data.columns), ['unadjusted_close', 'ticker_symbol', 'datetime', 'split', 'dividend'])
+        self.assertTrue(data.equals(generate_market_data(num_tickers=20, years=2, seed=7)))
+        self.assertFalse(data.equals(generate_market_data(num_tickers=20, years=2, seed=8)))
+        self.assertTrue((data['dividend'] > 0).any())
+        self.assertTrue((data['unadjusted_close'] > 0).all())
+
+        # already in ticker/date order
+        sorted_data = data.sort_values(['ticker_symbol', 'datetime'], ignore_index=True)
+        self.assertTrue(data.equals(sorted_data))
+
+    def test_suite_and_baseline_comparison(self):
+        """Test a small run and that slower or larger results than the baseline are reported"""
+        suite = BenchmarkSuite(num_tickers=3, years=1, repeat=1, formats=['.parquet'], modes=['forward'])
+        results = suite.run()
+        self.assertListEqual([r.case for r in results], ['save/parquet', 'load/parquet', 'adjust/forward'])
+        self.assertTrue(all(r.rows == 3 * 252 for r in results))
+
+        baseline = suite.baseline(results)
+        self.assertListEqual(suite.compare(results, baseline), [])
+
+        slow = [BenchmarkResult('adjust/forward', 1, 1.0, baseline['results']['adjust/forward']['rows_per_sec'] / 10,
+                                baseline['results']['adjust/forward']['peak_mb'] * 10 + 2)]
+        self.assertEqual(len(suite.compare(slow, baseline)), 2)
+
+        with self.assertRaises(ValueError):
+            BenchmarkSuite(num_tickers=4, years=1).compare(results, baseline)
+
+
+class TestProfiler(unittest.TestCase):
+    """Test stage and per-ticker instrumentation"""
+
+    def test_stages_and_hook(self):
+        """Test records carry timings and rows and are passed to the hook"""
+        seen = []
+        profiler = Profiler(on_record=seen.append)
+        with profiler.stage('load') as stage:
+            stage.rows = 42
+        with profiler.ticker('AAA', rows=7):
+            pass
+
+        self.assertEqual([r.name for r in seen], ['load', 'AAA'])
+        self.assertEqual(profiler.stages[0].rows, 42)
+        self.assertEqual(profiler.tickers[0].rows, 7)
+        self.assertGreaterEqual(profiler.stages[0].wall_seconds, 0.0)
+        self.assertListEqual(sorted(profiler.report()), ['stages', 'tickers'])
+        self.assertIn('AAA', profiler.summary())
+
+    def test_disabled_profiler_records_nothing(self):
+        """Test a disabled profiler can wrap code without measuring it"""
+        profiler = Profiler(enabled=False)
+        with profiler.stage('load') as stage:
+            stage.rows = 1
+        self.assertListEqual(profiler.records, [])
+
+    def test_sampler_thread_stops_with_last_measurement(self):
+        """Test finished profilers leave no RSS sampling thread running"""
+        import threading
+
+        def samplers():
+            return [t for t in threading.enumerate() if t.name == 'rss-sampler']
+
+        for _ in range(5):
+            profiler = Profiler()
+            with profiler.stage('adjust'):
+                with profiler.ticker('AAA'):
+                    self.assertEqual(len(samplers()), 1)
+        self.assertListEqual(samplers(), [])
+
+    def test_adjust_by_ticker_matches_adjusters(self):
+        """Test the per-ticker profiled adjustment gives the same frame"""
+        data = generate_market_data(num_tickers=4, years=1, seed=3).sample(frac=1.0, random_state=0)
+        profiler = Profiler()
+        result = adjust_by_ticker(data, 'backward', profiler)
+
+        pd.testing.assert_frame_equal(result, BackwardAdjusted(data).backward_adj())
+        self.assertListEqual([r.name for r in profiler.stages], ['sort', 'adjust'])
+        self.assertEqual(len(profiler.tickers), 4)
+        self.assertEqual(sum(r.rows for r in profiler.tickers), len(data))
+
+
+class TestOutputPipeline(unittest.TestCase):
+    """Test writing adjusted blocks to the savers as they are computed"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data = generate_market_data(num_tickers=6, years=1, seed=5).sample(frac=1.0, random_state=0)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_blocks_match_single_call(self):
+        """Test the blocks hold whole tickers and concatenate to the full result"""
+        blocks = list(adjusted_blocks(self.data, 'both', block_rows=300))
+
+        self.assertGreater(len(blocks), 1)
+        tickers = [set(block['ticker_symbol']) for block in blocks]
+        self.assertEqual(sum(len(t) for t in tickers), 6)
+        pd.testing.assert_frame_equal(pd.concat(blocks), CombinedAdjusted(self.data).adjust())
+
+    def test_save_batches_round_trip(self):
+        """Test CSV chunks and Parquet row groups read back as the full result"""
+        import pyarrow.parquet as pq
+        expected = ForwardAdjusted(self.data).forward_adj().reset_index(drop=True)
+
+        for name in ['out.csv', 'out.parquet', 'out.jsonl']:
+            path = os.path.join(self.temp_dir, name)
+            saver = BaseSaver.get_saver_for_file(path)
+            rows = write_pipelined(adjusted_blocks(self.data, 'forward', block_rows=1), saver)
+            result = BaseLoader.get_loader_for_file(path, columns=list(expected.columns)).load_data()
+
+            self.assertEqual(rows, len(self.data))
+            pd.testing.assert_frame_equal(result[expected.columns], expected,
+                                          check_dtype=False, check_categorical=False)
+        self.assertEqual(pq.ParquetFile(os.path.join(self.temp_dir, 'out.parquet')).num_row_groups, 6)
+
+    def test_preview_keeps_head_and_tail(self):
+        """Test the preview prints the first and last rows and the total count"""
+        preview = ResultPreview(rows=2)
+        for block in adjusted_blocks(self.data, 'forward', block_rows=1):
+            preview.add(block)
+        text = str(preview)
+
+        self.assertEqual(len(preview.head) + len(preview.tail), 4)
+        self.assertIn('...', text)
+        self.assertIn(f'[{len(self.data)} rows x 6 columns]', text)
+
+    def test_blocks_raise_no_warnings(self):
+        """Test adjusting unsorted blocks in place warns about nothing (e.g. SettingWithCopyWarning)"""
+        import warnings
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            for mode in ['forward', 'backward', 'both']:
+                list(adjusted_blocks(self.data, mode, block_rows=300))
+                list(adjusted_blocks(self.data, mode, profiler=Profiler()))
+            write_pipelined(adjusted_blocks(self.data, 'both', block_rows=300),
+                            BaseSaver.get_saver_for_file(os.path.join(self.temp_dir, 'out.csv')))
+
 
 class TestCalculatorMain(unittest.TestCase):
     """Test the main calculator functionality"""
@@ -284,11 +1410,80 @@ class TestCalculatorMain(unittest.TestCase):
             self.assertIn('forward_adj_close', result.columns)
             self.assertEqual(len(result), 4)
             
+            # saved results are only printed with --print
+            self.assertNotIn('Results:', sys.stdout.getvalue())
+            
         except SystemExit as e:
             self.fail(f"Calculator exited with error: {e}")
         finally:
             sys.stdout = old_stdout
     
+    def test_calculator_input_cache(self):
+        """Test --cache-dir keeps the parsed input and --no-cache bypasses it"""
+        cache_dir = os.path.join(self.temp_dir, "cache")
+        output_file = os.path.join(self.temp_dir, "cached.csv")
+        argv = ['calculator.py', '--input', self.csv_file, '--output', output_file, '--cache-dir', cache_dir]
+
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            with patch('sys.argv', argv + ['--no-cache']):
+                calculator.main()
+            self.assertFalse(os.path.exists(cache_dir))
+            expected = pd.read_csv(output_file)
+
+            for _ in range(2):
+                with patch('sys.argv', argv):
+                    calculator.main()
+                self.assertEqual(len(os.listdir(cache_dir)), 1)
+                pd.testing.assert_frame_equal(pd.read_csv(output_file), expected)
+        finally:
+            sys.stdout = old_stdout
+
+    def test_calculator_external_sort(self):
+        """Test --sort-memory-mb gives the same results as the in-memory sort"""
+        date_major = os.path.join(self.temp_dir, "date_major.csv")
+        data = generate_market_data(num_tickers=5, years=1, seed=4)
+        data.sort_values(['datetime', 'ticker_symbol']).to_csv(date_major, index=False)
+        argv = ['calculator.py', '--input', date_major, '--mode', 'both']
+
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            for name, options in [('in_memory.csv', []), ('external.csv', ['--sort-memory-mb', '1'])]:
+                with patch('sys.argv', argv + ['--output', os.path.join(self.temp_dir, name)] + options):
+                    calculator.main()
+        finally:
+            sys.stdout = old_stdout
+
+        expected = pd.read_csv(os.path.join(self.temp_dir, 'in_memory.csv'))
+        pd.testing.assert_frame_equal(pd.read_csv(os.path.join(self.temp_dir, 'external.csv')), expected)
+
+    @patch('sys.argv')
+    def test_calculator_append_mode(self, mock_argv):
+        """Test that --append extends an existing output file in place"""
+        existing_file = os.path.join(self.temp_dir, "existing.csv")
+        new_file = os.path.join(self.temp_dir, "new_rows.csv")
+        data = pd.read_csv(self.csv_file)
+        ForwardAdjusted(data.iloc[:3]).forward_adj().to_csv(existing_file, index=False)
+        data.iloc[3:].to_csv(new_file, index=False)
+
+        mock_argv.__getitem__.side_effect = lambda i: [
+            'calculator.py', '--input', new_file, '--append', existing_file, '--mode', 'forward'
+        ][i]
+        mock_argv.__len__.return_value = 7
+
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            calculator.main()
+        finally:
+            sys.stdout = old_stdout
+
+        result = pd.read_csv(existing_file)
+        expected = ForwardAdjusted(data).forward_adj()
+        self.assertListEqual(result['forward_adj_close'].tolist(), expected['forward_adj_close'].tolist())
+
     @patch('sys.argv')
     def test_calculator_with_nonexistent_file(self, mock_argv):
         """Test calculator with non-existent input file"""
@@ -302,6 +1497,25 @@ class TestCalculatorMain(unittest.TestCase):
         
         self.assertEqual(context.exception.code, 1)
     
+    def test_calculator_with_unreadable_input(self):
+        """Test an input the loader cannot read exits with an error instead of crashing"""
+        unreadable = os.path.join(self.temp_dir, "unreadable.csv")
+        with open(unreadable, 'w') as f:
+            f.write("a,b\n1,2\n")
+
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            with patch('sys.argv', ['calculator.py', '--input', unreadable]):
+                with self.assertRaises(SystemExit) as context:
+                    calculator.main()
+            output = sys.stdout.getvalue()
+        finally:
+            sys.stdout = old_stdout
+
+        self.assertEqual(context.exception.code, 1)
+        self.assertIn('Error: could not load data', output)
+
     @patch('sys.argv')
     def test_calculator_with_unsupported_format(self, mock_argv):
         """Test calculator with unsupported file format"""
@@ -319,6 +1533,37 @@ class TestCalculatorMain(unittest.TestCase):
         
         self.assertEqual(context.exception.code, 1)
 
+    @patch('sys.argv')
+    def test_calculator_manifest_mode(self, mock_argv):
+        """Test --manifest processes every listed file and reports failures per file"""
+        manifest = os.path.join(self.temp_dir, "manifest.csv")
+        with open(manifest, 'w') as f:
+            f.write("input,output,mode\n")
+            f.write("test_data.csv,out_backward.parquet,backward\n")
+            f.write("test_data.parquet,out_both.csv,both\n")
+            f.write("missing.csv,out_missing.csv,\n")
+
+        mock_argv.__getitem__.side_effect = lambda i: ['calculator.py', '--manifest', manifest][i]
+        mock_argv.__len__.return_value = 3
+
+        old_stdout = sys.stdout
+        sys.stdout = StringIO()
+        try:
+            with self.assertRaises(SystemExit) as context:
+                calculator.main()
+            output = sys.stdout.getvalue()
+        finally:
+            sys.stdout = old_stdout
+
+        self.assertEqual(context.exception.code, 1)
+        self.assertIn("1 of 3 files failed", output)
+        backward = pd.read_parquet(os.path.join(self.temp_dir, "out_backward.parquet"))
+        self.assertIn('backward_adj_close', backward.columns)
+        both = pd.read_csv(os.path.join(self.temp_dir, "out_both.csv"))
+        self.assertIn('forward_adj_close', both.columns)
+        self.assertIn('backward_adj_close', both.columns)
+        self.assertFalse(os.path.exists(os.path.join(self.temp_dir, "out_missing.csv")))
+
 
 class TestIntegration(unittest.TestCase):
     """Integration tests using real data"""
@@ -348,6 +1593,33 @@ class TestIntegration(unittest.TestCase):
         else:
             self.skipTest("data.parquet file not found")
 
+    def test_forward_engines_agree_on_actual_data(self):
+        """Test the vectorized forward engine matches the loop within tolerance"""
+        data_file = os.path.join(os.path.dirname(__file__), 'data', 'data.parquet')
+        if not os.path.exists(data_file):
+            self.skipTest("data.parquet file not found")
+
+        data = ParquetLoader(data_file).load_data()
+        loop = ForwardAdjusted(data, engine='loop').forward_adj()
+        vectorized = ForwardAdjusted(data).forward_adj()
+
+        self.assertListEqual(list(loop.index), list(vectorized.index))
+        diff = (loop['forward_adj_close'] - vectorized['forward_adj_close']).abs()
+        self.assertLessEqual(diff.max(), ForwardAdjusted.TOLERANCE + 1e-9)
+
+    def test_backward_engines_agree_on_actual_data(self):
+        """Test the sparse backward engine reproduces the loop exactly"""
+        data_file = os.path.join(os.path.dirname(__file__), 'data', 'data.parquet')
+        if not os.path.exists(data_file):
+            self.skipTest("data.parquet file not found")
+
+        data = ParquetLoader(data_file).load_data()
+        loop = BackwardAdjusted(data, engine='loop').backward_adj()
+        sparse = BackwardAdjusted(data).backward_adj()
+
+        self.assertListEqual(list(loop.index), list(sparse.index))
+        self.assertListEqual(loop['backward_adj_close'].tolist(), sparse['backward_adj_close'].tolist())
+
 
 if __name__ == '__main__':
     # Create a test suite